@@ -0,0 +1,70 @@
+# Komponen bersama untuk script Pull-system.
+
+# Paling awal: titik nol pengukuran waktu startup (lihat gacha/startup.py)
+from .startup import mark as _mark_startup, startup_report
+
+from .analytics import cycle_summary, eta, fast_phase_moments, measure_pulls_per_sec, slow_phase_success
+from .archive import JackpotArchive
+from .buffer import DistanceBuffer
+from .checkpoint import Checkpointer, load_state, map_distances
+from .config import DEFAULT_CONFIG, PROFILE_DIR, list_profiles, load_profile
+from .engines import ENGINES, PullEngine, make_engine, select_engine
+from .legacy import LegacyLogIndex
+from .logger import RunLogger
+from .metrics import Metrics
+from .mle import GeometricMLE
+from .pool import PersistentPool, worker_flags
+from .rare import predict_tail_probabilities, tail_probability_is, tail_probability_mc
+from .render import RENDER_MODES, Renderer
+from .rng import BIT_GENERATORS, RNGBackend, make_generator
+from .shm import ShmRingBuffer
+from .simulator import PREDICTION_LEVELS, GachaSimulator, predict_next_jackpot_mle
+from .stats import JackpotStats
+from .sweep import expand_grid, load_results, load_sweep_spec, run_sweep
+
+_mark_startup("import")
+
+__all__ = [
+    "BIT_GENERATORS",
+    "Checkpointer",
+    "DEFAULT_CONFIG",
+    "DistanceBuffer",
+    "ENGINES",
+    "GachaSimulator",
+    "GeometricMLE",
+    "JackpotArchive",
+    "JackpotStats",
+    "LegacyLogIndex",
+    "Metrics",
+    "PREDICTION_LEVELS",
+    "PROFILE_DIR",
+    "PersistentPool",
+    "PullEngine",
+    "RENDER_MODES",
+    "Renderer",
+    "RNGBackend",
+    "RunLogger",
+    "ShmRingBuffer",
+    "cycle_summary",
+    "eta",
+    "expand_grid",
+    "fast_phase_moments",
+    "list_profiles",
+    "load_state",
+    "load_profile",
+    "load_results",
+    "load_sweep_spec",
+    "make_engine",
+    "make_generator",
+    "map_distances",
+    "measure_pulls_per_sec",
+    "predict_tail_probabilities",
+    "predict_next_jackpot_mle",
+    "run_sweep",
+    "select_engine",
+    "slow_phase_success",
+    "startup_report",
+    "tail_probability_is",
+    "tail_probability_mc",
+    "worker_flags",
+]
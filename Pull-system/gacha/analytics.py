@@ -0,0 +1,160 @@
+# Kalkulator analitik untuk automatic pull (tanpa simulasi).
+#
+# Model: jarak jackpot D ~ Geometric(p) di {1, 2, ...}, threshold T = target - 10.
+#   Fase cepat  : pull sampai ada jackpot dengan jarak D >= T.
+#                 S = F_1 + ... + F_N + D_akhir
+#                 N       ~ Geometric0(q), q = P(D >= T) = (1 - p)^(T - 1)
+#                 F_j     ~ D | D < T        (geometric terpotong di T - 1)
+#                 D_akhir ~ (T - 1) + Geometric(p)   (memoryless)
+#   Fase lambat : batch batch_size_slow sampai streak >= p100_pred - 10,
+#                 sukses jika tidak ada jackpot dalam L = k * batch pull.
+#   Siklus diulang sampai fase lambat sukses (banyak siklus ~ Geometric).
+# Semua fungsi hanya memakai math (tanpa numpy), jadi biayanya mikrodetik.
+
+import math
+import time
+
+
+def threshold(target: int) -> int:
+    """Jarak minimum yang mengakhiri fase cepat (sama dengan simulator)."""
+    return target - 10
+
+
+def p100_for(p: float, confidence: float) -> int:
+    """Pull minimum agar P(jackpot dalam n pull) >= confidence (seperti GeometricMLE)."""
+    return math.ceil(math.log(1 - confidence) / math.log1p(-p))
+
+
+def _truncated_moments(p: float, m: int) -> tuple[float, float, float]:
+    """(q, mean, var) untuk D | D <= m, dengan q = P(D > m)."""
+    log_r = math.log1p(-p)
+    q = math.exp(m * log_r)
+    c = -math.expm1(m * log_r)                 # 1 - q
+    mean = 1.0 / p - m * q / c
+    var = (1.0 - p) / p ** 2 - m * m * q / c ** 2
+    return q, mean, max(var, 0.0)
+
+
+def fast_phase_moments(p: float, target: int) -> dict:
+    """
+    Mean, varians dan std banyak pull fase cepat S, plus:
+      q               peluang satu jarak jackpot >= T
+      jackpots_mean   rata-rata jackpot yang tercatat di fase cepat (N + 1)
+    """
+    m = threshold(target) - 1
+    if m <= 0:
+        mean_final = 1.0 / p
+        return {"mean": mean_final, "var": (1 - p) / p ** 2, "std": math.sqrt(1 - p) / p,
+                "q": 1.0, "jackpots_mean": 1.0}
+    q, f_mean, f_var = _truncated_moments(p, m)
+    n_mean = (1 - q) / q
+    n_var = (1 - q) / q ** 2
+    final_mean = m + 1.0 / p
+    final_var = (1 - p) / p ** 2
+    mean = n_mean * f_mean + final_mean
+    var = n_mean * f_var + n_var * f_mean ** 2 + final_var
+    return {"mean": mean, "var": var, "std": math.sqrt(var), "q": q, "jackpots_mean": n_mean + 1}
+
+
+def fast_phase_quantile(p: float, target: int, level: float) -> int:
+    """
+    Quantile banyak pull fase cepat.
+
+    Bagian gagal (compound geometric) = 0 dengan peluang q, selain itu
+    ≈ Exponential(mean E[F] / q) — pendekatan Rényi, akurat saat q kecil
+    (kasus fase cepat yang lama). Ditambah rata-rata D_akhir.
+    """
+    m = threshold(target) - 1
+    if m <= 0:
+        return math.ceil(math.log1p(-level) / math.log1p(-p))
+    q, f_mean, _ = _truncated_moments(p, m)
+    fail = 0.0 if level <= q else (f_mean / q) * math.log((1 - q) / (1 - level))
+    return math.ceil(fail + m + 1.0 / p)
+
+
+def slow_phase_pulls(p100_pred: int, batch_slow: int) -> int:
+    """L: pull tanpa jackpot yang dibutuhkan fase lambat untuk sukses."""
+    need = max(p100_pred - 10, 0)
+    return math.ceil(need / batch_slow) * batch_slow
+
+
+def slow_phase_success(p: float, p100_pred: int, batch_slow: int) -> float:
+    """Peluang persis fase lambat mencapai p100_pred tanpa jackpot: (1 - p)^L."""
+    return math.exp(slow_phase_pulls(p100_pred, batch_slow) * math.log1p(-p))
+
+
+def cycle_summary(p: float, target: int, batch_slow: int, confidence: float | None = None,
+                  p100_pred: int | None = None) -> dict:
+    """
+    Ringkasan satu run_auto_simulation: fase cepat, peluang sukses fase lambat,
+    rata-rata banyak siklus / retry, dan rata-rata total pull sampai sukses.
+    p100_pred default = p100 dari p sebenarnya (confidence).
+    """
+    if p100_pred is None:
+        if confidence is None:
+            raise ValueError("butuh confidence atau p100_pred")
+        p100_pred = p100_for(p, confidence)
+    fast = fast_phase_moments(p, target)
+    L = slow_phase_pulls(p100_pred, batch_slow)
+    success = math.exp(L * math.log1p(-p))
+    # E[pull fase lambat per siklus] = E[min(D, L)] = (1 - (1 - p)^L) / p
+    slow_mean = -math.expm1(L * math.log1p(-p)) / p
+    cycles = 1.0 / success if success > 0 else math.inf
+    return {
+        "p100_pred":       p100_pred,
+        "fast":            fast,
+        "slow_pulls":      L,
+        "slow_success":    success,
+        "slow_pulls_mean": slow_mean,
+        "cycles_mean":     cycles,
+        "retries_mean":    cycles - 1,
+        "total_pulls_mean": cycles * (fast["mean"] + slow_mean),
+    }
+
+
+def eta(config: dict, pulls_per_sec: float, levels=(0.5, 0.9, 0.99)) -> dict:
+    """
+    Estimasi waktu dari CONFIG + pulls/sec yang diukur:
+    fase cepat (mean + quantile) dan total sampai fase lambat sukses.
+    """
+    p, target = config["probability"], config["min_percobaan"]
+    summary = cycle_summary(p, target, config["batch_size_slow"], config["confidence_target"])
+    summary["pulls_per_sec"] = pulls_per_sec
+    summary["fast_seconds_mean"] = summary["fast"]["mean"] / pulls_per_sec
+    summary["fast_seconds_quantiles"] = {
+        level: fast_phase_quantile(p, target, level) / pulls_per_sec for level in levels
+    }
+    summary["total_seconds_mean"] = summary["total_pulls_mean"] / pulls_per_sec
+    return summary
+
+
+def measure_pulls_per_sec(config: dict, duration: float = 0.5, warmup: bool = False,
+                          target: int | None = None) -> float:
+    """
+    Ukur pulls/sec engine fase cepat config ini (pull_method "NO") dengan
+    menjalankan fase cepat berulang selama ± duration detik. Target default
+    dibuat pendek (≈ 3 / p) supaya setiap ulangan selesai cepat.
+    warmup=True: satu run pertama (compile JIT, start worker) tidak diukur.
+    """
+    from .engines import select_engine          # import lokal: modul ini tetap ringan
+    from .simulator import GachaSimulator
+
+    p = config["probability"]
+    if target is None:
+        target = min(config["min_percobaan"], math.ceil(3 / p) + 10)
+    trial = dict(config, min_percobaan=target, render_mode="silent", log_file=None,
+                 archive_dir=None, checkpoint_dir=None, pull_method="NO")
+    if trial.get("fast_engine") == "auto":
+        trial["fast_engine"] = select_engine(config)
+    with GachaSimulator(trial) as sim:
+        if warmup:
+            sim._automatic_pull_fast_phase()
+        sim.total_pulls = 0
+        start = time.perf_counter()
+        while True:
+            sim.jarak_jackpot = 0
+            sim.total_jackpot_terakhir = 0
+            sim._automatic_pull_fast_phase()
+            elapsed = time.perf_counter() - start
+            if elapsed >= duration:
+                return sim.total_pulls / elapsed
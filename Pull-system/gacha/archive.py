@@ -0,0 +1,187 @@
+# Arsip kolumnar jarak jackpot lintas run.
+#
+# Isi folder arsip:
+#   distances.u32   semua jarak jackpot (uint32 little endian), append-only,
+#                   dibaca lewat np.memmap
+#   runs.jsonl      index: satu record per siklus run (profile, seed,
+#                   timestamp, offset & count di distances.u32, total, max)
+#
+# Data di-append dulu (fsync), baru record index-nya; record index adalah
+# commit point. Byte setelah run terakhir di index (sisa crash) dipotong
+# saat arsip dibuka. Query berjalan per chunk memmap, jadi memori tetap
+# kecil walaupun arsip berisi miliaran jarak.
+
+import heapq
+import json
+import os
+import threading
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:          # Windows: cukup lock antar thread
+    fcntl = None
+
+
+DATA_FILE  = "distances.u32"
+INDEX_FILE = "runs.jsonl"
+DTYPE      = np.dtype("<u4")
+
+# Satu lock per folder arsip untuk thread di proses yang sama
+_LOCKS = {}
+_LOCKS_GUARD = threading.Lock()
+
+
+def _dir_lock(directory: str) -> threading.Lock:
+    with _LOCKS_GUARD:
+        return _LOCKS.setdefault(os.path.abspath(directory), threading.Lock())
+
+
+class JackpotArchive:
+    """
+    Arsip jarak jackpot append-only + index run.
+
+    Penulisan aman untuk beberapa thread (lock per folder) dan beberapa
+    proses di POSIX (flock pada file index).
+    """
+
+    def __init__(self, directory: str, chunk_size: int = 1 << 24):
+        self.directory  = directory
+        self.chunk_size = chunk_size
+        self.data_path  = os.path.join(directory, DATA_FILE)
+        self.index_path = os.path.join(directory, INDEX_FILE)
+        self._lock      = _dir_lock(directory)
+        os.makedirs(directory, exist_ok=True)
+        for path in (self.data_path, self.index_path):
+            if not os.path.exists(path):
+                open(path, "ab").close()
+
+    # ── Tulis ──
+
+    def append_run(self, distances, **meta) -> dict:
+        """
+        Tambah satu run: jarak jackpot + metadata (profile, seed, started, ...).
+        Returns record index yang ditulis.
+        """
+        distances = np.asarray(distances)
+        with self._lock, open(self.index_path, "a+", encoding="utf-8") as index:
+            if fcntl is not None:
+                fcntl.flock(index.fileno(), fcntl.LOCK_EX)
+            try:
+                end = self._end_offset()
+                with open(self.data_path, "r+b") as f:
+                    f.truncate(end * DTYPE.itemsize)     # buang sisa tulisan yang tidak ter-commit
+                    f.seek(end * DTYPE.itemsize)
+                    distances.astype(DTYPE, copy=False).tofile(f)
+                    f.flush()
+                    os.fsync(f.fileno())
+
+                record = dict(meta)
+                record.update({
+                    "offset": end,
+                    "count":  int(distances.size),
+                    "total":  int(distances.sum(dtype=np.int64)) if distances.size else 0,
+                    "max":    int(distances.max()) if distances.size else 0,
+                })
+                index.write(json.dumps(record, ensure_ascii=False, default=int) + "\n")
+                index.flush()
+                os.fsync(index.fileno())
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(index.fileno(), fcntl.LOCK_UN)
+        return record
+
+    def _end_offset(self) -> int:
+        runs = self.runs()
+        return max((r["offset"] + r["count"] for r in runs), default=0)
+
+    # ── Baca ──
+
+    def runs(self, profile: str | None = None) -> list[dict]:
+        """Record index (opsional filter profile)."""
+        with open(self.index_path, encoding="utf-8") as f:
+            runs = [json.loads(line) for line in f if line.strip()]
+        if profile is not None:
+            runs = [r for r in runs if r.get("profile") == profile]
+        return runs
+
+    def data(self) -> np.ndarray:
+        """Semua jarak sebagai np.memmap read-only (tanpa membaca file)."""
+        n = self._end_offset()
+        if n == 0:
+            return np.empty(0, dtype=DTYPE)
+        return np.memmap(self.data_path, dtype=DTYPE, mode="r", shape=(n,))
+
+    def run_distances(self, record: dict) -> np.ndarray:
+        """Jarak satu run (view memmap)."""
+        return self.data()[record["offset"]:record["offset"] + record["count"]]
+
+    def _chunks(self, runs):
+        """Iterasi (record, chunk memmap) untuk semua run, per chunk_size."""
+        data = self.data()
+        for r in runs:
+            start, stop = r["offset"], r["offset"] + r["count"]
+            for lo in range(start, stop, self.chunk_size):
+                yield r, data[lo:min(lo + self.chunk_size, stop)]
+
+    # ── Query ──
+
+    def summary(self, profile: str | None = None) -> dict:
+        """Jumlah run / jarak, total pull dan p_hat gabungan — dari index saja."""
+        runs = self.runs(profile)
+        count = sum(r["count"] for r in runs)
+        total = sum(r["total"] for r in runs)
+        return {
+            "runs":      len(runs),
+            "distances": count,
+            "total":     total,
+            "p_hat":     count / total if total else 0.0,
+            "max":       max((r["max"] for r in runs), default=0),
+        }
+
+    def pooled_p_hat(self, profile: str | None = None) -> float:
+        """MLE geometric gabungan semua run = Σcount / Σtotal."""
+        return self.summary(profile)["p_hat"]
+
+    def histogram(self, profile: str | None = None, bin_width: int = 1) -> np.ndarray:
+        """hist[i] = banyak jarak di [i*bin_width, (i+1)*bin_width)."""
+        runs = self.runs(profile)
+        n_bins = max((r["max"] for r in runs), default=0) // bin_width + 1
+        hist = np.zeros(n_bins, dtype=np.int64)
+        for _, chunk in self._chunks(runs):
+            hist += np.bincount(chunk // bin_width, minlength=n_bins)
+        return hist
+
+    def histograms_by_profile(self, bin_width: int = 1) -> dict[str, np.ndarray]:
+        profiles = sorted({r.get("profile") for r in self.runs()}, key=str)
+        return {p: self.histogram(p, bin_width) for p in profiles}
+
+    def quantiles(self, qs, profile: str | None = None) -> list[int]:
+        """Quantile tepat (bin_width=1) dari histogram gabungan."""
+        hist = self.histogram(profile)
+        total = hist.sum()
+        if total == 0:
+            return [0 for _ in qs]
+        cum = np.cumsum(hist)
+        return [int(np.searchsorted(cum, q * total)) for q in qs]
+
+    def top_k(self, k: int = 10, profile: str | None = None) -> list[tuple[int, dict]]:
+        """k jarak terpanjang (drought) beserta record run-nya, urut menurun."""
+        runs = [r for r in self.runs(profile) if r["count"]]
+        # Run yang max-nya tidak bisa masuk top-k tidak perlu dibaca
+        runs.sort(key=lambda r: r["max"], reverse=True)
+        heap = []          # min-heap (jarak, urutan, record)
+        seq = 0
+        for r in runs:
+            if len(heap) == k and r["max"] <= heap[0][0]:
+                break
+            for _, chunk in self._chunks([r]):
+                n = min(k, chunk.size)
+                for x in np.partition(chunk, chunk.size - n)[chunk.size - n:].tolist():
+                    seq += 1
+                    if len(heap) < k:
+                        heapq.heappush(heap, (x, seq, r))
+                    elif x > heap[0][0]:
+                        heapq.heapreplace(heap, (x, seq, r))
+        return [(x, r) for x, _, r in sorted(heap, key=lambda t: -t[0])]
@@ -0,0 +1,345 @@
+# Benchmark throughput & latency Pull-system.
+#
+#   python -m gacha bench --quick --out bench.json        ukur, simpan JSON
+#   python -m gacha bench --baseline bench/baseline.json  bandingkan (exit 1 jika regresi)
+#   python -m gacha bench --save-baseline bench/baseline.json
+#
+# Case yang diukur:
+#   do_pull             _do_pull per batch size
+#   fast_phase          satu fase cepat per engine (gacha.engines)
+#   numba_kernel        simulate_batches_numba: compile, load cache disk, warm
+#   automatic_pull_mp   satu job MP untuk 1..N core (pool sudah hangat)
+#   predict_mle         predict_next_jackpot_mle dari 10^3..10^7 jarak
+#   phase_stats         _print_phase_stats dengan 10^3..10^7 jackpot
+#   startup             proses baru: import gacha, import gacha.cli, `python -m gacha profiles`
+#
+# Setiap case dijalankan sekali untuk pemanasan, lalu `repeat` kali; yang
+# dicatat median & min detik per ulangan (+ pulls/sec jika relevan).
+# Perbandingan baseline memakai median; baseline dari mesin lain (lihat
+# engines.machine_key) tetap dibandingkan tapi diberi peringatan.
+
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+import numpy as np
+import multiprocessing as mp
+
+from .config import DEFAULT_CONFIG
+from .engines import available_engines, calibration_target, machine_key
+from .kernels import NUMBA_AVAILABLE
+from .mle import GeometricMLE
+from .simulator import GachaSimulator, predict_next_jackpot_mle
+
+
+BENCH_VERSION = 1
+
+# Override untuk semua case: headless, tanpa file, seed tetap
+BENCH_OVERRIDES = {
+    "render_mode": "silent", "log_file": None, "archive_dir": None, "checkpoint_dir": None,
+    "engine_cache": None, "rng_seed": 0,
+}
+
+DO_PULL_BATCHES = (1, 10, 300, 600, 6000)
+SIZES_FULL      = (10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6, 10 ** 7)
+SIZES_QUICK     = (10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6)
+
+
+def machine_info() -> dict:
+    info = {
+        "key":       machine_key(),
+        "platform":  platform.platform(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+        "python":    platform.python_version(),
+        "numpy":     np.__version__,
+        "numba":     None,
+    }
+    if NUMBA_AVAILABLE:
+        from importlib import metadata
+        info["numba"] = metadata.version("numba")
+    return info
+
+
+def _measure(fn, repeat: int, warmup: int = 1) -> list[float]:
+    """Detik per panggilan fn() untuk `repeat` ulangan (setelah pemanasan)."""
+    for _ in range(warmup):
+        fn()
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def _result(name: str, params: dict, times: list[float], pulls: int | None = None) -> dict:
+    result = {
+        "name":    name,
+        "params":  params,
+        "median":  float(np.median(times)),
+        "min":     float(min(times)),
+        "repeat":  len(times),
+    }
+    if pulls is not None:
+        result["pulls_per_sec"] = pulls / sum(times) if sum(times) > 0 else 0.0
+    return result
+
+
+# ╔══════════════════════════════════════════════════════════════════════════════╗
+# ║                                   CASE                                     ║
+# ╚══════════════════════════════════════════════════════════════════════════════╝
+
+def bench_do_pull(config: dict, quick: bool) -> list[dict]:
+    """_do_pull(batch) berulang; satu ulangan = ± budget pull."""
+    budget = 2_000_000 if quick else 20_000_000
+    results = []
+    for batch in DO_PULL_BATCHES:
+        calls = min(100_000, max(1_000, budget // batch))
+        with GachaSimulator(config) as sim:
+            def run():
+                for _ in range(calls):
+                    sim._do_pull(batch)
+            before = sim.total_pulls
+            times = _measure(run, 3)
+            pulls = (sim.total_pulls - before) * 3 // 4      # tanpa ulangan pemanasan
+        results.append(_result("do_pull", {"batch": batch, "calls": calls}, times, pulls))
+    return results
+
+
+def bench_fast_phase(config: dict, quick: bool) -> list[dict]:
+    """Satu fase cepat per engine, target ± 2k (quick) / 20k jackpot."""
+    target = calibration_target(config["probability"], 2_000 if quick else 20_000)
+    results = []
+    for engine in available_engines():
+        pulls = []
+        with GachaSimulator(dict(config, fast_engine=engine, min_percobaan=target)) as sim:
+            def run():
+                sim._reset_state()
+                sim._automatic_pull_fast_phase()
+                pulls.append(sim.total_pulls)
+            times = _measure(run, 3 if quick else 5)
+        results.append(_result("fast_phase", {"engine": engine, "target": target}, times, sum(pulls[1:])))
+    return results
+
+
+_NUMBA_SNIPPET = """
+import json, time
+t0 = time.perf_counter()
+from gacha.jit import simulate_batches_numba
+t1 = time.perf_counter()
+simulate_batches_numba(0.001, 600, 3000, 0, 1)
+t2 = time.perf_counter()
+simulate_batches_numba(0.001, 600, 3000, 0, 2)
+t3 = time.perf_counter()
+print(json.dumps({"import": t1 - t0, "first_call": t2 - t1, "warm_call": t3 - t2}))
+"""
+
+
+def bench_numba_kernel(config: dict, quick: bool) -> list[dict]:
+    """
+    simulate_batches_numba di proses baru: "compile" (cache disk kosong),
+    "disk_cache" (cache dari run sebelumnya) dan "warm" (panggilan kedua).
+    """
+    if not NUMBA_AVAILABLE:
+        return []
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+    def child(env: dict) -> dict:
+        out = subprocess.run([sys.executable, "-c", _NUMBA_SNIPPET], cwd=root, env=env,
+                             capture_output=True, text=True, check=True)
+        return json.loads(out.stdout.strip().splitlines()[-1])
+
+    repeat = 1 if quick else 3
+    child(dict(os.environ))                 # isi cache disk default (mis. setelah jit.py berubah)
+    compile_runs, cached_runs = [], []
+    for _ in range(repeat):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            compile_runs.append(child(dict(os.environ, NUMBA_CACHE_DIR=cache_dir)))
+        cached_runs.append(child(dict(os.environ)))
+    return [
+        _result("numba_kernel", {"state": "import"}, [r["import"] for r in cached_runs]),
+        _result("numba_kernel", {"state": "compile"}, [r["first_call"] for r in compile_runs]),
+        _result("numba_kernel", {"state": "disk_cache"}, [r["first_call"] for r in cached_runs]),
+        _result("numba_kernel", {"state": "warm"}, [r["warm_call"] for r in cached_runs]),
+    ]
+
+
+def bench_automatic_pull_mp(config: dict, quick: bool) -> list[dict]:
+    """Satu job automatic_pull_mp per jumlah core (start pool dicatat terpisah)."""
+    max_cores = mp.cpu_count()
+    cores_list = sorted({1, max_cores}) if quick else range(1, max_cores + 1)
+    # p lebih besar supaya satu job selesai dalam ± 1 detik
+    mp_config = dict(config, pull_method="MP", probability=0.002, mp_timeout=30)
+    results = []
+    for cores in cores_list:
+        pulls = []
+        with GachaSimulator(mp_config) as sim:
+            def run():
+                sim._reset_state()
+                sim.automatic_pull_mp(workers=cores)
+                pulls.append(sim.total_pulls)
+            start = time.perf_counter()
+            run()                                       # start pool + job pertama
+            cold = time.perf_counter() - start
+            times = _measure(run, 2 if quick else 5, warmup=0)
+        results.append(_result("automatic_pull_mp", {"cores": cores, "state": "cold"}, [cold], pulls[0]))
+        results.append(_result("automatic_pull_mp", {"cores": cores, "state": "warm"}, times, sum(pulls[1:])))
+    return results
+
+
+def bench_predict_mle(config: dict, quick: bool) -> list[dict]:
+    """predict_next_jackpot_mle dari array jarak (O(n)) dan dari GeometricMLE (O(1))."""
+    rng = np.random.default_rng(0)
+    results = []
+    for n in SIZES_QUICK if quick else SIZES_FULL:
+        distances = rng.geometric(config["probability"], size=n)
+        mle = GeometricMLE.from_distances(distances)
+        repeat = 3 if n >= 10 ** 6 else 20
+        times = _measure(lambda: predict_next_jackpot_mle(distances, 0.999, show=False), repeat)
+        results.append(_result("predict_mle", {"source": "array", "jackpots": n}, times))
+        times = _measure(lambda: predict_next_jackpot_mle(mle, 0.999, show=False), 20)
+        results.append(_result("predict_mle", {"source": "mle", "jackpots": n}, times))
+    return results
+
+
+def bench_phase_stats(config: dict, quick: bool) -> list[dict]:
+    """_print_phase_stats (describe / frekuensi / modus) dengan n jackpot."""
+    rng = np.random.default_rng(0)
+    results = []
+    for n in SIZES_QUICK if quick else SIZES_FULL:
+        with GachaSimulator(config) as sim:
+            distances = rng.geometric(config["probability"], size=n)
+            sim._record_jackpots(distances)
+            sim.total_jackpot = n
+            sim.total_pulls = int(distances.sum())
+            times = _measure(sim._print_phase_stats, 20)
+        results.append(_result("phase_stats", {"jackpots": n}, times))
+    return results
+
+
+_STARTUP_SNIPPET = """
+import json, time
+t0 = time.perf_counter()
+import {module}
+print(json.dumps({{"seconds": time.perf_counter() - t0}}))
+"""
+
+
+def bench_startup(config: dict, quick: bool) -> list[dict]:
+    """Waktu import di proses baru (numba harus tetap lazy) + satu perintah CLI lengkap."""
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    repeat = 3 if quick else 10
+    results = []
+    for module in ("gacha", "gacha.cli"):
+        times = []
+        for _ in range(repeat):
+            out = subprocess.run([sys.executable, "-c", _STARTUP_SNIPPET.format(module=module)],
+                                 cwd=root, capture_output=True, text=True, check=True)
+            times.append(json.loads(out.stdout.strip().splitlines()[-1])["seconds"])
+        results.append(_result("startup", {"state": f"import {module}"}, times))
+
+    def cli():
+        subprocess.run([sys.executable, "-m", "gacha", "profiles"], cwd=root,
+                       capture_output=True, check=True)
+    results.append(_result("startup", {"state": "cli profiles"}, _measure(cli, repeat)))
+    return results
+
+
+CASES = {
+    "do_pull":           bench_do_pull,
+    "fast_phase":        bench_fast_phase,
+    "numba_kernel":      bench_numba_kernel,
+    "automatic_pull_mp": bench_automatic_pull_mp,
+    "predict_mle":       bench_predict_mle,
+    "phase_stats":       bench_phase_stats,
+    "startup":           bench_startup,
+}
+
+
+# ╔══════════════════════════════════════════════════════════════════════════════╗
+# ║                            RUN & PERBANDINGAN                              ║
+# ╚══════════════════════════════════════════════════════════════════════════════╝
+
+def run_benchmarks(config: dict | None = None, quick: bool = False, only: list[str] | None = None,
+                   progress=None) -> dict:
+    """
+    Jalankan semua case (atau yang namanya ada di only) dengan config
+    (default DEFAULT_CONFIG). Returns dokumen JSON hasil.
+    """
+    config = dict(config or DEFAULT_CONFIG, **BENCH_OVERRIDES)
+    results = []
+    for name, case in CASES.items():
+        if only and name not in only:
+            continue
+        if progress:
+            progress(f"▶ {name}")
+        results.extend(case(config, quick))
+    return {
+        "version": BENCH_VERSION,
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "quick":   quick,
+        "profile": config.get("profile"),
+        "machine": machine_info(),
+        "results": results,
+    }
+
+
+def _key(result: dict) -> str:
+    return result["name"] + json.dumps(result["params"], sort_keys=True)
+
+
+def compare(current: dict, baseline: dict, tolerance: float = 0.25, min_delta: float = 1e-3) -> list[dict]:
+    """
+    Bandingkan median tiap case dengan baseline.
+    status: "regression" (lebih lambat > tolerance), "faster", "ok",
+    atau "new" (tidak ada di baseline). Selisih < min_delta detik selalu
+    "ok" (case mikrodetik terlalu berisik untuk dibandingkan per rasio).
+    """
+    base = {_key(r): r for r in baseline["results"]}
+    rows = []
+    for r in current["results"]:
+        b = base.get(_key(r))
+        row = {"name": r["name"], "params": r["params"], "median": r["median"]}
+        if b is None or b["median"] <= 0:
+            row["status"] = "new"
+        else:
+            ratio = r["median"] / b["median"]
+            row.update(baseline_median=b["median"], ratio=ratio)
+            if abs(r["median"] - b["median"]) < min_delta:
+                row["status"] = "ok"
+            elif ratio > 1 + tolerance:
+                row["status"] = "regression"
+            elif ratio < 1 / (1 + tolerance):
+                row["status"] = "faster"
+            else:
+                row["status"] = "ok"
+        rows.append(row)
+    return rows
+
+
+def format_results(doc: dict) -> str:
+    """Tabel ringkas untuk terminal."""
+    lines = []
+    for r in doc["results"]:
+        params = " ".join(f"{k}={v}" for k, v in r["params"].items())
+        rate = f"{r['pulls_per_sec']:>16,.0f} pulls/s" if "pulls_per_sec" in r else ""
+        lines.append(f"{r['name']:<18} {params:<32} {r['median'] * 1e3:>12.3f} ms {rate}")
+    return "\n".join(lines)
+
+
+def load_report(path: str) -> dict:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_report(doc: dict, path: str):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(doc, f, indent=2)
+        f.write("\n")
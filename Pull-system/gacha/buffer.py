@@ -0,0 +1,106 @@
+# Penyimpanan jarak jackpot yang ringkas: buffer numpy uint32 yang tumbuh
+# dengan doubling (≈ 4 byte per jackpot), pengganti list Python.
+
+import numpy as np
+
+
+class DistanceBuffer:
+    """
+    Container jarak jackpot bertipe uint32 dengan append amortized O(1).
+
+    view() mengembalikan view numpy (tanpa copy) atas data yang terisi,
+    jadi statistik / MLE bisa langsung memakai data tanpa konversi.
+    Jarak di luar [0, 2**32 - 1] ditolak (OverflowError), tidak di-wrap.
+    """
+
+    dtype     = np.uint32
+    max_value = int(np.iinfo(dtype).max)
+
+    def __init__(self, capacity: int = 1024):
+        self._data = np.empty(max(1, capacity), dtype=self.dtype)
+        self._size = 0
+
+    @classmethod
+    def from_array(cls, data: np.ndarray) -> "DistanceBuffer":
+        """
+        Bungkus array uint32 yang sudah ada tanpa copy (mis. np.memmap
+        mode "c" dari checkpoint). Data baru disalin ke RAM hanya saat
+        buffer perlu tumbuh.
+        """
+        if data.dtype != cls.dtype:
+            if data.size:
+                cls._check_range(int(data.min()), int(data.max()))
+            data = data.astype(cls.dtype)
+        buf = cls.__new__(cls)
+        buf._data = data if data.size else np.empty(1024, dtype=cls.dtype)
+        buf._size = int(data.size)
+        return buf
+
+    def _reserve(self, needed: int):
+        if needed <= self._data.size:
+            return
+        new_cap = self._data.size
+        while new_cap < needed:
+            new_cap *= 2
+        new_data = np.empty(new_cap, dtype=self.dtype)
+        new_data[:self._size] = self._data[:self._size]
+        self._data = new_data
+
+    @classmethod
+    def _check_range(cls, lo: int, hi: int):
+        if lo < 0 or hi > cls.max_value:
+            bad = lo if lo < 0 else hi
+            raise OverflowError(f"Jarak jackpot {bad:,} di luar rentang uint32 [0, {cls.max_value:,}]")
+
+    # ── Tambah data ──
+
+    def append(self, distance: int):
+        distance = int(distance)
+        self._check_range(distance, distance)
+        if self._size == self._data.size:
+            self._reserve(self._size + 1)
+        self._data[self._size] = distance
+        self._size += 1
+
+    def extend(self, distances):
+        distances = np.asarray(distances)
+        n = distances.size
+        if n == 0:
+            return
+        if distances.dtype != self.dtype:       # uint32 selalu dalam rentang
+            self._check_range(int(distances.min()), int(distances.max()))
+        self._reserve(self._size + n)
+        self._data[self._size:self._size + n] = distances
+        self._size += n
+
+    def clear(self):
+        self._size = 0
+
+    # ── Akses data ──
+
+    def view(self) -> np.ndarray:
+        """View numpy (read-only) atas data yang terisi, tanpa copy."""
+        out = self._data[:self._size]
+        out.flags.writeable = False
+        return out
+
+    def __array__(self, dtype=None, copy=None):
+        out = self.view()
+        return out if dtype is None else out.astype(dtype)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, idx):
+        return self.view()[idx]
+
+    def __iter__(self):
+        return iter(self.view().tolist())
+
+    @property
+    def nbytes(self) -> int:
+        """Byte yang benar-benar dipakai data (tanpa kapasitas cadangan)."""
+        return self._size * self._data.itemsize
+
+    def __repr__(self) -> str:
+        return f"DistanceBuffer(len={self._size}, capacity={self._data.size})"
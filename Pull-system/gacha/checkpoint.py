@@ -0,0 +1,217 @@
+# Checkpoint + resume state GachaSimulator.
+#
+# Isi folder checkpoint:
+#   state.json          counter, state MLE / statistik, state RNG persis,
+#                       nama file jarak + jumlah jarak yang valid
+#   distances-<G>.u32   jarak jackpot mentah (uint32, little endian), hanya
+#                       di-append; bisa langsung di-np.memmap
+#
+# Urutan tulis: append jarak baru → fsync → tulis state.json.tmp → fsync →
+# os.replace (atomic). Jika proses mati di tengah jalan, state.json lama
+# tetap valid dan byte berlebih di file jarak diabaikan (state.json
+# menyimpan jumlah jarak). Resume hanya membaca state.json dan memmap file
+# jarak, jadi waktunya tidak tergantung jumlah jackpot.
+
+import json
+import os
+import time
+
+import numpy as np
+
+from .buffer import DistanceBuffer
+from .mle import GeometricMLE
+from .rng import RNGBackend
+from .stats import JackpotStats
+
+
+CHECKPOINT_VERSION = 1
+STATE_FILE = "state.json"
+
+# Counter GachaSimulator yang disimpan apa adanya
+COUNTER_FIELDS = (
+    "total_pulls", "total_jackpot", "jarak_jackpot", "total_jackpot_terakhir",
+    "new_pull", "on_pull", "loop_terakhir", "loop_bagian_dua", "ii_terakhir",
+    "bukti", "p100_pred", "phase", "retries", "pulls_all_cycles",
+    "jackpots_all_cycles", "enable_auto_menu",
+)
+
+# Konfigurasi yang harus sama antara checkpoint dan simulator yang me-resume
+CONFIG_FIELDS = ("game_name", "prob", "target", "confidence", "pull_method")
+
+
+def _jsonable(obj):
+    """State bit generator numpy → JSON (array → list, numpy int → int)."""
+    if isinstance(obj, dict):
+        return {k: _jsonable(v) for k, v in obj.items()}
+    if isinstance(obj, np.ndarray):
+        return {"__ndarray__": obj.tolist(), "dtype": str(obj.dtype)}
+    if isinstance(obj, np.generic):
+        return obj.item()
+    return obj
+
+
+def _from_jsonable(obj):
+    if isinstance(obj, dict):
+        if "__ndarray__" in obj:
+            return np.array(obj["__ndarray__"], dtype=obj["dtype"])
+        return {k: _from_jsonable(v) for k, v in obj.items()}
+    return obj
+
+
+def _fsync_dir(directory: str):
+    if os.name != "posix":
+        return
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _atomic_write_json(path: str, data: dict):
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+    _fsync_dir(os.path.dirname(path) or ".")
+
+
+class Checkpointer:
+    """
+    Penulis checkpoint untuk satu GachaSimulator.
+
+    Jarak jackpot ditulis incremental: setiap save hanya append jarak yang
+    belum tersimpan. Saat jackpot_list diganti (retry), file jarak baru
+    dibuat dan file lama dihapus setelah state.json menunjuk file baru.
+    """
+
+    def __init__(self, directory: str, interval: float = 60.0):
+        self.directory  = directory
+        self.interval   = interval
+        self.saves      = 0
+        self._buffer    = None     # DistanceBuffer yang sedang ditulis
+        self._file      = None     # nama file jarak (relatif ke directory)
+        self._saved     = 0        # jumlah jarak yang sudah di disk
+        self._last      = time.monotonic()
+        os.makedirs(directory, exist_ok=True)
+
+    @property
+    def state_path(self) -> str:
+        return os.path.join(self.directory, STATE_FILE)
+
+    def maybe_save(self, sim):
+        """Simpan jika sudah lewat interval detik sejak save terakhir."""
+        if time.monotonic() - self._last >= self.interval:
+            self.save(sim)
+
+    def save(self, sim):
+        """Tulis checkpoint sekarang (atomic)."""
+        old_file = None
+        if sim.jackpot_list is not self._buffer:
+            old_file = self._file
+            self._buffer = sim.jackpot_list
+            self._file = f"distances-{time.time_ns()}.u32"
+            self._saved = 0
+
+        # 1. Append jarak baru, fsync
+        data = sim.jackpot_list.view()
+        path = os.path.join(self.directory, self._file)
+        with open(path, "r+b" if os.path.exists(path) else "wb") as f:
+            f.seek(self._saved * data.itemsize)
+            data[self._saved:].astype("<u4", copy=False).tofile(f)
+            f.truncate()
+            f.flush()
+            os.fsync(f.fileno())
+        self._saved = len(data)
+
+        # 2. state.json (commit point)
+        _atomic_write_json(self.state_path, self._state(sim))
+
+        # 3. File jarak generasi lama sudah tidak direferensikan
+        if old_file and old_file != self._file:
+            try:
+                os.remove(os.path.join(self.directory, old_file))
+            except FileNotFoundError:
+                pass
+
+        self.saves += 1
+        self._last = time.monotonic()
+
+    def _state(self, sim) -> dict:
+        seed_seq = sim.rng_backend.seed_seq
+        return {
+            "version":   CHECKPOINT_VERSION,
+            "saved_at":  time.time(),
+            "config":    {name: getattr(sim, name) for name in CONFIG_FIELDS},
+            "counters":  {name: _jsonable(getattr(sim, name)) for name in COUNTER_FIELDS},
+            "mle":       {"count": sim.mle.count, "total": sim.mle.total},
+            "stats":     sim.stats.to_dict(),
+            "distances": {"file": self._file, "count": self._saved, "dtype": "<u4"},
+            "rng": {
+                "bit_generator":      sim.rng_backend.bit_generator,
+                "entropy":            seed_seq.entropy,
+                "spawn_key":          list(seed_seq.spawn_key),
+                "n_children_spawned": seed_seq.n_children_spawned,
+                "state":              _jsonable(sim.rng.bit_generator.state),
+            },
+        }
+
+    def restore(self, sim) -> dict:
+        """
+        Muat checkpoint ke sim (counter, jarak via memmap, MLE, statistik,
+        state RNG) dan lanjutkan menulis ke file jarak yang sama.
+        Returns isi state.json.
+        """
+        state = load_state(self.directory)
+
+        mismatch = [k for k, v in state["config"].items() if getattr(sim, k) != v]
+        if mismatch:
+            raise ValueError(
+                f"Checkpoint {self.directory} dibuat dengan config berbeda: {', '.join(mismatch)}"
+            )
+
+        for name, value in state["counters"].items():
+            setattr(sim, name, value)
+        sim.mle = GeometricMLE()
+        sim.mle.add_summary(state["mle"]["count"], state["mle"]["total"])
+        sim.stats = JackpotStats.from_dict(state["stats"])
+        sim.jackpot_list = DistanceBuffer.from_array(map_distances(self.directory, state))
+
+        rng = state["rng"]
+        seed_seq = np.random.SeedSequence(
+            rng["entropy"], spawn_key=tuple(rng["spawn_key"]),
+            n_children_spawned=rng["n_children_spawned"],
+        )
+        sim.rng_backend = RNGBackend(rng["bit_generator"], seed_seq)
+        sim.rng_backend.generator.bit_generator.state = _from_jsonable(rng["state"])
+        sim.rng = sim.rng_backend.generator
+
+        self._buffer = sim.jackpot_list
+        self._file   = state["distances"]["file"]
+        self._saved  = state["distances"]["count"]
+        self._last   = time.monotonic()
+        return state
+
+
+def load_state(directory: str) -> dict:
+    """Baca state.json sebuah checkpoint."""
+    with open(os.path.join(directory, STATE_FILE), encoding="utf-8") as f:
+        state = json.load(f)
+    if state.get("version") != CHECKPOINT_VERSION:
+        raise ValueError(f"Versi checkpoint tidak didukung: {state.get('version')!r}")
+    return state
+
+
+def map_distances(directory: str, state: dict | None = None) -> np.ndarray:
+    """
+    Jarak jackpot checkpoint sebagai np.memmap copy-on-write (tanpa membaca
+    seluruh file). Hanya state["distances"]["count"] elemen pertama yang valid.
+    """
+    state = state or load_state(directory)
+    info = state["distances"]
+    if info["count"] == 0:
+        return np.empty(0, dtype=DistanceBuffer.dtype)
+    path = os.path.join(directory, info["file"])
+    return np.memmap(path, dtype=info["dtype"], mode="c", shape=(info["count"],))
@@ -0,0 +1,407 @@
+# Entry point command line Pull-system.
+#
+#   python -m gacha profiles                       daftar profile
+#   python -m gacha run hsr wuwa --out hasil.json  beberapa profile sekaligus (headless)
+#   python -m gacha sweep spec.json --profile hsr  parameter sweep (lihat gacha.sweep)
+#   python -m gacha interactive hsr                simulasi + menu interaktif
+#   python -m gacha archive jackpot_archive        ringkasan arsip jarak jackpot
+#   python -m gacha legacy jackpot.txt --last 20   index + query log teks lama
+#   python -m gacha tail hsr 21500 25000           P(drought >= n), importance sampling
+#   python -m gacha eta hsr --pps 2e7              estimasi pull & waktu (analitik, tanpa simulasi)
+#   python -m gacha engines hsr --calibrate        engine fase cepat + kalibrasi "auto"
+#   python -m gacha bench --baseline base.json     benchmark + bandingkan dengan baseline (lihat gacha.bench)
+#
+# "run" menjalankan semua profile di satu proses (import & compile numba
+# sekali), masing-masing di thread sendiri, dengan satu worker pool MP
+# bersama dan seed turunan dari satu root SeedSequence.
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import numpy as np
+import multiprocessing as mp
+
+from .analytics import eta, fast_phase_quantile, measure_pulls_per_sec
+from .archive import JackpotArchive
+from .bench import CASES, compare, format_results, load_report, run_benchmarks, save_report
+from .config import list_profiles, load_profile
+from .engines import ENGINES, load_calibration, select_engine
+from .legacy import LegacyLogIndex
+from .pool import PersistentPool
+from .rare import predict_tail_probabilities, samples_for_precision
+from .simulator import GachaSimulator
+from .sweep import load_sweep_spec, run_sweep
+
+
+# Override config untuk profile yang dijalankan lewat "run"
+HEADLESS_OVERRIDES = {
+    "render_mode": "silent",
+}
+
+
+def _parse_overrides(pairs: list[str] | None) -> dict:
+    """["probability=0.0008", "pull_method=MP"] → dict (nilai di-parse sebagai JSON jika bisa)."""
+    overrides = {}
+    for pair in pairs or []:
+        key, sep, value = pair.partition("=")
+        if not sep:
+            raise ValueError(f"--set butuh format key=value, bukan {pair!r}")
+        try:
+            overrides[key] = json.loads(value)
+        except json.JSONDecodeError:
+            overrides[key] = value
+    return overrides
+
+
+# ╔══════════════════════════════════════════════════════════════════════════════╗
+# ║                          RUN BANYAK PROFILE                                ║
+# ╚══════════════════════════════════════════════════════════════════════════════╝
+
+def _run_profile(config: dict, seed_seq: np.random.SeedSequence,
+                 worker_pool: PersistentPool | None) -> dict:
+    """
+    Satu profile: run_auto_simulation penuh, hasil sebagai dict JSON-able.
+    Jika config punya checkpoint_dir yang berisi checkpoint, run dilanjutkan.
+    """
+    result = {
+        "profile":   config.get("profile"),
+        "game_name": config["game_name"],
+        "seed":      {"entropy": seed_seq.entropy, "spawn_key": list(seed_seq.spawn_key)},
+    }
+    start = time.perf_counter()
+    try:
+        with GachaSimulator(dict(config, rng_seed=seed_seq), worker_pool=worker_pool) as sim:
+            resumed = sim.resume()
+            sim.run_auto_simulation()
+            result.update({
+                "status":            "ok",
+                "resumed":           resumed,
+                "bit_generator":     sim.rng_backend.bit_generator,
+                "pull_method":       sim.pull_method,
+                "pulls_to_target":   int(sim.pulls_all_cycles),
+                "total_jackpot":     int(sim.jackpots_all_cycles),
+                "retries":           sim.retries,
+                "slow_success_rate": 1.0 / (sim.retries + 1),
+                "p100_pred":         int(sim.p100_pred),
+                "p_hat":             float(sim.mle.p_hat),
+                "max_jackpot":       int(sim.stats.max),
+            })
+            if sim.metrics is not None:
+                result["metrics"] = sim.metrics_snapshot()
+    except Exception as exc:
+        result.update({"status": "error", "error": f"{type(exc).__name__}: {exc}"})
+    result["wall_time"] = time.perf_counter() - start
+    return result
+
+
+def _profile_path(path: str, profile: str) -> str:
+    """"logs/jackpot.jsonl", "hsr" → "logs/jackpot-hsr.jsonl"."""
+    root, ext = os.path.splitext(path)
+    return f"{root}-{profile}{ext}"
+
+
+def run_profiles(configs: list[dict], seed: int | None = None,
+                 workers: int | None = None, checkpoint_dir: str | None = None) -> list[dict]:
+    """
+    Jalankan beberapa config/profile bersamaan di proses ini.
+
+    Seed profile ke-i = child ke-i dari SeedSequence(seed), jadi satu root
+    seed cukup untuk mengulang semua profile. Profile dengan pull_method "MP"
+    berbagi satu PersistentPool (job MP dijalankan bergantian).
+    checkpoint_dir: checkpoint per profile di checkpoint_dir/<profile>.
+    log_file setiap profile menjadi <nama>-<profile><ext> (mis. jackpot-hsr.jsonl),
+    supaya logger yang berjalan bersamaan tidak menulis ke file yang sama.
+    Returns list hasil per profile (urutan sama dengan configs).
+    """
+    names = [c.get("profile") or f"profile-{i}" for i, c in enumerate(configs)]
+    configs = [
+        dict(c, log_file=_profile_path(c["log_file"], name)) if c.get("log_file") else c
+        for c, name in zip(configs, names)
+    ]
+    if checkpoint_dir:
+        configs = [
+            dict(c, checkpoint_dir=os.path.join(checkpoint_dir, name))
+            for c, name in zip(configs, names)
+        ]
+    root = np.random.SeedSequence(seed)
+    seeds = root.spawn(len(configs))
+
+    worker_pool = None
+    mp_configs = [c for c in configs if c["pull_method"] == "MP" or c.get("fast_engine") == "processes"]
+    if mp_configs:
+        worker_pool = PersistentPool(
+            workers or max(1, mp.cpu_count() - 1),
+            max(c.get("mp_ring_capacity", 1 << 16) for c in mp_configs),
+            mp_configs[0].get("mp_start_method"),
+        )
+
+    try:
+        with ThreadPoolExecutor(max_workers=len(configs), thread_name_prefix="gacha-profile") as ex:
+            futures = [
+                ex.submit(_run_profile, dict(config, **HEADLESS_OVERRIDES), s, worker_pool)
+                for config, s in zip(configs, seeds)
+            ]
+            return [f.result() for f in futures]
+    finally:
+        if worker_pool is not None:
+            worker_pool.close()
+
+
+def archive_report(directory: str, profile: str | None = None, top: int = 10) -> dict:
+    """Ringkasan arsip: p_hat gabungan, quantile dan drought terpanjang per profile."""
+    archive = JackpotArchive(directory)
+    profiles = [profile] if profile else sorted({r.get("profile") for r in archive.runs()}, key=str)
+    report = {}
+    for name in profiles:
+        summary = archive.summary(name)
+        q50, q90, q99 = archive.quantiles([0.5, 0.9, 0.99], name)
+        summary.update({
+            "median": q50, "p90": q90, "p99": q99,
+            "top": [{"distance": x, "run_id": r.get("run_id"), "cycle": r.get("cycle")}
+                    for x, r in archive.top_k(top, name)],
+        })
+        report[str(name)] = summary
+    return report
+
+
+# ╔══════════════════════════════════════════════════════════════════════════════╗
+# ║                          INTERAKTIF / SCRIPT                               ║
+# ╚══════════════════════════════════════════════════════════════════════════════╝
+
+def interactive(config: dict):
+    """
+    Alur lama script: simulasi otomatis lalu menu interaktif.
+    Dengan checkpoint_dir, simulasi dilanjutkan dari checkpoint jika ada.
+    """
+    with GachaSimulator(config) as sim:
+        sim.resume()
+
+        # Tulis timestamp ke log file
+        formatted_time = datetime.now().strftime("%H:%M:%S")
+        sim._log(
+            "session_start",
+            f"\n ============  Game Name : {sim.game_name} Time: {formatted_time} ============= \n"
+            f" RNG : {sim.rng_backend.describe()}\n",
+            bit_generator=sim.rng_backend.bit_generator,
+        )
+        print(f"🎲 RNG : {sim.rng_backend.describe()}")
+
+        # Jalankan simulasi otomatis
+        sim.run_auto_simulation()
+
+        # Masuk ke menu interaktif
+        sim.interactive_menu()
+
+
+def _add_sweep_args(parser):
+    parser.add_argument("--runs", type=int, default=None, help="jumlah run per titik grid")
+    parser.add_argument("--out", default="sweep_results.csv", help="file CSV hasil sweep (resume jika sudah ada)")
+    parser.add_argument("--workers", type=int, default=None, help="jumlah proses worker sweep")
+    parser.add_argument("--seed", type=int, default=None, help="root seed sweep")
+
+
+def _sweep(config: dict, args):
+    spec = load_sweep_spec(args.sweep)
+    run_sweep(
+        GachaSimulator, config, spec["points"],
+        runs_per_point=args.runs or spec.get("runs_per_point", 10),
+        out_path=args.out, workers=args.workers,
+        seed=args.seed if args.seed is not None else spec.get("seed"),
+    )
+
+
+def script_main(config: dict, argv=None):
+    """Main untuk script per game: interaktif, atau sweep headless dengan --sweep."""
+    parser = argparse.ArgumentParser(description="Simulasi gacha (interaktif / sweep headless)")
+    parser.add_argument("--sweep", metavar="SPEC_JSON",
+                        help='jalankan parameter sweep headless dari file JSON ({"grid": {...}} / {"points": [...]})')
+    parser.add_argument("--checkpoint", metavar="DIR",
+                        help="simpan checkpoint berkala ke DIR dan lanjutkan dari sana jika ada")
+    parser.add_argument("--archive", metavar="DIR", help="append jarak jackpot setiap siklus ke arsip DIR")
+    _add_sweep_args(parser)
+    args = parser.parse_args(argv)
+
+    if args.sweep:
+        _sweep(config, args)
+    else:
+        if args.checkpoint:
+            config = dict(config, checkpoint_dir=args.checkpoint)
+        if args.archive:
+            config = dict(config, archive_dir=args.archive)
+        interactive(config)
+
+
+# ╔══════════════════════════════════════════════════════════════════════════════╗
+# ║                                   MAIN                                     ║
+# ╚══════════════════════════════════════════════════════════════════════════════╝
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m gacha", description="Pull-system gacha simulator")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    sub.add_parser("profiles", help="daftar profile yang tersedia")
+
+    p_run = sub.add_parser("run", help="jalankan beberapa profile sekaligus (headless, output JSON)")
+    p_run.add_argument("profiles", nargs="+", help="nama profile (profiles/<nama>.json) atau path file")
+    p_run.add_argument("--out", default=None, help="file JSON hasil (default: stdout)")
+    p_run.add_argument("--seed", type=int, default=None, help="root seed untuk semua profile")
+    p_run.add_argument("--workers", type=int, default=None, help="jumlah proses worker pool MP bersama")
+    p_run.add_argument("--set", action="append", metavar="KEY=VALUE", help="override config untuk semua profile")
+    p_run.add_argument("--checkpoint", metavar="DIR", help="checkpoint per profile di DIR/<profile> (resume jika ada)")
+    p_run.add_argument("--archive", metavar="DIR", help="arsip jarak jackpot bersama di DIR (profile dicatat per run)")
+
+    p_sweep = sub.add_parser("sweep", help="parameter sweep headless")
+    p_sweep.add_argument("sweep", metavar="SPEC_JSON")
+    p_sweep.add_argument("--profile", default="hsr", help="profile dasar sweep")
+    _add_sweep_args(p_sweep)
+
+    p_arc = sub.add_parser("archive", help="ringkasan arsip jarak jackpot lintas run (JSON)")
+    p_arc.add_argument("directory", nargs="?", default="jackpot_archive")
+    p_arc.add_argument("--profile", default=None, help="hanya run dari profile ini")
+    p_arc.add_argument("--top", type=int, default=10, help="jumlah drought terpanjang")
+
+    p_leg = sub.add_parser("legacy", help="index + ringkasan log teks lama (jackpot.txt), output JSON")
+    p_leg.add_argument("log", nargs="?", default="jackpot.txt")
+    p_leg.add_argument("--last", type=int, default=10, help="jumlah kegagalan terakhir")
+
+    p_tail = sub.add_parser("tail", help="peluang drought >= n pull (importance sampling), output JSON")
+    p_tail.add_argument("profile", help="profile (probability diambil dari sini)")
+    p_tail.add_argument("pulls", type=int, nargs="+", help="panjang drought n")
+    p_tail.add_argument("--samples", type=int, default=10_000)
+    p_tail.add_argument("--seed", type=int, default=None)
+
+    p_eta = sub.add_parser("eta", help="estimasi pull / waktu fase cepat & peluang sukses fase lambat (JSON)")
+    p_eta.add_argument("profile")
+    p_eta.add_argument("--pps", type=float, default=None, help="pulls/sec (default: diukur ± 0.5 detik)")
+    p_eta.add_argument("--set", action="append", metavar="KEY=VALUE", help="override config")
+
+    p_eng = sub.add_parser("engines", help="engine fase cepat: capability & kalibrasi auto (JSON)")
+    p_eng.add_argument("profile", nargs="?", default="hsr")
+    p_eng.add_argument("--calibrate", action="store_true", help="ukur ulang engine (hasil disimpan ke engine_cache)")
+    p_eng.add_argument("--set", action="append", metavar="KEY=VALUE", help="override config")
+
+    p_bench = sub.add_parser("bench", help="benchmark throughput & latency, output JSON (exit 1 jika regresi)")
+    p_bench.add_argument("--profile", default=None, help="config dasar (default: DEFAULT_CONFIG)")
+    p_bench.add_argument("--quick", action="store_true", help="ukuran kecil & lebih sedikit ulangan")
+    p_bench.add_argument("--only", nargs="+", choices=list(CASES), help="hanya case ini")
+    p_bench.add_argument("--out", default=None, help="file JSON hasil")
+    p_bench.add_argument("--baseline", default=None, help="bandingkan median dengan file JSON baseline")
+    p_bench.add_argument("--save-baseline", default=None, metavar="PATH", help="simpan hasil sebagai baseline baru")
+    p_bench.add_argument("--tolerance", type=float, default=0.25, help="toleransi perlambatan sebelum dianggap regresi")
+    p_bench.add_argument("--min-delta", type=float, default=1e-3, help="selisih median (detik) minimum untuk regresi")
+
+    p_int = sub.add_parser("interactive", help="simulasi otomatis + menu interaktif")
+    p_int.add_argument("profile")
+    p_int.add_argument("--set", action="append", metavar="KEY=VALUE", help="override config")
+    p_int.add_argument("--checkpoint", metavar="DIR", help="checkpoint berkala ke DIR (resume jika ada)")
+    p_int.add_argument("--archive", metavar="DIR", help="append jarak jackpot setiap siklus ke arsip DIR")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+
+    if args.command == "profiles":
+        for name in list_profiles():
+            print(name)
+
+    elif args.command == "run":
+        overrides = _parse_overrides(args.set)
+        if args.archive:
+            overrides["archive_dir"] = args.archive
+        configs = [load_profile(name, **overrides) for name in args.profiles]
+        results = run_profiles(configs, seed=args.seed, workers=args.workers,
+                               checkpoint_dir=args.checkpoint)
+        output = json.dumps(results, indent=2, ensure_ascii=False)
+        if args.out:
+            with open(args.out, "w", encoding="utf-8") as f:
+                f.write(output + "\n")
+        else:
+            print(output)
+        if any(r["status"] != "ok" for r in results):
+            sys.exit(1)
+
+    elif args.command == "sweep":
+        _sweep(load_profile(args.profile), args)
+
+    elif args.command == "archive":
+        print(json.dumps(archive_report(args.directory, args.profile, args.top), indent=2))
+
+    elif args.command == "legacy":
+        index = LegacyLogIndex(args.log)
+        new = index.update()
+        print(json.dumps({
+            "log":                      args.log,
+            "new_events":               new,
+            "sessions":                 len(index.sessions),
+            "failures_per_game":        index.failures_per_game(),
+            "manual_pulls_per_session": index.manual_pulls_per_session(),
+            "last_failures":            index.last_failures(args.last),
+        }, indent=2, ensure_ascii=False))
+
+    elif args.command == "tail":
+        p = load_profile(args.profile)["probability"]
+        results = predict_tail_probabilities(p, args.pulls, args.samples, np.random.default_rng(args.seed))
+        for n, res in results.items():
+            # Pull yang dibutuhkan Monte Carlo biasa untuk presisi yang sama
+            res["mc_pulls_same_precision"] = samples_for_precision(p, n, res["rel_error"], "mc") / p
+        print(json.dumps({str(n): r for n, r in results.items()}, indent=2))
+
+    elif args.command == "eta":
+        config = load_profile(args.profile, **_parse_overrides(args.set))
+        pps = args.pps or measure_pulls_per_sec(config)
+        report = eta(config, pps)
+        report["fast_pulls_quantiles"] = {
+            level: fast_phase_quantile(config["probability"], config["min_percobaan"], level)
+            for level in report["fast_seconds_quantiles"]
+        }
+        print(json.dumps(report, indent=2))
+
+    elif args.command == "engines":
+        config = load_profile(args.profile, **_parse_overrides(args.set))
+        selected = select_engine(config, recalibrate=True) if args.calibrate else None
+        print(json.dumps({
+            "engines": [
+                dict(cls(config).describe(), available=cls.available()) for cls in ENGINES.values()
+            ],
+            "calibration": load_calibration(config),
+            "selected":    selected,
+        }, indent=2))
+
+    elif args.command == "bench":
+        config = load_profile(args.profile) if args.profile else None
+        doc = run_benchmarks(config, quick=args.quick, only=args.only,
+                             progress=lambda msg: print(msg, file=sys.stderr))
+        print(format_results(doc), file=sys.stderr)
+        regressions = []
+        if args.baseline:
+            baseline = load_report(args.baseline)
+            if baseline["machine"]["key"] != doc["machine"]["key"]:
+                print(f"⚠️ Baseline dari mesin lain ({baseline['machine']['key']}), "
+                      "perbandingan hanya indikatif", file=sys.stderr)
+            doc["comparison"] = compare(doc, baseline, args.tolerance, args.min_delta)
+            regressions = [row for row in doc["comparison"] if row["status"] == "regression"]
+            for row in regressions:
+                params = " ".join(f"{k}={v}" for k, v in row["params"].items())
+                print(f"🐢 Regresi {row['name']} {params}: {row['ratio']:.2f}x lebih lambat", file=sys.stderr)
+        if args.save_baseline:
+            save_report(doc, args.save_baseline)
+        if args.out:
+            save_report(doc, args.out)
+        else:
+            print(json.dumps(doc, indent=2))
+        if regressions:
+            sys.exit(1)
+
+    elif args.command == "interactive":
+        overrides = _parse_overrides(args.set)
+        if args.checkpoint:
+            overrides["checkpoint_dir"] = args.checkpoint
+        if args.archive:
+            overrides["archive_dir"] = args.archive
+        interactive(load_profile(args.profile, **overrides))
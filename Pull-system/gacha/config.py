@@ -0,0 +1,194 @@
+# Konfigurasi simulasi: DEFAULT_CONFIG (semua key + penjelasan) dan
+# profile per game di folder profiles/ (file JSON berisi key yang berbeda
+# dari default saja, mis. profiles/hsr.json, profiles/wuwa.json).
+
+import json
+import os
+
+
+# Folder profile bawaan: Pull-system/profiles
+PROFILE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "profiles")
+
+# Key profile yang hanya dokumentasi (tidak dipakai simulator)
+PROFILE_META_KEYS = ("description",)
+
+
+# ╔══════════════════════════════════════════════════════════════════════════════╗
+# ║                            KONFIGURASI DEFAULT                             ║
+# ╚══════════════════════════════════════════════════════════════════════════════╝
+
+DEFAULT_CONFIG = {
+    # Nama game untuk label di log dan tampilan
+    "game_name": "System 02 - HSR Scharacter",
+
+    # Probabilitas jackpot per pull
+    #   - 0.0006 untuk Character
+    #   - 0.0008 untuk Light Cone
+    "probability": 0.0006,
+
+    # Minimum percobaan (target jarak) sebelum masuk fase lambat
+    "min_percobaan": 21_500,
+
+    # Batch size besar untuk fase cepat (automatic pull)
+    "batch_size_fast": 600,
+
+    # Batch size kecil untuk fase lambat & pull interaktif
+    #   (tidak boleh lebih dari 10 pada mode tertentu)
+    "batch_size_slow": 300,
+
+    # Metode pull:  "NO" = Normal,  "MP" = Multiprocess
+    "pull_method": "NO",
+
+    # Engine fase cepat (pull_method "NO"), lihat gacha/engines.py:
+    #   - "geometric" = ambil jarak jackpot langsung dari distribusi geometric
+    #   - "skip"      = langsung sample "streak panjang pertama" (skip-ahead)
+    #   - "batch"     = batch random uniform NumPy (stream sama dengan _do_pull)
+    #   - "numba"     = loop batch yang di-compile numba
+    #   - "numba_parallel" = banyak stream independen di semua core (prange)
+    #   - "threads" / "processes" = blok geometric paralel di thread / worker pool MP
+    #   - "auto"      = engine tercepat di mesin ini (kalibrasi sekali, di-cache)
+    "fast_engine": "geometric",
+
+    # Engine "auto": file cache hasil kalibrasi per mesin + bucket parameter
+    # (engines.calibration_key; None = kalibrasi setiap run), capability
+    # wajib, kandidat (None = semua yang tersedia), lama pengukuran per
+    # engine (detik) dan ± jackpot per run kalibrasi
+    "engine_cache": "~/.cache/pull-system/engines.json",
+    "engine_require": ["distances"],
+    "engine_candidates": None,
+    "engine_calibration_seconds": 0.5,
+    "engine_calibration_jackpots": 20_000,
+
+    # Engine "threads" / "processes": jumlah worker (0 = semua core / core - 1)
+    # dan banyak jarak jackpot per blok per worker
+    "engine_workers": 0,
+    "engine_parallel_block": 1 << 20,
+
+    # Engine "batch": yield ke simulator (progress log, checkpoint) setiap N batch
+    "engine_chunk_batches": 4096,
+
+    # Engine "numba_parallel": banyak stream (0 = jumlah thread numba)
+    # dan maksimum pull per stream per ronde
+    "numba_streams": 0,
+    "numba_round_pulls": 5_000_000,
+
+    # Engine numba: folder cache hasil compile (None = __pycache__ di samping
+    # gacha/jit.py) dan warm-up di thread background saat menu interaktif
+    # (compile / load cache selagi user memilih opsi)
+    "numba_cache_dir": None,
+    "jit_warmup": True,
+
+    # Engine "skip": True = hanya simpan ringkasan (jumlah, total) untuk MLE,
+    # jarak jackpot yang gagal tidak dimasukkan ke jackpot_list
+    "skip_summary_only": False,
+
+    # Banyak jarak jackpot yang di-generate per blok pada engine "geometric"
+    "geometric_block_size": 65_536,
+
+    # Bit generator untuk np.random.Generator: "PCG64", "PCG64DXSM", "SFC64", "Philox"
+    "rng_bit_generator": "SFC64",
+
+    # Root seed (None = ambil entropy dari OS; seed tetap dicatat di log)
+    "rng_seed": None,
+
+    # Mode "MP": kapasitas ring buffer shared memory per worker (jumlah jarak
+    # jackpot) dan berapa jackpot dikumpulkan worker sebelum dikirim sekaligus
+    "mp_ring_capacity": 1 << 16,
+    "mp_flush_size": 1024,
+
+    # Mode "MP": worker cek sinyal stop/cancel setiap N batch,
+    # batas waktu run (detik, None = tanpa batas) dan batas waktu shutdown pool
+    "mp_stop_check_every": 16,
+    "mp_timeout": None,
+    "mp_shutdown_timeout": 5.0,
+
+    # Cara membuat worker pool (mode "MP" & engine "processes"):
+    # "forkserver" (aman walaupun numba parallel / thread sudah jalan di
+    # parent), "fork" (start paling cepat), "spawn", atau None = default OS
+    "mp_start_method": "forkserver",
+
+    # Confidence level target untuk berhenti (0.999 = 99.9%, 0.9999 = 99.99%)
+    "confidence_target": 0.999,
+
+    # Interval (detik) antara setiap progress log di layar (mode verbose)
+    "log_interval": 10,
+
+    # Tampilan terminal:
+    #   - "silent"    = tanpa output (headless)
+    #   - "dashboard" = panel counter yang di-refresh render_refresh_hz kali/detik
+    #   - "verbose"   = semua baris per pull / per batch (perilaku lama)
+    "render_mode": "verbose",
+    "render_refresh_hz": 4,
+
+    # Batch size untuk single interactive pull (opsi 1)
+    "batch_size_single": 1,
+
+    # Aktifkan opsi 3 (automatic pull) di menu interaktif
+    "enable_auto_pull_menu": True,
+
+    # File log (None = tanpa log). Format "jsonl" = record terstruktur,
+    # "text" = baris teks lama seperti jackpot.txt
+    "log_file": "jackpot.jsonl",
+    "log_format": "jsonl",
+
+    # Logger menulis ke disk setiap N detik atau saat buffer berisi N baris
+    "log_flush_interval": 1.0,
+    "log_max_buffer": 1000,
+
+    # Instrumentasi (gacha/metrics.py): wall/CPU time per fase, counter dan
+    # pulls/sec bergulir dalam metrics_window detik. Tanpa biaya jika False.
+    # File Prometheus text / JSON ditulis di akhir run_auto_simulation, saat
+    # close() dan lewat menu opsi 6 (None = hanya lewat metrics_snapshot())
+    "metrics": False,
+    "metrics_window": 10.0,
+    "metrics_prom_file": None,
+    "metrics_json_file": None,
+
+    # Folder arsip jarak jackpot lintas run (None = tanpa arsip); setiap
+    # siklus automatic pull di-append ke sini, lihat gacha/archive.py.
+    # Opt-in: "archive_dir" di profile atau --archive DIR
+    "archive_dir": None,
+
+    # Folder checkpoint (None = tanpa checkpoint) dan interval simpan (detik).
+    # Resume: GachaSimulator.resume() / --checkpoint DIR (otomatis jika DIR berisi checkpoint)
+    "checkpoint_dir": None,
+    "checkpoint_interval": 60.0,
+}
+
+
+# ╔══════════════════════════════════════════════════════════════════════════════╗
+# ║                                  PROFILE                                   ║
+# ╚══════════════════════════════════════════════════════════════════════════════╝
+
+def profile_path(name: str) -> str:
+    """Nama profile ("hsr") → path di PROFILE_DIR; path file dipakai apa adanya."""
+    if name.endswith(".json") or os.sep in name:
+        return name
+    return os.path.join(PROFILE_DIR, f"{name}.json")
+
+
+def list_profiles() -> list[str]:
+    """Nama semua profile di PROFILE_DIR."""
+    if not os.path.isdir(PROFILE_DIR):
+        return []
+    return sorted(f[:-5] for f in os.listdir(PROFILE_DIR) if f.endswith(".json"))
+
+
+def load_profile(name: str, **overrides) -> dict:
+    """
+    DEFAULT_CONFIG + isi file profile + overrides.
+    Key yang tidak dikenal ditolak (ValueError) supaya typo tidak diam-diam diabaikan.
+    """
+    path = profile_path(name)
+    with open(path, encoding="utf-8") as f:
+        profile = json.load(f)
+    profile.update(overrides)
+
+    unknown = sorted(set(profile) - set(DEFAULT_CONFIG) - set(PROFILE_META_KEYS))
+    if unknown:
+        raise ValueError(f"{path}: key tidak dikenal: {', '.join(unknown)}")
+
+    config = dict(DEFAULT_CONFIG)
+    config.update((k, v) for k, v in profile.items() if k not in PROFILE_META_KEYS)
+    config["profile"] = os.path.splitext(os.path.basename(path))[0]
+    return config
@@ -0,0 +1,440 @@
+# Engine fase cepat (automatic pull, pull_method "NO").
+#
+# Kontrak semua engine: run(sim) adalah generator yang meng-yield chunk
+#   {"pulls": int, "distances": np.ndarray int64, "streak": int,
+#    "summary": (n, total, max, m2) | None}
+# dengan urutan waktu yang sama seperti loop _do_pull:
+#   - jarak pertama melanjutkan sim.jarak_jackpot (streak yang sedang berjalan)
+#   - "streak"  = streak yang sedang berjalan setelah chunk ini
+#   - "summary" = jackpot gagal yang tidak di-materialisasi (MLE + ringkasan stats)
+#   - engine berhenti setelah jackpot pertama dengan jarak >= sim.fast_threshold,
+#     jarak itu adalah elemen terakhir chunk terakhir
+# Kondisi stop-nya sendiri dicek di satu tempat: GachaSimulator.fast_phase_done().
+#
+# Setiap engine mendeklarasikan capability (lihat CAPABILITIES). Engine
+# "auto" menjalankan kalibrasi singkat pada pemakaian pertama, menyimpan
+# pulls/sec per engine ke cache per mesin, lalu memakai engine tercepat
+# yang memenuhi CONFIG["engine_require"] pada run berikutnya.
+
+import json
+import os
+import platform
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import numpy as np
+import multiprocessing as mp
+
+from .kernels import (
+    NUMBA_AVAILABLE, _geometric_block_worker, geometric_block, load_jit, sample_first_long_streak,
+)
+
+
+# Capability yang bisa dideklarasikan engine
+CAPABILITIES = {
+    "distances":   "semua jarak jackpot fase cepat dicatat ke jackpot_list",
+    "summary":     "jackpot gagal hanya diringkas (count, total, max, m2) untuk MLE & stats",
+    "batch_model": "mensimulasikan batch uniform seperti _do_pull (sisa batch setelah hit dibuang)",
+    "progress":    "yield chunk di tengah fase: progress log & checkpoint berkala",
+    "parallel":    "memakai lebih dari satu core",
+    "jit":         "butuh compile JIT (pemakaian pertama lebih lambat)",
+}
+
+
+def _chunk(pulls: int, distances, streak: int = 0, summary=None) -> dict:
+    return {
+        "pulls":     int(pulls),
+        "distances": np.asarray(distances, dtype=np.int64),
+        "streak":    int(streak),
+        "summary":   summary,
+    }
+
+
+def _block_size(sim, block: int) -> int:
+    """
+    Ukuran blok geometric: maksimal `block`, tapi tidak jauh melebihi
+    perkiraan jumlah jackpot fase cepat (± 2 / q, q = P(jarak >= threshold)),
+    supaya fase cepat yang pendek tidak membuang sampel.
+    """
+    q = np.exp((sim.fast_threshold - 1) * np.log1p(-sim.prob))
+    return int(min(block, max(1024, 2.0 / q)))
+
+
+# ╔══════════════════════════════════════════════════════════════════════════════╗
+# ║                                  ENGINE                                    ║
+# ╚══════════════════════════════════════════════════════════════════════════════╝
+
+class PullEngine:
+    """Basis engine fase cepat. Subclass mengisi name, capabilities dan run()."""
+
+    name         = ""
+    capabilities = frozenset()
+
+    def __init__(self, config: dict):
+        self.config = config
+
+    @classmethod
+    def available(cls) -> bool:
+        """False jika dependency engine (mis. numba) tidak ter-install."""
+        return True
+
+    def run(self, sim):
+        raise NotImplementedError
+
+    def warm_up(self):
+        """Siapkan engine sebelum run pertama (compile JIT); boleh dari thread lain."""
+
+    def close(self):
+        """Lepaskan resource engine (thread pool, dsb.)."""
+
+    def describe(self) -> dict:
+        return {"name": self.name, "capabilities": sorted(self.capabilities)}
+
+
+class BatchEngine(PullEngine):
+    """
+    Loop NumPy per batch (rng.random(batch_size_fast) + cari hit pertama),
+    stream random persis sama dengan _do_pull. Yield setiap
+    engine_chunk_batches batch supaya progress & checkpoint tetap jalan.
+    """
+
+    name         = "batch"
+    capabilities = frozenset({"distances", "batch_model", "progress"})
+
+    def run(self, sim):
+        rng, prob, batch = sim.rng, sim.prob, sim.batch_fast
+        threshold = sim.fast_threshold
+        chunk_batches = self.config.get("engine_chunk_batches", 4096)
+        streak = sim.jarak_jackpot
+
+        while True:
+            pulls = 0
+            found = []
+            for _ in range(chunk_batches):
+                hits = np.flatnonzero(rng.random(size=batch) < prob)
+                if hits.size > 0:
+                    first_hit = int(hits[0]) + 1
+                    streak += first_hit
+                    pulls += first_hit
+                    found.append(streak)
+                    if streak >= threshold:
+                        yield _chunk(pulls, found)
+                        return
+                    streak = 0
+                else:
+                    streak += batch
+                    pulls += batch
+            yield _chunk(pulls, found, streak)
+
+
+class GeometricEngine(PullEngine):
+    """Jarak jackpot di-sample langsung dari Geometric(p), per blok vektor."""
+
+    name         = "geometric"
+    capabilities = frozenset({"distances"})
+
+    def run(self, sim):
+        block = _block_size(sim, self.config.get("geometric_block_size", 65_536))
+        carry = sim.jarak_jackpot
+        while True:
+            distances, done = geometric_block(sim.rng, sim.prob, block, sim.fast_threshold, carry)
+            carry = 0
+            yield _chunk(distances.sum(dtype=np.int64), distances)
+            if done:
+                return
+
+
+class SkipEngine(PullEngine):
+    """
+    Skip-ahead: sample langsung streak panjang pertama (sample_first_long_streak).
+    skip_summary_only=True → jackpot gagal hanya diringkas untuk MLE.
+    """
+
+    name         = "skip"
+    capabilities = frozenset({"distances"})
+
+    def __init__(self, config: dict):
+        super().__init__(config)
+        self.summary_only = config.get("skip_summary_only", False)
+        if self.summary_only:
+            self.capabilities = frozenset({"summary"})
+
+    def run(self, sim):
+        res = sample_first_long_streak(sim.prob, sim.target, sim.jarak_jackpot, self.summary_only, sim.rng)
+        final = res["final_distance"]
+        if res["failed_distances"] is None:
+            yield _chunk(res["failed_pulls"] + final, [final],
+                         summary=(res["n_failed"], res["failed_pulls"], res["failed_max"], res["failed_m2"]))
+        else:
+            yield _chunk(res["failed_pulls"] + final, np.append(res["failed_distances"], final))
+
+
+class NumbaEngine(PullEngine):
+    """Loop batch di-compile numba (simulate_batches_numba), satu panggilan."""
+
+    name         = "numba"
+    capabilities = frozenset({"distances", "batch_model", "jit"})
+
+    @classmethod
+    def available(cls) -> bool:
+        return NUMBA_AVAILABLE
+
+    def warm_up(self):
+        load_jit(self.config.get("numba_cache_dir")).warm_up("parallel" in self.capabilities)
+
+    def run(self, sim):
+        pulls, jackpots, _ = load_jit(self.config.get("numba_cache_dir")).simulate_batches_numba(
+            sim.prob, sim.batch_fast, sim.target, sim.jarak_jackpot, sim.rng_backend.numba_seeds()
+        )
+        yield _chunk(pulls, jackpots)
+
+
+class NumbaParallelEngine(NumbaEngine):
+    """Banyak stream numba independen (prange) per ronde, yield per ronde."""
+
+    name         = "numba_parallel"
+    capabilities = frozenset({"distances", "batch_model", "jit", "parallel", "progress"})
+
+    def run(self, sim):
+        rounds = load_jit(self.config.get("numba_cache_dir")).run_parallel_streams_numba(
+            sim.prob, sim.batch_fast, sim.target, sim.jarak_jackpot, sim.rng_backend,
+            self.config.get("numba_streams", 0), self.config.get("numba_round_pulls", 5_000_000),
+        )
+        for pulls, jackpots, streak in rounds:
+            yield _chunk(pulls, jackpots, streak)
+
+
+class ThreadsEngine(PullEngine):
+    """
+    Blok geometric di beberapa thread (numpy melepas GIL saat sampling),
+    satu child Generator per blok. Blok dibaca berurutan, jadi hasilnya
+    hanya tergantung seed, bukan urutan thread selesai.
+    """
+
+    name         = "threads"
+    capabilities = frozenset({"distances", "parallel", "progress"})
+
+    def __init__(self, config: dict):
+        super().__init__(config)
+        self.workers   = config.get("engine_workers") or os.cpu_count() or 1
+        self.block     = config.get("engine_parallel_block", 1 << 20)
+        self._executor = None
+
+    def _blocks(self, sim, carry):
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(self.workers, thread_name_prefix="pull-engine")
+        generators = sim.rng_backend.spawn_generators(self.workers)
+        carries = [carry] + [0] * (self.workers - 1)
+        return self._executor.map(
+            lambda g, c: geometric_block(g, sim.prob, _block_size(sim, self.block), sim.fast_threshold, c),
+            generators, carries,
+        )
+
+    def run(self, sim):
+        carry = sim.jarak_jackpot
+        while True:
+            for distances, done in self._blocks(sim, carry):
+                yield _chunk(distances.sum(dtype=np.int64), distances)
+                if done:
+                    return
+            carry = 0
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+
+class ProcessesEngine(ThreadsEngine):
+    """
+    Seperti "threads", tapi blok di-sample di worker pool MP milik
+    simulator (PersistentPool yang sama dengan pull_method "MP").
+    Di dalam proses daemon (worker sweep) child process tidak diizinkan,
+    jadi blok di-sample di thread seperti "threads".
+    """
+
+    name         = "processes"
+    capabilities = frozenset({"distances", "parallel", "progress"})
+
+    def __init__(self, config: dict):
+        super().__init__(config)
+        self.workers = config.get("engine_workers") or max(1, mp.cpu_count() - 1)
+
+    @staticmethod
+    def can_spawn() -> bool:
+        return not mp.current_process().daemon
+
+    def _blocks(self, sim, carry):
+        if not self.can_spawn():
+            return super()._blocks(sim, carry)
+        pool = sim._get_worker_pool(self.workers)
+        seeds = sim.rng_backend.spawn(pool.processes)
+        args = [
+            (sim.prob, _block_size(sim, self.block), sim.fast_threshold, carry if i == 0 else 0,
+             sim.rng_backend.bit_generator, s)
+            for i, s in enumerate(seeds)
+        ]
+        with pool.lock:
+            results = pool.submit(_geometric_block_worker, args)
+            blocks = [res.get() for res in results]
+        if sim.metrics is not None:
+            sim.metrics.ipc_messages += len(blocks)
+        return blocks
+
+
+# Registry nama CONFIG["fast_engine"] → class
+ENGINES = {
+    cls.name: cls
+    for cls in (BatchEngine, GeometricEngine, SkipEngine, NumbaEngine,
+                NumbaParallelEngine, ThreadsEngine, ProcessesEngine)
+}
+
+
+def available_engines() -> list[str]:
+    return [name for name, cls in ENGINES.items() if cls.available()]
+
+
+# ╔══════════════════════════════════════════════════════════════════════════════╗
+# ║                          AUTO (Kalibrasi per Mesin)                        ║
+# ╚══════════════════════════════════════════════════════════════════════════════╝
+
+def machine_key() -> str:
+    """Identitas mesin + versi library yang mempengaruhi kecepatan engine."""
+    parts = [
+        platform.node(), platform.machine(), f"cpu{os.cpu_count()}",
+        f"py{platform.python_version()}", f"numpy{np.__version__}",
+    ]
+    if NUMBA_AVAILABLE:
+        from importlib import metadata          # import lokal: ± 25 ms, hanya untuk auto
+        parts.append(f"numba{metadata.version('numba')}")      # tanpa import numba
+    return "|".join(parts)
+
+
+def calibration_key(config: dict) -> str:
+    """
+    Bucket parameter yang mengubah kecepatan relatif engine: probability dan
+    panjang fase cepat (min_percobaan × p, jackpot per fase) di skala log2,
+    plus batch_size_fast (engine batch). Profile yang mirip berbagi hasil.
+    """
+    p = config["probability"]
+    return "|".join([
+        f"p2^{round(np.log2(p))}",
+        f"np2^{round(np.log2(max(config['min_percobaan'] * p, 1.0)))}",
+        f"batch{config['batch_size_fast']}",
+    ])
+
+
+def _cache_key(config: dict) -> str:
+    return f"{machine_key()}|{calibration_key(config)}"
+
+
+def _cache_path(config: dict) -> str | None:
+    path = config.get("engine_cache")
+    return os.path.expanduser(path) if path else None
+
+
+def load_calibration(config: dict) -> dict:
+    """Hasil kalibrasi mesin ini (dan bucket parameter config) dari cache ({} jika belum ada)."""
+    path = _cache_path(config)
+    if not path or not os.path.exists(path):
+        return {}
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f).get(_cache_key(config), {})
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_calibration(config: dict, entry: dict):
+    path = _cache_path(config)
+    if not path:
+        return
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    try:
+        with open(path, encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        cache = {}
+    cache[_cache_key(config)] = entry
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(cache, f, indent=2)
+    os.replace(tmp, path)
+
+
+def calibration_target(prob: float, jackpots: int) -> int:
+    """min_percobaan sehingga fase cepat rata-rata berisi ± `jackpots` jackpot."""
+    return int(np.ceil(np.log(jackpots) / -np.log1p(-prob))) + 11
+
+
+def eligible_engines(config: dict) -> list[str]:
+    """Engine tersedia yang memenuhi semua capability di CONFIG["engine_require"]."""
+    require = set(config.get("engine_require") or ())
+    candidates = config.get("engine_candidates") or available_engines()
+    # Worker daemon (sweep): "processes" hanya akan menjadi "threads" kedua
+    skip = set() if ProcessesEngine.can_spawn() else {ProcessesEngine.name}
+    return [
+        name for name in candidates
+        if name not in skip
+        and ENGINES[name].available() and require <= ENGINES[name](config).capabilities
+    ]
+
+
+def calibrate(config: dict, names=None, duration: float | None = None) -> dict[str, float]:
+    """
+    Ukur pulls/sec setiap engine (analytics.measure_pulls_per_sec, setelah
+    satu run pemanasan untuk compile JIT / start worker). Target dibuat
+    pendek: ± engine_calibration_jackpots jackpot per run.
+    """
+    from .analytics import measure_pulls_per_sec      # import lokal: analytics → simulator → engines
+
+    duration = duration if duration is not None else config.get("engine_calibration_seconds", 0.5)
+    target = min(config["min_percobaan"],
+                 calibration_target(config["probability"], config.get("engine_calibration_jackpots", 20_000)))
+    trial = dict(config, rng_seed=0)
+    return {
+        name: measure_pulls_per_sec(dict(trial, fast_engine=name), duration, warmup=True, target=target)
+        for name in (names or eligible_engines(config))
+    }
+
+
+def select_engine(config: dict, say=None, recalibrate: bool = False) -> str:
+    """
+    Nama engine tercepat untuk "auto": dari cache mesin ini, kalibrasi
+    engine yang belum pernah diukur (recalibrate=True: semua) lalu simpan
+    ke cache.
+    """
+    eligible = eligible_engines(config)
+    if not eligible:
+        raise ValueError(f"Tidak ada engine yang memenuhi engine_require={config.get('engine_require')!r}")
+    speeds = {} if recalibrate else dict(load_calibration(config).get("pulls_per_sec", {}))
+    missing = [name for name in eligible if name not in speeds]
+    if missing:
+        if say:
+            say(f"⚙️  Kalibrasi engine fase cepat: {', '.join(missing)}")
+        speeds.update(calibrate(config, missing))
+        _save_calibration(config, {
+            "pulls_per_sec": speeds,
+            "calibrated_at": datetime.now().isoformat(timespec="seconds"),
+            "probability":   config["probability"],
+        })
+    best = max(eligible, key=lambda name: speeds[name])
+    if say:
+        say(f"⚙️  Engine auto: {best} ({speeds[best]:,.0f} pulls/sec)")
+    return best
+
+
+def make_engine(config: dict, say=None) -> PullEngine:
+    """Buat engine dari CONFIG["fast_engine"] ("auto" → select_engine)."""
+    name = config.get("fast_engine", "geometric")
+    if name == "auto":
+        name = select_engine(config, say)
+    try:
+        cls = ENGINES[name]
+    except KeyError:
+        raise ValueError(
+            f"Engine fase cepat tidak dikenal: {name!r} (pilihan: auto, {', '.join(ENGINES)})"
+        ) from None
+    if not cls.available():
+        raise ValueError(f"Engine {name!r} tidak tersedia di mesin ini (numba belum ter-install?)")
+    return cls(config)
@@ -0,0 +1,161 @@
+# Kernel fase cepat yang di-compile numba (engine "numba" / "numba_parallel").
+#
+# Modul ini sengaja terpisah dari gacha.kernels: import numba (± 0.2 detik)
+# dan load hasil compile dari cache disk hanya terjadi saat engine numba
+# benar-benar dipakai, lewat kernels.load_jit(). Hasil compile disimpan di
+# cache disk (cache=True): __pycache__ di samping file ini, atau
+# NUMBA_CACHE_DIR / CONFIG["numba_cache_dir"].
+
+import numpy as np
+from numba import get_num_threads, njit, prange
+
+
+@njit(cache=True)
+def _grow_buffer(buf, n):
+    """Gandakan kapasitas buffer int64, salin n elemen pertama."""
+    new_buf = np.empty(buf.size * 2, dtype=np.int64)
+    new_buf[:n] = buf[:n]
+    return new_buf
+
+
+@njit(cache=True)
+def simulate_batches_numba(prob, batch_size, target, start_streak, seed):
+    """
+    Fast JIT-compiled loop: pull dalam batch sampai jackpot pertama dengan
+    jarak >= target - 10 (kondisi stop yang sama dengan engine lain).
+    Jarak jackpot ditulis ke buffer int64 yang tumbuh (doubling),
+    tanpa list Python dan tanpa np.where per batch.
+    seed: untuk state random internal numba (dari RNGBackend.numba_seeds).
+    Returns (total_pulls_done, array_jackpot_distances, final_distance).
+    """
+    np.random.seed(seed)
+    pulls_done = 0
+    jackpots = np.empty(1024, dtype=np.int64)
+    n = 0
+    streak = start_streak
+
+    while True:
+        # Sisa batch setelah hit dibuang, jadi cukup draw sampai hit pertama
+        first_hit = 0
+        for i in range(batch_size):
+            if np.random.random() < prob:
+                first_hit = i + 1
+                break
+
+        if first_hit > 0:
+            pulls_done += first_hit
+            streak += first_hit
+            if n == jackpots.size:
+                jackpots = _grow_buffer(jackpots, n)
+            jackpots[n] = streak
+            n += 1
+            if streak >= (target - 10):
+                break
+            streak = 0
+        else:
+            pulls_done += batch_size
+            streak += batch_size
+
+    return pulls_done, jackpots[:n], streak
+
+
+@njit(cache=True, parallel=True)
+def simulate_streams_numba(prob, batch_size, target, streaks, max_pulls, capacity, seeds):
+    """
+    Satu ronde untuk banyak stream independen (prange, semua core).
+    Setiap stream pull sampai jackpot dengan jarak >= target - 10,
+    buffer penuh, atau max_pulls tercapai.
+    Returns (jackpots[stream, capacity], counts, pulls, streaks, done).
+    """
+    n_streams = streaks.size
+    jackpots = np.empty((n_streams, capacity), dtype=np.int64)
+    counts = np.zeros(n_streams, dtype=np.int64)
+    pulls = np.zeros(n_streams, dtype=np.int64)
+    out_streaks = streaks.copy()
+    done = np.zeros(n_streams, dtype=np.bool_)
+
+    for s in prange(n_streams):
+        np.random.seed(seeds[s])
+        streak = out_streaks[s]
+        n = 0
+        pulls_done = 0
+
+        while pulls_done < max_pulls and n < capacity:
+            first_hit = 0
+            for i in range(batch_size):
+                if np.random.random() < prob:
+                    first_hit = i + 1
+                    break
+
+            if first_hit > 0:
+                pulls_done += first_hit
+                streak += first_hit
+                jackpots[s, n] = streak
+                n += 1
+                if streak >= (target - 10):
+                    done[s] = True
+                    break
+                streak = 0
+            else:
+                pulls_done += batch_size
+                streak += batch_size
+
+        counts[s] = n
+        pulls[s] = pulls_done
+        out_streaks[s] = streak
+
+    return jackpots, counts, pulls, out_streaks, done
+
+
+def run_parallel_streams_numba(prob, batch_size, target, start_streak, rng_backend,
+                               n_streams=0, round_pulls=5_000_000):
+    """
+    Generator: jalankan simulate_streams_numba ronde demi ronde sampai
+    salah satu stream mendapat jackpot >= target - 10.
+    Stream dibaca berurutan (ronde, lalu nomor stream); pada ronde
+    terakhir stream setelah stream pertama yang selesai dibuang, jadi
+    jarak terakhir yang di-yield adalah jackpot yang memenuhi target.
+    Seed tiap stream per ronde diambil dari rng_backend.
+
+    pulls_done hanya menghitung pull milik jackpot yang di-yield (streak
+    stream yang belum selesai dihitung saat jackpot-nya keluar), jadi
+    total pulls = jumlah jarak - start_streak. start_streak sudah dihitung
+    oleh pemanggil; ia menjadi streak yang berjalan sampai jackpot pertama
+    stream 0.
+    Yields (pulls_done, jackpot_distances, streak) per ronde.
+    """
+    n_streams = n_streams or get_num_threads()
+    capacity = max(1024, int(round_pulls * prob * 2))
+    streaks = np.zeros(n_streams, dtype=np.int64)
+    streaks[0] = start_streak
+    carry = int(start_streak)
+
+    while True:
+        seeds = rng_backend.numba_seeds(n_streams)
+        jackpots, counts, pulls, streaks, done = simulate_streams_numba(
+            prob, batch_size, target, streaks, round_pulls, capacity, seeds
+        )
+        last = int(np.flatnonzero(done)[0]) if done.any() else n_streams - 1
+        chunks = [jackpots[s, :counts[s]] for s in range(last + 1) if counts[s] > 0]
+        merged = np.concatenate(chunks) if chunks else np.empty(0, dtype=np.int64)
+        pulls_done = int(merged.sum())
+        if carry and counts[0] > 0:
+            pulls_done -= carry
+            carry = 0
+        if done.any():
+            yield pulls_done, merged, 0
+            return
+        yield pulls_done, merged, carry
+
+
+def warm_up(parallel: bool = False):
+    """
+    Compile (atau load dari cache disk) kernel dengan tipe argumen yang sama
+    seperti pemakaian sebenarnya, pada masalah sekecil mungkin.
+    parallel=True: simulate_streams_numba juga.
+    """
+    seed = np.int64(0)
+    simulate_batches_numba(0.5, 1, 11, 0, seed)
+    if parallel:
+        zeros = np.zeros(1, dtype=np.int64)
+        simulate_streams_numba(0.5, 1, 11, zeros, 1, 1, zeros)
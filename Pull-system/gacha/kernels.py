@@ -0,0 +1,221 @@
+# Kernel simulasi fase cepat: sampling geometric langsung dan worker
+# multiprocessing. Kernel numba JIT (opsional) ada di gacha.jit dan baru
+# di-import lewat load_jit() saat engine numba dipakai, jadi import gacha
+# tidak ikut membayar import numba.
+
+import importlib.util
+import os
+import sys
+import time
+
+import numpy as np
+
+from .pool import worker_flags
+from .rng import make_generator
+from .shm import ShmRingBuffer
+
+NUMBA_AVAILABLE = importlib.util.find_spec("numba") is not None
+
+
+def load_jit(cache_dir: str | None = None):
+    """
+    Import gacha.jit (numba + kernel) saat pertama dibutuhkan. cache_dir:
+    folder cache compile numba (CONFIG["numba_cache_dir"]); hanya berlaku
+    jika numba belum di-import di proses ini.
+    """
+    if cache_dir and "numba" not in sys.modules:
+        os.environ.setdefault("NUMBA_CACHE_DIR", os.path.expanduser(cache_dir))
+    from . import jit
+    return jit
+
+
+# ╔══════════════════════════════════════════════════════════════════════════════╗
+# ║                     GEOMETRIC SAMPLING (Fase Cepat)                        ║
+# ╚══════════════════════════════════════════════════════════════════════════════╝
+
+def geometric_block(rng, prob, size, threshold, carry=0):
+    """
+    Satu blok jarak jackpot Geometric(prob) (jarak pertama ditambah carry),
+    dipotong setelah jarak pertama >= threshold.
+    Returns (distances int64, done).
+    """
+    distances = rng.geometric(prob, size=size)
+    distances[0] += carry
+    long_idx = np.flatnonzero(distances >= threshold)
+    if long_idx.size > 0:
+        return distances[:long_idx[0] + 1], True
+    return distances, False
+
+
+def simulate_geometric_distances(prob, target, start_streak=0, block_size=65_536, rng=None):
+    """
+    Ambil jarak jackpot langsung dari distribusi geometric (blok vektor),
+    sampai ada jarak >= target - 10. Jarak pertama sudah termasuk start_streak.
+    rng: np.random.Generator (default: generator baru dari entropy OS).
+    Returns (jackpot_distances, cumulative_pulls) — keduanya np.ndarray int64,
+    elemen terakhir adalah jackpot yang memenuhi target.
+    """
+    rng = rng or np.random.default_rng()
+    chunks = []
+    carry = start_streak
+
+    while True:
+        distances, done = geometric_block(rng, prob, block_size, target - 10, carry)
+        carry = 0
+        chunks.append(distances)
+        if done:
+            break
+
+    jackpots = np.concatenate(chunks)
+    return jackpots, np.cumsum(jackpots)
+
+
+def sample_first_long_streak(prob, target, start_streak=0, summary_only=False, rng=None):
+    """
+    Skip-ahead: sample langsung "waktu sampai streak panjang pertama".
+
+    Jarak jackpot D ~ Geometric(prob). Sebuah run "gagal" jika D < target - 10.
+      - Banyak run gagal    ~ Geometric(q) - 1,  q = P(D >= target - 10)
+      - Panjang run gagal   ~ Geometric terpotong di {1 .. target - 11}
+      - Run terakhir        = (target - 11) + Geometric(prob)   (memoryless)
+
+    summary_only=True: panjang run gagal tidak di-materialisasi; total
+    di-sample dengan pendekatan normal (CLT) dan max dari distribusi
+    order statistic, jadi biayanya O(1).
+
+    Returns dict: n_failed, failed_pulls, failed_max, failed_m2 (jumlah
+    kuadrat simpangan run gagal; summary_only: nilai harapan), failed_distances
+    (np.ndarray atau None), final_distance.
+    """
+    rng = rng or np.random.default_rng()
+    threshold = target - 10
+    m = threshold - 1                      # panjang maksimum run gagal
+    log_r = np.log1p(-prob)                # log(1 - p)
+    q = np.exp(m * log_r)                  # P(D >= threshold)
+    c = -np.expm1(m * log_r)               # 1 - q = P(D < threshold)
+
+    # Run pertama membawa start_streak (jarak_jackpot yang sedang berjalan)
+    first = start_streak + int(rng.geometric(prob))
+    if first >= threshold:
+        return {
+            "n_failed": 0, "failed_pulls": 0, "failed_max": 0, "failed_m2": 0.0,
+            "failed_distances": np.empty(0, dtype=np.int64) if not summary_only else None,
+            "final_distance": first,
+        }
+
+    n_rest = int(rng.geometric(q)) - 1
+    final = m + int(rng.geometric(prob))
+
+    if summary_only:
+        if n_rest > 0:
+            # Mean & variance geometric terpotong di m
+            mean_t = 1.0 / prob - m * q / c
+            var_t = (1.0 - prob) / prob ** 2 - m * m * q / c ** 2
+            rest_pulls = int(round(rng.normal(n_rest * mean_t, np.sqrt(n_rest * var_t))))
+            rest_pulls = min(max(rest_pulls, n_rest), n_rest * m)
+            # P(max <= k) = F(k)^n  →  inverse CDF dengan U^(1/n)
+            u_max = rng.random() ** (1.0 / n_rest)
+            rest_max = int(np.clip(np.ceil(np.log1p(-u_max * c) / log_r), 1, m))
+            # m2 run gagal: n·var (harapan) + gabungan dengan run pertama
+            rest_mean = rest_pulls / n_rest
+            failed_m2 = n_rest * var_t + (first - rest_mean) ** 2 * n_rest / (n_rest + 1)
+        else:
+            rest_pulls, rest_max, failed_m2 = 0, 0, 0.0
+        return {
+            "n_failed": n_rest + 1,
+            "failed_pulls": first + rest_pulls,
+            "failed_max": max(first, rest_max),
+            "failed_m2": float(failed_m2),
+            "failed_distances": None,
+            "final_distance": final,
+        }
+
+    # Inverse CDF geometric terpotong: k = ceil(log(1 - U*c) / log(1 - p))
+    u = rng.random(size=n_rest)
+    rest = np.ceil(np.log1p(-u * c) / log_r).astype(np.int64)
+    np.clip(rest, 1, m, out=rest)
+    failed = np.concatenate(([first], rest))
+
+    return {
+        "n_failed": len(failed),
+        "failed_pulls": int(failed.sum()),
+        "failed_max": int(failed.max()),
+        "failed_m2": float(((failed - failed.mean()) ** 2).sum()),
+        "failed_distances": failed,
+        "final_distance": final,
+    }
+
+
+# ╔══════════════════════════════════════════════════════════════════════════════╗
+# ║                        MULTIPROCESSING WORKER                              ║
+# ╚══════════════════════════════════════════════════════════════════════════════╝
+
+def _geometric_block_worker(args):
+    """
+    Worker engine "processes": satu blok geometric_block dari child
+    SeedSequence. Jarak dikirim balik sebagai uint32 (separuh byte IPC).
+    """
+    prob, size, threshold, carry, bit_generator, seed_seq = args
+    distances, done = geometric_block(make_generator(bit_generator, seed_seq), prob, size, threshold, carry)
+    return distances.astype(np.uint32), done
+
+
+def _mp_worker(args):
+    """
+    Worker process: simulasi pull, kumpulkan jarak jackpot secara lokal,
+    lalu kirim per batch lewat ring buffer shared memory (tanpa IPC per jackpot).
+    Berhenti ketika streak >= stop value atau cancel di-set; flag hanya
+    dibaca setiap check_every batch.
+    Random dari Generator milik worker (child SeedSequence dari parent).
+    """
+    (prob, batch_size, bit_generator, seed_seq,
+     ring_name, ring_capacity, flush_size, check_every) = args
+    rng = make_generator(bit_generator, seed_seq)
+    ring = ShmRingBuffer(ring_capacity, name=ring_name)
+    stop_value, cancel_flag = worker_flags()
+
+    pulls_done = 0
+    pending = np.empty(flush_size, dtype=np.int64)
+    n_pending = 0
+    streak = 0
+    stop = 0
+    batches = 0
+    last_flush = time.time()
+
+    while True:
+        if batches % check_every == 0:
+            if cancel_flag.value:
+                break
+            stop = stop_value.value
+            ring.set_streak(streak)
+        if stop > 0 and streak >= stop:
+            break
+
+        vals = rng.random(batch_size)
+        hits = np.where(vals < prob)[0]
+        batches += 1
+
+        if len(hits) > 0:
+            first_hit = hits[0] + 1
+            streak += first_hit
+            pulls_done += first_hit
+            pending[n_pending] = streak
+            n_pending += 1
+            streak = 0
+        else:
+            streak += batch_size
+            pulls_done += batch_size
+
+        # Kirim sekaligus jika buffer lokal penuh atau sudah lama tertahan
+        if n_pending == flush_size or (n_pending and time.time() - last_flush >= 0.5):
+            ring.push(pending[:n_pending])
+            n_pending = 0
+            last_flush = time.time()
+        ring.set_pulls(pulls_done)
+
+    ring.push(pending[:n_pending])
+    ring.set_pulls(pulls_done)
+    ring.set_streak(streak)
+    ring.mark_done()  # sinyal selesai
+    ring.close()
+
@@ -0,0 +1,255 @@
+# Parser + index untuk log teks lama (jackpot.txt dari log_to_file, atau
+# RunLogger dengan log_format "text").
+#
+# File dibaca baris demi baris (streaming, tidak pernah dimuat utuh) dengan
+# regex yang di-compile sekali. Hasilnya disimpan sebagai index persisten
+# di folder <log>.idx/:
+#   events.bin   record event fixed-size (dtype EVENT_DTYPE), append-only,
+#                dibaca lewat np.memmap
+#   meta.json    offset byte yang sudah di-index, daftar session, dsb.
+#                (ditulis atomic; commit point)
+# Update berikutnya hanya mem-parse byte baru di akhir file, jadi query
+# berulang tidak perlu scan ulang.
+
+import json
+import os
+import re
+
+import numpy as np
+
+
+# ── Pola baris log lama ──
+RE_SESSION = re.compile(r"Game Name : (?P<game>.*?) Time: (?P<time>\S+)")
+RE_FAILURE = re.compile(
+    r"Kegagalan pada simulasi ke: (?P<sim>-?\d+) , pull baru: (?P<new_pull>-?\d+) , "
+    r"Total pull: (?P<total>-?\d+)"
+)
+RE_MANUAL = re.compile(
+    r"Ini nilai percobaan : (?P<jumlah>.*?) , Nilai pull baru: (?P<new_pull>-?\d+) , "
+    r"Total pull: (?P<total>-?\d+)"
+)
+RE_FAST_DONE = re.compile(
+    r"Informasi sebelum berpindah ke loop lambat\. nilai_N : (?P<target>-?\d+)\s+"
+    r"dan total_jackpot_terakhir : (?P<total>-?\d+)"
+)
+
+# Jenis event (kolom kind)
+SESSION, FAILURE, MANUAL_PULL, FAST_PHASE_DONE = range(4)
+KIND_NAMES = ("session_start", "failure", "manual_pull", "fast_phase_done")
+
+EVENT_DTYPE = np.dtype([
+    ("kind",     "u1"),
+    ("session",  "<i4"),    # -1 = sebelum header session pertama
+    ("line",     "<i8"),
+    ("offset",   "<i8"),    # posisi byte baris di file log
+    ("new_pull", "<i8"),
+    ("total",    "<i8"),
+    ("value",    "<i8"),    # jumlah (manual pull) / nilai_N (fast phase) / -1
+])
+
+
+def _to_int(text: str) -> int:
+    try:
+        return int(text.strip())
+    except ValueError:
+        return -1
+
+
+def parse_line(line: str):
+    """Satu baris → (kind, field dict) atau None jika bukan event yang dikenal."""
+    if "Kegagalan" in line:
+        m = RE_FAILURE.search(line)
+        if m:
+            return FAILURE, {"new_pull": int(m["new_pull"]), "total": int(m["total"]), "value": int(m["sim"])}
+    elif "Ini nilai percobaan" in line:
+        m = RE_MANUAL.search(line)
+        if m:
+            return MANUAL_PULL, {"new_pull": int(m["new_pull"]), "total": int(m["total"]),
+                                 "value": _to_int(m["jumlah"])}
+    elif "Game Name" in line:
+        m = RE_SESSION.search(line)
+        if m:
+            return SESSION, {"game": m["game"].strip(), "time": m["time"]}
+    elif "berpindah ke loop lambat" in line:
+        m = RE_FAST_DONE.search(line)
+        if m:
+            return FAST_PHASE_DONE, {"total": int(m["total"]), "value": int(m["target"])}
+    return None
+
+
+def iter_records(path: str, start_offset: int = 0, start_line: int = 0, session: int = -1,
+                 game: str | None = None):
+    """
+    Stream record dari path mulai start_offset. Yields dict:
+    event, line, offset, session, game, dan field event.
+    Hanya baris lengkap (diakhiri newline) yang diproses.
+    """
+    with open(path, "rb") as f:
+        f.seek(start_offset)
+        offset, line_no = start_offset, start_line
+        for raw in f:
+            if not raw.endswith(b"\n"):
+                break
+            parsed = parse_line(raw.decode("utf-8", errors="replace"))
+            if parsed is not None:
+                kind, fields = parsed
+                if kind == SESSION:
+                    session += 1
+                    game = fields["game"]
+                yield dict(fields, kind=kind, event=KIND_NAMES[kind], line=line_no,
+                           offset=offset, session=session, game=game)
+            offset += len(raw)
+            line_no += 1
+
+
+class LegacyLogIndex:
+    """
+    Index persisten untuk satu file log teks lama.
+
+    update() mem-parse hanya bagian file yang belum di-index (atau index
+    ulang dari awal jika file diganti / terpotong). Query memakai array
+    event memmap + daftar session di meta.json.
+    """
+
+    def __init__(self, log_path: str, index_dir: str | None = None):
+        self.log_path    = log_path
+        self.index_dir   = index_dir or log_path + ".idx"
+        self.events_path = os.path.join(self.index_dir, "events.bin")
+        self.meta_path   = os.path.join(self.index_dir, "meta.json")
+        os.makedirs(self.index_dir, exist_ok=True)
+        self.meta = self._load_meta()
+
+    # ── Index ──
+
+    @staticmethod
+    def _empty_meta() -> dict:
+        return {"offset": 0, "line": 0, "count": 0, "tail": 0, "sessions": [], "head": ""}
+
+    def _load_meta(self) -> dict:
+        if not os.path.exists(self.meta_path):
+            return self._empty_meta()
+        with open(self.meta_path, encoding="utf-8") as f:
+            return json.load(f)
+
+    def _head(self) -> str:
+        """Awal file (hex) untuk mendeteksi file log yang diganti."""
+        with open(self.log_path, "rb") as f:
+            return f.read(256).hex()
+
+    def update(self, batch: int = 65_536) -> int:
+        """
+        Index bagian baru file log. Returns jumlah event baru.
+
+        Pesan log lama diawali newline, jadi baris terakhir file biasanya
+        belum diakhiri newline: baris itu tetap di-index sebagai "tail",
+        tapi offset yang disimpan berhenti sebelum baris tersebut sehingga
+        di-parse ulang pada update berikutnya.
+        """
+        meta = self.meta
+        head = self._head()
+        keep = 2 * min(256, meta["offset"])
+        if os.path.getsize(self.log_path) < meta["offset"] or head[:keep] != meta["head"][:keep]:
+            meta = self._empty_meta()       # file diganti / dipotong → index ulang
+        meta["head"] = head
+        indexed_before = meta["count"] + meta["tail"]
+
+        sessions = meta["sessions"]
+        session = len(sessions) - 1
+        offset, line_no = meta["offset"], meta["line"]
+        count, tail = meta["count"], 0
+
+        buf = np.zeros(batch, dtype=EVENT_DTYPE)
+        n = 0
+        with open(self.log_path, "rb") as f, \
+                open(self.events_path, "r+b" if os.path.exists(self.events_path) else "wb") as out:
+            out.truncate(count * EVENT_DTYPE.itemsize)     # buang tail update sebelumnya
+            out.seek(count * EVENT_DTYPE.itemsize)
+            f.seek(offset)
+            for raw in f:
+                complete = raw.endswith(b"\n")
+                parsed = parse_line(raw.decode("utf-8", errors="replace"))
+                if parsed is not None:
+                    kind, fields = parsed
+                    if kind == SESSION and complete:
+                        session += 1
+                        sessions.append({"game": fields["game"], "time": fields["time"],
+                                         "line": line_no, "offset": offset})
+                    buf[n] = (kind, session, line_no, offset, fields.get("new_pull", -1),
+                              fields.get("total", -1), fields.get("value", -1))
+                    n += 1
+                    if complete:
+                        count += 1
+                    else:
+                        tail += 1
+                    if n == batch:
+                        buf.tofile(out)
+                        n = 0
+                if not complete:
+                    break
+                offset += len(raw)
+                line_no += 1
+            buf[:n].tofile(out)
+            out.flush()
+            os.fsync(out.fileno())
+
+        meta.update(offset=offset, line=line_no, count=count, tail=tail)
+        tmp = self.meta_path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+        os.replace(tmp, self.meta_path)
+        self.meta = meta
+        return count + tail - indexed_before
+
+    # ── Query ──
+
+    def events(self) -> np.ndarray:
+        """Semua event ter-index (memmap read-only)."""
+        n = self.meta["count"] + self.meta.get("tail", 0)
+        if n == 0:
+            return np.zeros(0, dtype=EVENT_DTYPE)
+        return np.memmap(self.events_path, dtype=EVENT_DTYPE, mode="r", shape=(n,))
+
+    @property
+    def sessions(self) -> list[dict]:
+        return self.meta["sessions"]
+
+    def _games(self) -> list[str]:
+        return sorted({s["game"] for s in self.sessions})
+
+    def failures_per_game(self) -> dict[str, int]:
+        """Jumlah baris "Kegagalan" per game (event sebelum session pertama → "?")."""
+        ev = self.events()
+        fail = ev[ev["kind"] == FAILURE]
+        per_session = np.bincount(fail["session"] + 1, minlength=len(self.sessions) + 1)
+        counts = {"?": int(per_session[0])} if per_session[0] else {}
+        for s, c in zip(self.sessions, per_session[1:].tolist()):
+            if c:
+                counts[s["game"]] = counts.get(s["game"], 0) + c
+        return counts
+
+    def manual_pulls_per_session(self) -> list[dict]:
+        """Per session: jumlah input manual pull dan total pull yang diminta."""
+        ev = self.events()
+        manual = ev[ev["kind"] == MANUAL_PULL]
+        idx = manual["session"] + 1
+        n = len(self.sessions) + 1
+        counts = np.bincount(idx, minlength=n)
+        pulls = np.bincount(idx, weights=np.maximum(manual["value"], 0), minlength=n)
+        return [
+            dict(s, session=i, manual_pulls=int(counts[i + 1]), pulls_requested=int(pulls[i + 1]))
+            for i, s in enumerate(self.sessions)
+            if counts[i + 1]
+        ]
+
+    def last_failures(self, n: int = 10) -> list[dict]:
+        """n kegagalan terakhir (terbaru dulu) beserta game / session-nya."""
+        ev = self.events()
+        fail = ev[ev["kind"] == FAILURE][-n:][::-1]
+        return [
+            {
+                "line": int(r["line"]), "session": int(r["session"]),
+                "game": self.sessions[r["session"]]["game"] if r["session"] >= 0 else None,
+                "new_pull": int(r["new_pull"]), "total": int(r["total"]),
+            }
+            for r in fail
+        ]
@@ -0,0 +1,117 @@
+# Logger buffered + asynchronous untuk Pull-system.
+#
+# Baris log dikumpulkan di memori dan ditulis oleh thread background
+# (saat buffer penuh atau setiap flush_interval detik), bukan open/write/close
+# per baris. Format default JSONL terstruktur; format "text" menulis pesan
+# lama apa adanya (kompatibel dengan jackpot.txt).
+
+import atexit
+import json
+import threading
+import uuid
+from datetime import datetime
+
+
+class RunLogger:
+    """
+    Logger satu run simulasi.
+
+    Setiap record JSONL berisi: ts, run_id, seed, game, event, phase,
+    message, dan counter tambahan (total_pulls, dll).
+    close() dipanggil otomatis saat exit, jadi tidak ada baris yang hilang.
+    """
+
+    def __init__(self, filename: str = "jackpot.jsonl", fmt: str = "jsonl",
+                 run_id: str | None = None, seed=None, game: str | None = None,
+                 flush_interval: float = 1.0, max_buffer: int = 1000):
+        if fmt not in ("jsonl", "text"):
+            raise ValueError(f"Format log tidak dikenal: {fmt!r} (pilihan: jsonl, text)")
+
+        self.filename       = filename
+        self.fmt            = fmt
+        self.run_id         = run_id or uuid.uuid4().hex[:12]
+        self.seed           = seed
+        self.game           = game
+        self.flush_interval = flush_interval
+        self.max_buffer     = max_buffer
+        self.lines_written  = 0
+        self.bytes_written  = 0
+
+        self._buffer   = []
+        self._lock     = threading.Lock()      # melindungi _buffer
+        self._io_lock  = threading.Lock()      # satu penulis file pada satu waktu
+        self._wake     = threading.Event()
+        self._stop     = threading.Event()
+        self._file     = open(filename, "a", encoding="utf-8")
+        self._closed   = False
+
+        self._thread = threading.Thread(target=self._run, name="gacha-logger", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    # ── API ──
+
+    def log(self, event: str, message: str = "", phase: str | None = None, **fields):
+        """Masukkan satu record ke buffer (tidak menyentuh disk)."""
+        if self.fmt == "text":
+            line = message
+        else:
+            record = {
+                "ts":      datetime.now().isoformat(timespec="milliseconds"),
+                "run_id":  self.run_id,
+                "seed":    self.seed,
+                "game":    self.game,
+                "event":   event,
+                "phase":   phase,
+                "message": message.strip(),
+            }
+            record.update(fields)
+            line = json.dumps(record, ensure_ascii=False, default=int) + "\n"
+
+        with self._lock:
+            self._buffer.append(line)
+            full = len(self._buffer) >= self.max_buffer
+        if full:
+            self._wake.set()
+
+    def flush(self):
+        """Tulis semua isi buffer ke file sekarang."""
+        with self._lock:
+            lines, self._buffer = self._buffer, []
+        if not lines:
+            return
+        data = "".join(lines)
+        with self._io_lock:
+            if self._file.closed:
+                return
+            self._file.write(data)
+            self._file.flush()
+            self.lines_written += len(lines)
+            self.bytes_written += len(data.encode("utf-8"))
+
+    def close(self, timeout: float = 5.0):
+        """Hentikan thread background dan flush sisa buffer."""
+        if self._closed:
+            return
+        self._closed = True
+        self._stop.set()
+        self._wake.set()
+        self._thread.join(timeout)
+        self.flush()
+        with self._io_lock:
+            self._file.close()
+        atexit.unregister(self.close)
+
+    # ── Thread background ──
+
+    def _run(self):
+        while not self._stop.is_set():
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
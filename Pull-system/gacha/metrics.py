@@ -0,0 +1,212 @@
+# Instrumentasi GachaSimulator (CONFIG["metrics"] = True).
+#
+#   - fase   : wall & CPU time per fase (fast, stats, predict, slow, mp, manual)
+#   - section: waktu di dalam fase untuk render (print), log (encode + antrian
+#              logger), checkpoint dan tunggu IPC (ring buffer MP kosong)
+#   - counter: pulls, batches (batch _do_pull / chunk engine), jackpots,
+#              IPC messages (ring read berisi data / hasil worker "processes"),
+#              bytes logged (ditulis logger ke disk)
+#   - pulls/sec bergulir dari sample (waktu, pull kumulatif) dalam window detik
+#
+# Biaya: pulls & jackpots dihitung dari selisih counter simulator di batas
+# fase, jadi hot path hanya menambah `batches`. Section di-wrap sekali saat
+# init, hanya jika memang ada kerja (render tidak di-wrap di mode silent,
+# log hanya jika ada logger). Dengan metrics mati, simulator.metrics = None dan tidak ada yang
+# di-wrap (sama seperti logger = None).
+#
+# Export: Prometheus text format (untuk textfile collector node_exporter)
+# dan snapshot JSON, keduanya ditulis atomic (tmp + rename).
+
+import json
+import os
+import time
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime
+
+
+COUNTERS = {
+    "pulls":        "Total pull yang disimulasikan",
+    "batches":      "Batch _do_pull dan chunk engine yang diterapkan",
+    "jackpots":     "Total jackpot",
+    "ipc_messages": "Pesan IPC dari worker (ring read berisi data / hasil blok)",
+    "bytes_logged": "Byte yang ditulis logger ke disk",
+}
+
+
+class Metrics:
+    """
+    Timer & counter satu simulator. Fase tidak bersarang: phase() di dalam
+    phase lain hanya dihitung oleh yang terluar (mis. pull_manual di dalam
+    menu), section boleh di mana saja.
+    """
+
+    def __init__(self, window: float = 10.0, sample_interval: float = 0.25, labels: dict | None = None):
+        self.window          = window
+        self.sample_interval = sample_interval
+        self.labels          = {k: str(v) for k, v in (labels or {}).items() if v is not None}
+        self.started         = time.time()
+
+        self.pulls        = 0
+        self.batches      = 0
+        self.jackpots     = 0
+        self.ipc_messages = 0
+        self.logger       = None        # RunLogger (bytes_written dibaca saat snapshot)
+
+        self.phases   = {}              # nama → [wall, cpu, calls]
+        self.sections = {}              # nama → [seconds, calls]
+
+        self._current    = None         # (nama, wall0, cpu0, pulls0, jackpots0) fase aktif
+        self._samples    = deque()      # (monotonic, pull kumulatif)
+        self._last_sample = 0.0
+
+    # ── Fase & section ──
+
+    @contextmanager
+    def phase(self, name: str, sim):
+        """Ukur satu fase; pulls / jackpots = selisih counter sim selama fase."""
+        if self._current is not None:
+            yield
+            return
+        self._current = (name, time.perf_counter(), time.process_time(), sim.total_pulls, sim.total_jackpot)
+        try:
+            yield
+        finally:
+            _, wall0, cpu0, pulls0, jackpots0 = self._current
+            stat = self.phases.setdefault(name, [0.0, 0.0, 0])
+            stat[0] += time.perf_counter() - wall0
+            stat[1] += time.process_time() - cpu0
+            stat[2] += 1
+            # Counter sim (bisa numpy int) di-reset saat retry → selisih minimal 0
+            self.pulls += int(max(sim.total_pulls - pulls0, 0))
+            self.jackpots += int(max(sim.total_jackpot - jackpots0, 0))
+            self._current = None
+            self.sample(sim.total_pulls, force=True)
+
+    def add_section(self, name: str, seconds: float):
+        stat = self.sections.setdefault(name, [0.0, 0])
+        stat[0] += seconds
+        stat[1] += 1
+
+    def timed(self, name: str, fn):
+        """Wrap fn supaya waktunya masuk section `name`."""
+        stat = self.sections.setdefault(name, [0.0, 0])
+        clock = time.perf_counter
+
+        def wrapper(*args, **kwargs):
+            start = clock()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                stat[0] += clock() - start
+                stat[1] += 1
+        return wrapper
+
+    # ── Pulls/sec bergulir ──
+
+    def _cumulative_pulls(self, total_pulls: int) -> int:
+        if self._current is None:
+            return self.pulls
+        return self.pulls + int(max(total_pulls - self._current[3], 0))
+
+    def sample(self, total_pulls: int, force: bool = False):
+        """Catat (waktu, pull kumulatif) paling sering sekali per sample_interval."""
+        now = time.monotonic()
+        if not force and now - self._last_sample < self.sample_interval:
+            return
+        self._last_sample = now
+        self._samples.append((now, self._cumulative_pulls(total_pulls)))
+        while len(self._samples) > 2 and now - self._samples[1][0] >= self.window:
+            self._samples.popleft()
+
+    def pulls_per_sec(self) -> float:
+        """Pulls/sec dalam window terakhir (0 jika sample belum cukup)."""
+        if len(self._samples) < 2:
+            return 0.0
+        (t0, p0), (t1, p1) = self._samples[0], self._samples[-1]
+        return (p1 - p0) / (t1 - t0) if t1 > t0 else 0.0
+
+    # ── Export ──
+
+    def snapshot(self, sim=None) -> dict:
+        """Semua metrics sebagai dict JSON-able (sim: ikut hitung fase yang sedang berjalan)."""
+        if sim is not None:
+            self.sample(sim.total_pulls, force=True)
+        phases = {name: {"wall_seconds": w, "cpu_seconds": c, "calls": n}
+                  for name, (w, c, n) in self.phases.items()}
+        if self._current is not None:
+            name, wall0, cpu0, _, _ = self._current
+            live = phases.setdefault(name, {"wall_seconds": 0.0, "cpu_seconds": 0.0, "calls": 0})
+            live["wall_seconds"] += time.perf_counter() - wall0
+            live["cpu_seconds"] += time.process_time() - cpu0
+            live["running"] = True
+        counters = {
+            "pulls":        self._cumulative_pulls(sim.total_pulls) if sim is not None else self.pulls,
+            "batches":      self.batches,
+            "jackpots":     self.jackpots + (int(max(sim.total_jackpot - self._current[4], 0))
+                                             if sim is not None and self._current is not None else 0),
+            "ipc_messages": self.ipc_messages,
+            "bytes_logged": self.logger.bytes_written if self.logger is not None else 0,
+        }
+        return {
+            "ts":             datetime.now().isoformat(timespec="milliseconds"),
+            "labels":         self.labels,
+            "uptime_seconds": time.time() - self.started,
+            "phase":          self._current[0] if self._current is not None else None,
+            "phases":         phases,
+            "sections":       {name: {"seconds": s, "calls": n} for name, (s, n) in self.sections.items()},
+            "counters":       counters,
+            "pulls_per_sec":  self.pulls_per_sec(),
+            "window_seconds": self.window,
+        }
+
+    def to_prometheus(self, sim=None, prefix: str = "gacha") -> str:
+        """Snapshot dalam Prometheus text exposition format."""
+        snap = self.snapshot(sim)
+        lines = []
+
+        def label_str(extra: dict | None = None) -> str:
+            labels = dict(self.labels, **(extra or {}))
+            if not labels:
+                return ""
+            body = ",".join(f'{k}="{_escape(v)}"' for k, v in labels.items())
+            return "{" + body + "}"
+
+        def metric(name, kind, help_text, samples):
+            lines.append(f"# HELP {prefix}_{name} {help_text}")
+            lines.append(f"# TYPE {prefix}_{name} {kind}")
+            for extra, value in samples:
+                lines.append(f"{prefix}_{name}{label_str(extra)} {value}")
+
+        for key, help_text in COUNTERS.items():
+            metric(f"{key}_total", "counter", help_text, [(None, snap["counters"][key])])
+        metric("phase_wall_seconds_total", "counter", "Wall time per fase",
+               [({"phase": p}, s["wall_seconds"]) for p, s in snap["phases"].items()])
+        metric("phase_cpu_seconds_total", "counter", "CPU time proses per fase",
+               [({"phase": p}, s["cpu_seconds"]) for p, s in snap["phases"].items()])
+        metric("phase_runs_total", "counter", "Banyak fase selesai",
+               [({"phase": p}, s["calls"]) for p, s in snap["phases"].items()])
+        metric("section_seconds_total", "counter", "Waktu per section (render, log, checkpoint, ipc_wait)",
+               [({"section": k}, s["seconds"]) for k, s in snap["sections"].items()])
+        metric("pulls_per_second", "gauge", f"Pulls/sec bergulir ({self.window:g} detik)",
+               [(None, snap["pulls_per_sec"])])
+        metric("uptime_seconds", "gauge", "Detik sejak simulator dibuat", [(None, snap["uptime_seconds"])])
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path: str, sim=None):
+        _atomic_write(path, self.to_prometheus(sim))
+
+    def write_json(self, path: str, sim=None):
+        _atomic_write(path, json.dumps(self.snapshot(sim), indent=2) + "\n")
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _atomic_write(path: str, text: str):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp = f"{path}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(tmp, path)
@@ -0,0 +1,117 @@
+# Estimator MLE incremental untuk distribusi geometric jarak jackpot.
+# Update O(1) per jackpot, tabel percentile vektor, dan confidence interval
+# (analitik / bootstrap parametrik) untuk p_hat dan prediksi percentile.
+
+from statistics import NormalDist
+
+import numpy as np
+
+
+class GeometricMLE:
+    """
+    MLE geometric: p_hat = jumlah_jackpot / total_jarak.
+
+    Hanya menyimpan (count, total), jadi bisa di-query terus-menerus
+    tanpa membaca ulang data jarak jackpot.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0
+
+    @classmethod
+    def from_distances(cls, distances) -> "GeometricMLE":
+        """Bangun dari list / array jarak jackpot (nilai <= 0 diabaikan)."""
+        mle = cls()
+        arr = np.asarray(distances, dtype=np.int64)
+        mle.update(arr[arr > 0])
+        return mle
+
+    # ── Update ──
+
+    def add(self, distance: int):
+        self.count += 1
+        self.total += int(distance)
+
+    def update(self, distances):
+        distances = np.asarray(distances, dtype=np.int64)
+        self.count += distances.size
+        self.total += int(distances.sum())
+
+    def add_summary(self, count: int, total: int):
+        """Tambah ringkasan (jumlah_jackpot, total_jarak) tanpa data mentah."""
+        self.count += count
+        self.total += total
+
+    # ── Estimasi ──
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    @property
+    def p_hat(self) -> float:
+        return self.count / self.total if self.total else 0.0
+
+    @staticmethod
+    def _quantile(p, confidence):
+        """Pull minimum agar P(jackpot dalam n pull) >= confidence (vektor)."""
+        p = np.asarray(p, dtype=float)
+        confidence = np.asarray(confidence, dtype=float)
+        return np.ceil(np.log(1 - confidence) / np.log(1 - p)).astype(np.int64)
+
+    def percentiles(self, levels) -> np.ndarray:
+        """Tabel percentile untuk banyak confidence level sekaligus."""
+        return self._quantile(self.p_hat, levels)
+
+    def predict(self, levels) -> dict:
+        """{confidence: pulls} untuk setiap level."""
+        return dict(zip(levels, self.percentiles(levels).tolist()))
+
+    # ── Confidence interval ──
+
+    def ci_p_hat(self, level: float = 0.95, method: str = "analytic",
+                 n_boot: int = 2000, rng: np.random.Generator | None = None) -> tuple[float, float]:
+        """
+        CI untuk p_hat.
+          analytic  : Wald, se = p * sqrt((1 - p) / n)  (Fisher information)
+          bootstrap : parametrik, total* = n + NegBin(n, p_hat)
+        """
+        if self.count == 0:
+            return (0.0, 0.0)
+        p = self.p_hat
+        alpha = 1 - level
+
+        if method == "analytic":
+            z = NormalDist().inv_cdf(1 - alpha / 2)
+            se = p * float(np.sqrt((1 - p) / self.count))
+            return (max(p - z * se, 1e-12), min(p + z * se, 1.0 - 1e-12))
+
+        if method == "bootstrap":
+            p_boot = self._bootstrap_p(n_boot, rng)
+            lo, hi = np.quantile(p_boot, [alpha / 2, 1 - alpha / 2])
+            return (float(lo), float(hi))
+
+        raise ValueError(f"Metode CI tidak dikenal: {method!r}")
+
+    def ci_percentile(self, confidence: float, level: float = 0.95, method: str = "analytic",
+                      n_boot: int = 2000, rng: np.random.Generator | None = None) -> tuple[int, int]:
+        """
+        CI untuk prediksi percentile (mis. p100_pred). Percentile turun
+        monoton terhadap p, jadi batas bawah dari p_hi dan batas atas dari p_lo.
+        """
+        if self.count == 0:
+            return (0, 0)
+        if method == "bootstrap":
+            preds = self._quantile(self._bootstrap_p(n_boot, rng), confidence)
+            alpha = 1 - level
+            lo, hi = np.quantile(preds, [alpha / 2, 1 - alpha / 2])
+            return (int(lo), int(np.ceil(hi)))
+
+        p_lo, p_hi = self.ci_p_hat(level, method)
+        return (int(self._quantile(p_hi, confidence)), int(self._quantile(p_lo, confidence)))
+
+    def _bootstrap_p(self, n_boot: int, rng: np.random.Generator | None) -> np.ndarray:
+        rng = rng or np.random.default_rng()
+        totals = self.count + rng.negative_binomial(self.count, self.p_hat, size=n_boot)
+        return self.count / totals
@@ -0,0 +1,134 @@
+# Worker pool multiprocessing yang hidup lama (dipakai ulang antar siklus
+# retry dan antar automatic pull dari menu interaktif).
+#
+# Flag stop/cancel adalah mp.RawValue (tanpa Manager) yang diwariskan ke
+# worker lewat initializer, ring buffer shared memory dibuat sekali per worker.
+
+import signal
+import threading
+import time
+import multiprocessing as mp
+
+from .shm import ShmRingBuffer
+
+
+# Flag bersama di sisi worker (diisi oleh _init_worker)
+_STOP = None      # target streak untuk berhenti (0 = belum ditentukan)
+_CANCEL = None    # 1 = semua worker berhenti secepatnya
+
+
+def _init_worker(stop_value, cancel_flag):
+    """Initializer pool: simpan flag bersama, Ctrl-C hanya ditangani parent."""
+    global _STOP, _CANCEL
+    _STOP = stop_value
+    _CANCEL = cancel_flag
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+
+def worker_flags():
+    """Dipanggil di dalam worker: (stop_value, cancel_flag)."""
+    return _STOP, _CANCEL
+
+
+class PersistentPool:
+    """
+    mp.Pool + flag bersama + satu ring buffer per worker.
+
+    Proses worker (beserta import numpy / compile numba) dibuat sekali,
+    lalu setiap job baru cukup reset() dan submit().
+    start_method: "fork" / "forkserver" / "spawn" (None = default platform).
+    """
+
+    def __init__(self, processes: int, ring_capacity: int = 1 << 16, start_method: str | None = None):
+        self.processes     = processes
+        self.ring_capacity = ring_capacity
+        self._ctx          = mp.get_context(start_method)
+        self.stop_value    = self._ctx.RawValue("q", 0)
+        self.cancel_flag   = self._ctx.RawValue("b", 0)
+        self.rings         = [ShmRingBuffer(ring_capacity) for _ in range(processes)]
+        self.lock          = threading.Lock()   # satu job pada satu waktu (profile bersamaan)
+        self._pool         = None
+        self._results      = []
+        self._pids         = set()
+
+    @property
+    def alive(self) -> bool:
+        return self._pool is not None
+
+    def _ensure_pool(self):
+        if self._pool is None:
+            self._pool = self._ctx.Pool(
+                self.processes, initializer=_init_worker,
+                initargs=(self.stop_value, self.cancel_flag),
+            )
+
+    def reset(self):
+        """Siapkan job baru: flag = 0, semua ring kosong."""
+        self.stop_value.value = 0
+        self.cancel_flag.value = 0
+        for ring in self.rings:
+            ring.reset()
+
+    def submit(self, func, args_list: list):
+        """Jalankan func(args) untuk setiap args di worker yang sudah hangat."""
+        self._ensure_pool()
+        self._results = [self._pool.apply_async(func, (a,)) for a in args_list]
+        # mp.Pool mengganti worker yang mati diam-diam (AsyncResult-nya tidak
+        # pernah selesai), jadi pid worker dicatat untuk failure()
+        self._pids = {p.pid for p in self._pool._pool}
+        return self._results
+
+    def failure(self) -> BaseException | None:
+        """
+        Exception job yang sedang berjalan: worker yang raise, atau worker
+        yang mati (dibunuh / crash) sebelum selesai. None jika semua sehat.
+        """
+        for res in self._results:
+            if res.ready() and not res.successful():
+                try:
+                    res.get(0)
+                except Exception as exc:
+                    return exc
+        if self._pool is not None and not all(res.ready() for res in self._results):
+            alive = {p.pid for p in self._pool._pool if p.exitcode is None}
+            if not self._pids <= alive:
+                return RuntimeError("worker MP mati sebelum selesai (dibunuh / crash)")
+        return None
+
+    def cancel(self):
+        self.cancel_flag.value = 1
+
+    def wait(self, timeout: float) -> bool:
+        """
+        Tunggu job selesai maksimal timeout detik. Jika masih ada worker
+        yang jalan, pool di-terminate (akan dibuat ulang pada submit berikutnya).
+        Returns True jika semua worker selesai normal.
+        """
+        deadline = time.time() + timeout
+        for res in self._results:
+            res.wait(max(0.0, deadline - time.time()))
+
+        if all(res.ready() for res in self._results):
+            return True
+
+        self._pool.terminate()
+        self._pool.join()
+        self._pool = None
+        return False
+
+    def close(self):
+        """Matikan worker dan lepaskan shared memory."""
+        if self._pool is not None:
+            self.cancel()
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+        for ring in self.rings:
+            ring.close()
+        self.rings = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
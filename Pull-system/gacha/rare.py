@@ -0,0 +1,124 @@
+# Estimasi peluang event langka (drought panjang) dengan importance sampling.
+#
+# Jarak jackpot D ~ Geometric(p) di {1, 2, ...}. Event yang dikejar fase
+# lambat — streak bertahan sampai p100_pred, atau drought >= min_percobaan —
+# adalah ekor P(D >= n) yang sangat kecil, jadi Monte Carlo biasa butuh
+# ~1/P sampel. Di sini D di-sample dari distribusi yang di-tilt secara
+# eksponensial (tetap geometric, p' = 1 / n sehingga event jadi "biasa"),
+# lalu setiap sampel diberi bobot likelihood ratio f_p(D) / f_p'(D).
+
+from statistics import NormalDist
+
+import numpy as np
+
+from .mle import GeometricMLE
+
+
+def tilted_probability(p: float, n: int) -> float:
+    """
+    p' hasil exponential tilting f_θ(d) ∝ e^(θd) f_p(d), dengan θ dipilih
+    supaya E_θ[D] = n. Jika event tidak langka (n * p <= 1), p' = p.
+    """
+    return min(p, 1.0 / n) if n > 1 else p
+
+
+def log_likelihood_ratio(d, p: float, p_tilt: float) -> np.ndarray:
+    """log f_p(d) - log f_p'(d) untuk geometric di {1, 2, ...}."""
+    d = np.asarray(d, dtype=np.float64)
+    return (np.log(p) - np.log(p_tilt)) + (d - 1) * (np.log1p(-p) - np.log1p(-p_tilt))
+
+
+def exact_tail(p: float, n: int) -> float:
+    """P(D >= n) = (1 - p)^(n - 1)."""
+    return float(np.exp((n - 1) * np.log1p(-p)))
+
+
+def _summarize(values: np.ndarray, pulls: int, p: float, n: int, p_tilt: float,
+               level: float) -> dict:
+    n_samples = values.size
+    estimate = float(values.mean())
+    variance = float(values.var(ddof=1)) / n_samples if n_samples > 1 else float("inf")
+    std_error = variance ** 0.5
+    z = NormalDist().inv_cdf(0.5 + level / 2)
+    # Effective sample size bobot (Kish) — rendah berarti proposal buruk
+    w_sum = values.sum()
+    ess = float(w_sum ** 2 / (values ** 2).sum()) if w_sum > 0 else 0.0
+    return {
+        "estimate":   estimate,
+        "variance":   variance,
+        "std_error":  std_error,
+        "rel_error":  std_error / estimate if estimate > 0 else float("inf"),
+        "ci":         (max(estimate - z * std_error, 0.0), estimate + z * std_error),
+        "exact":      exact_tail(p, n),
+        "n_samples":  n_samples,
+        "pulls":      int(pulls),
+        "ess":        ess,
+        "p":          p,
+        "p_tilt":     p_tilt,
+        "threshold":  n,
+    }
+
+
+def tail_probability_is(p: float, n: int, n_samples: int = 10_000, rng=None,
+                        p_tilt: float | None = None, level: float = 0.95) -> dict:
+    """
+    Importance sampling P(D >= n).
+
+    Estimator: mean( 1{D' >= n} * w(D') ), D' ~ Geometric(p'), w = f_p / f_p'.
+    Varians = var(sampel berbobot) / n_samples. "pulls" = total pull yang
+    benar-benar disimulasikan (Σ D').
+    """
+    rng = rng or np.random.default_rng()
+    p_tilt = p_tilt or tilted_probability(p, n)
+    d = rng.geometric(p_tilt, size=n_samples)
+    values = np.where(d >= n, np.exp(log_likelihood_ratio(d, p, p_tilt)), 0.0)
+    return _summarize(values, d.sum(dtype=np.int64), p, n, p_tilt, level)
+
+
+def tail_probability_mc(p: float, n: int, n_samples: int = 10_000, rng=None,
+                        level: float = 0.95) -> dict:
+    """Monte Carlo biasa (pembanding): mean( 1{D >= n} ), D ~ Geometric(p)."""
+    rng = rng or np.random.default_rng()
+    d = rng.geometric(p, size=n_samples)
+    values = (d >= n).astype(np.float64)
+    return _summarize(values, d.sum(dtype=np.int64), p, n, p, level)
+
+
+def samples_for_precision(p: float, n: int, rel_error: float = 0.01, method: str = "is") -> float:
+    """
+    Jumlah sampel (dan dengan itu pull) yang dibutuhkan untuk rel_error
+    tertentu, dari varians teoritis per sampel.
+      mc : var = P(1 - P)
+      is : var = E_p'[w² 1{D>=n}] - P²  (closed form untuk proposal geometric)
+    """
+    P = exact_tail(p, n)
+    if method == "mc":
+        var = P * (1 - P)
+    elif method == "is":
+        q = tilted_probability(p, n)
+        # E_p'[w²; D >= n] = Σ_{d>=n} f_p(d)² / f_p'(d)
+        #                  = (p² / q) * r^(n-1) / (1 - r),  r = (1-p)² / (1-q)
+        r = (1 - p) ** 2 / (1 - q)
+        second = (p * p / q) * np.exp((n - 1) * np.log(r)) / (1 - r)
+        var = max(second - P * P, 0.0)
+    else:
+        raise ValueError(f"Metode tidak dikenal: {method!r} (pilihan: is, mc)")
+    return var / (rel_error * P) ** 2
+
+
+def predict_tail_probabilities(source, thresholds, n_samples: int = 10_000, rng=None) -> dict:
+    """
+    P(drought >= n) untuk setiap n di thresholds, dengan p dari
+    GeometricMLE / list jarak jackpot (seperti predict_next_jackpot_mle)
+    atau langsung berupa float p.
+    Returns {n: hasil tail_probability_is}.
+    """
+    if isinstance(source, (float, int)) and not isinstance(source, bool):
+        p = float(source)
+    else:
+        mle = source if isinstance(source, GeometricMLE) else GeometricMLE.from_distances(source)
+        p = mle.p_hat
+    if not 0 < p < 1:
+        raise ValueError("p harus di antara 0 dan 1 (data jackpot kosong?)")
+    rng = rng or np.random.default_rng()
+    return {int(n): tail_probability_is(p, int(n), n_samples, rng) for n in thresholds}
@@ -0,0 +1,87 @@
+# Renderer terminal untuk Pull-system.
+#
+# Core simulasi hanya meng-update counter; renderer yang memutuskan apa
+# yang tampil di layar:
+#   - "silent"    : tidak ada output (sweep / headless)
+#   - "dashboard" : satu panel yang di-refresh dengan rate tetap (ANSI cursor,
+#                   tanpa subprocess `clear`)
+#   - "verbose"   : perilaku lama, semua baris per pull / per batch tampil
+
+import sys
+import time
+
+
+ANSI_HOME_CLEAR = "\033[H\033[J"     # kursor ke pojok kiri atas + hapus ke bawah
+ANSI_CLEAR_ALL  = "\033[2J\033[H"
+
+RENDER_MODES = ("silent", "dashboard", "verbose")
+
+
+class Renderer:
+    """
+    source: callable tanpa argumen → (judul, dict label → nilai).
+    Dipanggil hanya saat dashboard benar-benar digambar (sampling).
+    """
+
+    def __init__(self, mode: str = "verbose", refresh_hz: float = 4.0, stream=None):
+        if mode not in RENDER_MODES:
+            raise ValueError(f"Mode renderer tidak dikenal: {mode!r} (pilihan: {', '.join(RENDER_MODES)})")
+        self.mode      = mode
+        self.verbose   = mode == "verbose"
+        self.silent    = mode == "silent"
+        self.dashboard = mode == "dashboard"
+        self.interval  = 1.0 / refresh_hz
+        self.stream    = stream or sys.stdout
+        self._source   = None
+        self._last     = 0.0
+        self._last_pulls = None
+        self._last_time  = None
+
+    def attach(self, source):
+        self._source = source
+
+    # ── Output teks ──
+
+    def message(self, *args, **kwargs):
+        """Pesan penting (jackpot, pergantian fase, ringkasan): semua mode kecuali silent."""
+        if not self.silent:
+            print(*args, file=self.stream, **kwargs)
+
+    def clear(self):
+        if not self.silent:
+            self.stream.write(ANSI_CLEAR_ALL)
+            self.stream.flush()
+
+    # ── Dashboard ──
+
+    def tick(self, force: bool = False):
+        """Gambar ulang dashboard jika sudah waktunya (murah jika belum)."""
+        if not self.dashboard or self._source is None:
+            return
+        now = time.monotonic()
+        if not force and now - self._last < self.interval:
+            return
+        self._last = now
+        self._draw(now)
+
+    def _draw(self, now: float):
+        title, fields = self._source()
+
+        # Pulls/sec bergulir dari selisih antar gambar
+        pulls = fields.get("Total pull")
+        rate = None
+        if isinstance(pulls, int) and self._last_pulls is not None and now > self._last_time:
+            rate = (pulls - self._last_pulls) / (now - self._last_time)
+        if isinstance(pulls, int):
+            self._last_pulls, self._last_time = pulls, now
+
+        width = max(len(label) for label in fields) if fields else 0
+        lines = [f"=====================>  {title}  <====================", ""]
+        for label, value in fields.items():
+            value = f"{value:,}" if isinstance(value, int) else value
+            lines.append(f"{label:<{width}} : {value}")
+        if rate is not None:
+            lines.append(f"{'Pulls/sec':<{width}} : {rate:,.0f}")
+
+        self.stream.write(ANSI_HOME_CLEAR + "\n".join(lines) + "\n")
+        self.stream.flush()
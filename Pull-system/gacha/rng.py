@@ -0,0 +1,62 @@
+# RNG layer untuk Pull-system: np.random.Generator + SeedSequence.
+# Semua script simulasi mengambil random number dari sini, bukan dari
+# state global legacy np.random.
+
+import numpy as np
+
+
+# Bit generator yang bisa dipilih lewat CONFIG["rng_bit_generator"]
+BIT_GENERATORS = {
+    "PCG64":     np.random.PCG64,
+    "PCG64DXSM": np.random.PCG64DXSM,
+    "SFC64":     np.random.SFC64,
+    "Philox":    np.random.Philox,
+}
+
+
+def make_generator(bit_generator: str, seed_seq: np.random.SeedSequence) -> np.random.Generator:
+    """Bangun Generator dari nama bit generator dan SeedSequence."""
+    try:
+        bit_gen_cls = BIT_GENERATORS[bit_generator]
+    except KeyError:
+        raise ValueError(
+            f"Bit generator tidak dikenal: {bit_generator!r} "
+            f"(pilihan: {', '.join(BIT_GENERATORS)})"
+        ) from None
+    return np.random.Generator(bit_gen_cls(seed_seq))
+
+
+class RNGBackend:
+    """
+    Sumber random untuk satu run simulasi.
+
+    Root seed selalu dicatat (self.root_seed) supaya run bisa diulang.
+    Worker multiprocessing mendapat child SeedSequence dari spawn(),
+    sehingga stream antar worker independen secara statistik.
+    """
+
+    def __init__(self, bit_generator: str = "PCG64",
+                 seed: int | np.random.SeedSequence | None = None):
+        self.bit_generator = bit_generator
+        # SeedSequence langsung dipakai (mis. seed per run dari sweep)
+        if isinstance(seed, np.random.SeedSequence):
+            self.seed_seq = seed
+        else:
+            self.seed_seq = np.random.SeedSequence(seed)
+        self.root_seed     = self.seed_seq.entropy    # entropy OS jika seed=None
+        self.generator     = make_generator(bit_generator, self.seed_seq)
+
+    def spawn(self, n: int) -> list[np.random.SeedSequence]:
+        """Buat n child SeedSequence untuk worker (picklable)."""
+        return self.seed_seq.spawn(n)
+
+    def spawn_generators(self, n: int) -> list[np.random.Generator]:
+        """Buat n Generator independen dengan bit generator yang sama."""
+        return [make_generator(self.bit_generator, s) for s in self.spawn(n)]
+
+    def numba_seeds(self, n: int | None = None):
+        """Seed 32-bit untuk state internal numba (tidak bisa pakai Generator di prange)."""
+        return self.generator.integers(0, 2**31 - 1, size=n, dtype=np.int64)
+
+    def describe(self) -> str:
+        return f"{self.bit_generator} (root seed: {self.root_seed})"
@@ -0,0 +1,126 @@
+# Ring buffer di shared memory untuk mengirim jarak jackpot dari worker
+# multiprocessing ke parent secara batch (tanpa IPC per jackpot).
+#
+# Satu ring = satu producer (worker) + satu consumer (parent).
+# Layout int64: [write_pos, read_pos, pulls_done, done, streak, data ...]
+# write_pos / read_pos adalah counter monotonic (tidak di-modulo).
+
+import time
+from multiprocessing import shared_memory
+
+import numpy as np
+
+
+_HEADER      = 5
+_WRITE_POS   = 0
+_READ_POS    = 1
+_PULLS_DONE  = 2
+_DONE        = 3
+_STREAK      = 4
+
+
+class ShmRingBuffer:
+    """
+    Ring buffer int64 di multiprocessing.shared_memory.
+
+    Parent membuat ring (name=None), worker attach dengan name + capacity
+    yang sama; unlink hanya dilakukan parent. Worker hanya menulis
+    write_pos / pulls_done / done / streak, parent hanya menulis read_pos,
+    jadi tidak perlu lock.
+    """
+
+    def __init__(self, capacity: int = 1 << 16, name: str | None = None):
+        self.capacity = capacity
+        self._owner = name is None
+        self.shm = shared_memory.SharedMemory(
+            name=name, create=self._owner, size=(_HEADER + capacity) * 8
+        )
+
+        buf = np.ndarray((_HEADER + capacity,), dtype=np.int64, buffer=self.shm.buf)
+        self._header = buf[:_HEADER]
+        self._data = buf[_HEADER:]
+        if self._owner:
+            self._header[:] = 0
+
+    @property
+    def name(self) -> str:
+        return self.shm.name
+
+    def reset(self):
+        """Kosongkan ring untuk job baru (hanya saat worker tidak menulis)."""
+        self._header[:] = 0
+
+    # ── Sisi worker (producer) ──
+
+    def write(self, values: np.ndarray) -> int:
+        """Tulis sebanyak mungkin yang muat. Returns jumlah yang ditulis."""
+        w = int(self._header[_WRITE_POS])
+        free = self.capacity - (w - int(self._header[_READ_POS]))
+        n = min(len(values), free)
+        if n <= 0:
+            return 0
+
+        start = w % self.capacity
+        first = min(n, self.capacity - start)
+        self._data[start:start + first] = values[:first]
+        if n > first:
+            self._data[:n - first] = values[first:n]
+
+        # Data ditulis dulu, baru posisi dipublikasikan
+        self._header[_WRITE_POS] = w + n
+        return n
+
+    def push(self, values: np.ndarray, poll: float = 0.001):
+        """Tulis semua values; tunggu parent membaca jika ring penuh."""
+        sent = 0
+        while sent < len(values):
+            n = self.write(values[sent:])
+            sent += n
+            if n == 0:
+                time.sleep(poll)
+
+    def set_pulls(self, pulls_done: int):
+        self._header[_PULLS_DONE] = pulls_done
+
+    def set_streak(self, streak: int):
+        self._header[_STREAK] = streak
+
+    def mark_done(self):
+        self._header[_DONE] = 1
+
+    # ── Sisi parent (consumer) ──
+
+    def read(self) -> np.ndarray:
+        """Ambil (copy) semua data yang tersedia."""
+        r = int(self._header[_READ_POS])
+        n = int(self._header[_WRITE_POS]) - r
+        if n <= 0:
+            return np.empty(0, dtype=np.int64)
+
+        start = r % self.capacity
+        first = min(n, self.capacity - start)
+        if n > first:
+            out = np.concatenate((self._data[start:], self._data[:n - first]))
+        else:
+            out = self._data[start:start + n].copy()
+
+        self._header[_READ_POS] = r + n
+        return out
+
+    @property
+    def pulls_done(self) -> int:
+        return int(self._header[_PULLS_DONE])
+
+    @property
+    def streak(self) -> int:
+        return int(self._header[_STREAK])
+
+    @property
+    def done(self) -> bool:
+        return bool(self._header[_DONE])
+
+    def close(self):
+        self._header = self._data = None
+        self.shm.close()
+        if self._owner:
+            self.shm.unlink()
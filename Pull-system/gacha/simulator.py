@@ -0,0 +1,1006 @@
+# GachaSimulator: state satu simulasi (fase cepat → prediksi MLE → fase
+# lambat) + menu interaktif. Konfigurasi datang dari gacha.config
+# (DEFAULT_CONFIG / profile), engine fase cepat dari gacha.engines.
+
+import json
+import os
+import threading
+import time
+from contextlib import nullcontext
+from datetime import datetime
+
+import numpy as np
+import multiprocessing as mp
+
+from .archive import JackpotArchive
+from .buffer import DistanceBuffer
+from .checkpoint import Checkpointer
+from .engines import PullEngine, make_engine
+from .kernels import _mp_worker
+from .logger import RunLogger
+from .metrics import Metrics
+from .mle import GeometricMLE
+from .pool import PersistentPool
+from .render import Renderer
+from .rng import RNGBackend
+from .startup import format_report, mark, startup_report
+from .stats import JackpotStats
+
+
+# ╔══════════════════════════════════════════════════════════════════════════════╗
+# ║                          PREDIKSI MLE (Geometric)                          ║
+# ╚══════════════════════════════════════════════════════════════════════════════╝
+
+# Level confidence yang ditampilkan (p100 = confidence_target dari CONFIG)
+PREDICTION_LEVELS = {
+    "median_pred": 0.50,
+    "p90_pred":    0.90,
+    "p95_pred":    0.95,
+    "p98_pred":    0.98,
+    "p99_pred":    0.99,
+    "p999_pred":   0.999,
+    "p100_pred":   None,      # target utama
+    "p101_pred":   0.99999,
+    "p102_pred":   0.99999,
+}
+
+
+def predict_next_jackpot_mle(jackpot_distances, confidence_target: float, jarak_jackpot: int = 0,
+                             show: bool = True) -> dict | None:
+    """
+    Prediksi jarak pull sampai jackpot berikutnya menggunakan MLE
+    pada distribusi geometric, berdasarkan data jarak jackpot sebelumnya.
+
+    jackpot_distances: GeometricMLE (incremental, O(1)) atau list jarak jackpot.
+    show: False = hanya hitung, tanpa print ringkasan.
+
+    Returns dict berisi semua prediksi percentile, atau None jika data kosong.
+    """
+    if isinstance(jackpot_distances, GeometricMLE):
+        mle = jackpot_distances
+    else:
+        mle = GeometricMLE.from_distances(jackpot_distances)
+    if mle.count == 0:
+        if show:
+            print("❌ Data jackpot kosong, tidak bisa prediksi.")
+        return None
+
+    # MLE estimate: p_hat = 1 / rata-rata jarak
+    mean_k = mle.mean
+    p_hat = mle.p_hat
+
+    # Hitung semua level prediksi sekaligus (vektor)
+    levels = [confidence_target if c is None else c for c in PREDICTION_LEVELS.values()]
+    table = mle.percentiles(levels).tolist()
+
+    preds = {"p_hat": p_hat, "mean_pred": int(round(mean_k))}
+    preds.update(zip(PREDICTION_LEVELS, table))
+    preds["p_hat_ci"] = mle.ci_p_hat(0.95)
+    preds["p100_ci"] = mle.ci_percentile(confidence_target, 0.95)
+
+    if not show:
+        return preds
+
+    # Tampilkan ringkasan
+    print("\n🎯 Prediksi Jackpot Berikutnya (MLE):")
+    print(f"- p̂ (peluang jackpot per pull): {p_hat:.6f} ({p_hat * 100:.4f}%)")
+    print(f"- Rata-rata pulls sampai jackpot berikutnya : {preds['mean_pred']:,}")
+    print(f"- Median pulls (50% kasus)                : {preds['median_pred']:,}")
+    print(f"- 90% kemungkinan ≤                        : {preds['p90_pred']:,}")
+    print(f"- 95% kemungkinan ≤                        : {preds['p95_pred']:,}")
+    print(f"- 98% kemungkinan ≤                        : {preds['p98_pred']:,}")
+    print(f"- 99% kemungkinan ≤                        : {preds['p99_pred']:,}")
+    print(f"- 99.09% kemungkinan ≤                       : {preds['p999_pred']:,}")
+    print(f"- 99.99% kemungkinan ≤                    ------>    : {preds['p100_pred']:,}")
+    print(f"- 99.999% kemungkinan ≤                       : {preds['p101_pred']:,}  ---- Kurang : + {jarak_jackpot - preds['p101_pred']}")
+    print(f"- 99.9999% kemungkinan ≤                       : {preds['p102_pred']:,}  ---- Kurang : + {jarak_jackpot - preds['p102_pred']}")
+    print(f"p100 : {preds['p100_pred']:,}")
+    print(f"- CI 95% p̂   : {preds['p_hat_ci'][0]:.6f} – {preds['p_hat_ci'][1]:.6f}")
+    print(f"- CI 95% p100 : {preds['p100_ci'][0]:,} – {preds['p100_ci'][1]:,}")
+
+    return preds
+
+
+# ╔══════════════════════════════════════════════════════════════════════════════╗
+# ║                            GACHA SIMULATOR CLASS                           ║
+# ╚══════════════════════════════════════════════════════════════════════════════╝
+
+class GachaSimulator:
+    """
+    Encapsulasi semua state simulasi gacha.
+    Menggantikan semua global variable dari versi original.
+    """
+
+    def __init__(self, config: dict, worker_pool: PersistentPool | None = None):
+        # ── Konfigurasi (read-only setelah init) ──
+        self.game_name        = config["game_name"]
+        self.profile          = config.get("profile")
+        self.prob             = config["probability"]
+        self.target           = config["min_percobaan"]       # nilai_N
+        self.batch_fast       = config["batch_size_fast"]     # batch_size
+        self.batch_slow       = config["batch_size_slow"]     # a_little_batch_size
+        self.batch_single     = config["batch_size_single"]   # little_batch_size (1)
+        self.pull_method      = config["pull_method"]
+        self.fast_engine      = config.get("fast_engine", "geometric")
+        self.fast_threshold   = self.target - 10          # stop fase cepat (semua engine)
+        self.mp_ring_capacity = config.get("mp_ring_capacity", 1 << 16)
+        self.mp_flush_size    = config.get("mp_flush_size", 1024)
+        self.mp_check_every   = config.get("mp_stop_check_every", 16)
+        self.mp_timeout       = config.get("mp_timeout")
+        self.mp_shutdown_timeout = config.get("mp_shutdown_timeout", 5.0)
+        self.mp_start_method  = config.get("mp_start_method")
+        self.confidence       = config["confidence_target"]   # pp100
+        self.log_interval     = config["log_interval"]
+        self.enable_auto_menu = config["enable_auto_pull_menu"]
+        self._config          = config
+
+        # ── Engine fase cepat (dibuat saat pertama dipakai; "auto" = kalibrasi) ──
+        # jit_warmup: engine dibuat + di-compile di thread background saat menu
+        self.engine: PullEngine | None = None
+        self.jit_warmup       = config.get("jit_warmup", True)
+        self.warmup_seconds   = None
+        self._engine_lock     = threading.Lock()
+        self._warmup_thread   = None
+
+        # ── Worker pool MP (dibuat saat pertama dipakai, hidup antar retry) ──
+        # Pool dari luar (dipakai bersama beberapa profile) tidak ditutup di close()
+        self.worker_pool = worker_pool
+        self._owns_pool  = worker_pool is None
+
+        # ── Sumber random (Generator + SeedSequence, root seed dicatat) ──
+        self.rng_backend = RNGBackend(
+            config.get("rng_bit_generator", "PCG64"), config.get("rng_seed")
+        )
+        self.rng = self.rng_backend.generator
+
+        # ── Renderer terminal (silent / dashboard / verbose) ──
+        self.renderer = Renderer(config.get("render_mode", "verbose"), config.get("render_refresh_hz", 4))
+        self.renderer.attach(self._dashboard_snapshot)
+        self._say = self.renderer.message
+        self.phase = "idle"
+        self.mp_pulls_per_sec = 0.0     # throughput job MP terakhir
+
+        # ── Logger buffered (thread background, JSONL) ──
+        self.logger = None
+        if config.get("log_file"):
+            self.logger = RunLogger(
+                config["log_file"], config.get("log_format", "jsonl"),
+                seed=self.rng_backend.root_seed, game=self.game_name,
+                flush_interval=config.get("log_flush_interval", 1.0),
+                max_buffer=config.get("log_max_buffer", 1000),
+            )
+
+        # ── Arsip jarak jackpot lintas run (satu record per siklus) ──
+        self.archive = JackpotArchive(config["archive_dir"]) if config.get("archive_dir") else None
+        self._cycle_started = datetime.now()
+
+        # ── Checkpoint periodik (state.json + file jarak uint32) ──
+        self.checkpointer = None
+        if config.get("checkpoint_dir"):
+            self.checkpointer = Checkpointer(config["checkpoint_dir"], config.get("checkpoint_interval", 60.0))
+        self._resume_phase = None   # fase yang dilanjutkan setelah resume()
+
+        # ── Instrumentasi (None = mati: tidak ada timer / wrapper sama sekali) ──
+        self.metrics = None
+        self.metrics_prom_file = config.get("metrics_prom_file")
+        self.metrics_json_file = config.get("metrics_json_file")
+        if config.get("metrics"):
+            self.metrics = Metrics(config.get("metrics_window", 10.0),
+                                   labels={"game": self.game_name, "profile": self.profile})
+            if not self.renderer.silent:
+                self._say = self.metrics.timed("render", self._say)
+                self.renderer._draw = self.metrics.timed("render", self.renderer._draw)
+            if self.logger is not None:
+                self.metrics.logger = self.logger
+                self.logger.log = self.metrics.timed("log", self.logger.log)
+            if self.checkpointer is not None:
+                self.checkpointer.save = self.metrics.timed("checkpoint", self.checkpointer.save)
+
+        # ── State yang berubah selama simulasi ──
+        self._reset_state()
+        mark("simulator")
+
+    def close(self):
+        """Matikan worker pool MP (jika milik sendiri), flush logger dan export metrics."""
+        if self.metrics is not None:
+            self.export_metrics()
+        if self.engine is not None:
+            self.engine.close()
+        if self.worker_pool is not None and self._owns_pool:
+            self.worker_pool.close()
+            self.worker_pool = None
+        if self.logger is not None:
+            self.logger.close()
+
+    def _dashboard_snapshot(self):
+        """Counter yang di-sample renderer mode dashboard."""
+        return f"Gacha Simulator — {self.game_name}", {
+            "Fase":               self.phase,
+            "Total pull":         self.total_pulls,
+            "Total jackpot":      self.total_jackpot,
+            "Jarak jackpot":      self.jarak_jackpot,
+            "Pull baru":          self.new_pull,
+            "Target fase lambat": self.p100_pred,
+            "Jackpot tertinggi":  self.stats.max,
+            "Top 5 jackpot":      self.stats.top(5),
+        }
+
+    def _log(self, event: str, message: str, phase: str | None = None, **fields):
+        """Catat satu event ke logger beserta counter simulasi saat ini."""
+        if self.logger is None:
+            return
+        self.logger.log(
+            event, message, phase=phase,
+            total_pulls=self.total_pulls, total_jackpot=self.total_jackpot,
+            jarak_jackpot=self.jarak_jackpot, new_pull=self.new_pull,
+            **fields,
+        )
+
+    def _phase(self, name: str):
+        """Timer fase untuk metrics (nullcontext jika metrics mati)."""
+        if self.metrics is None:
+            return nullcontext()
+        return self.metrics.phase(name, self)
+
+    def metrics_snapshot(self) -> dict | None:
+        """Snapshot metrics sekarang (JSON-able), None jika metrics mati."""
+        if self.metrics is None:
+            return None
+        return self.metrics.snapshot(self)
+
+    def export_metrics(self, prom_file: str | None = None, json_file: str | None = None) -> list[str]:
+        """
+        Tulis metrics ke file Prometheus text / JSON (default: path dari CONFIG).
+        Returns daftar file yang ditulis.
+        """
+        if self.metrics is None:
+            return []
+        written = []
+        prom_file = prom_file or self.metrics_prom_file
+        json_file = json_file or self.metrics_json_file
+        if prom_file:
+            self.metrics.write_prometheus(prom_file, self)
+            written.append(prom_file)
+        if json_file:
+            self.metrics.write_json(json_file, self)
+            written.append(json_file)
+        return written
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    # ──────────────────────────────────────────────────────────────────────────
+    #  State Management
+    # ──────────────────────────────────────────────────────────────────────────
+
+    def _reset_state(self):
+        """Reset semua variabel simulasi ke kondisi awal."""
+        self.total_pulls           = 0      # keseluruhan pull
+        self.total_jackpot         = 0      # banyak jackpot yang didapatkan
+        self.jarak_jackpot         = 0      # jarak percobaan menuju jackpot saat ini
+        self.total_jackpot_terakhir = 0     # jarak jackpot sebelumnya
+        self.jackpot_list          = DistanceBuffer()  # semua jarak jackpot (uint32)
+        self.stats                 = JackpotStats()  # statistik streaming jackpot_list
+        self.mle                   = GeometricMLE()  # estimator p_hat incremental
+        self.new_pull              = 0      # counter pull baru (di-reset tiap jackpot)
+        self.on_pull               = 0      # on-going pull counter
+        self.loop_terakhir         = True   # flag: lanjutkan fase lambat
+        self.loop_bagian_dua       = True   # flag: ulangi keseluruhan simulasi
+        self.ii_terakhir           = 0      # iterasi di fase lambat
+        self.bukti                 = 0      # counter bukti loop tambahan
+
+        # Hasil prediksi MLE (diisi saat predict dipanggil)
+        self.p100_pred = 0
+
+        # Ringkasan run_auto_simulation (semua siklus retry)
+        self.retries             = 0
+        self.pulls_all_cycles    = 0
+        self.jackpots_all_cycles = 0
+
+    def _reset_for_retry(self):
+        """
+        Reset state untuk siklus baru (ketika jackpot terjadi di fase lambat).
+        Menyimpan estimator MLE dan max statistik lama untuk prediksi sebelum di-clear.
+        """
+        old_mle = self.mle
+        old_max = self.stats.max
+
+        self.total_pulls            = 0
+        self.total_jackpot          = 0
+        self.jarak_jackpot          = 0
+        self.total_jackpot_terakhir = 0
+        self.jackpot_list           = DistanceBuffer()
+        self.stats                  = JackpotStats()
+        self.mle                    = GeometricMLE()
+        self.new_pull               = 0
+        self.ii_terakhir            = 0
+        self.bukti                  = 0
+        self.loop_terakhir          = True
+
+        self.renderer.clear()
+        self._say("Semua variabel telah direset.")
+        predict_next_jackpot_mle(old_mle, self.confidence, show=not self.renderer.silent)
+        self._say(f" Jakpot tertinggi adalah : {old_max}")
+
+    def _record_jackpot(self, distance: int):
+        """Catat satu jarak jackpot ke jackpot_list + statistik streaming + MLE."""
+        self.jackpot_list.append(distance)
+        self.stats.add(distance)
+        self.mle.add(distance)
+
+    def _record_jackpots(self, distances: np.ndarray):
+        """Catat banyak jarak jackpot sekaligus (array numpy)."""
+        self.jackpot_list.extend(distances)
+        self.stats.update(distances)
+        self.mle.update(distances)
+
+    def _archive_cycle(self):
+        """Append jarak jackpot siklus ini ke arsip (sebelum di-clear saat retry)."""
+        if self.archive is None:
+            return
+        self.archive.append_run(
+            self.jackpot_list.view(),
+            profile=self.profile, game=self.game_name,
+            run_id=self.logger.run_id if self.logger else None, cycle=self.retries,
+            seed=self.rng_backend.root_seed, spawn_key=list(self.rng_backend.seed_seq.spawn_key),
+            bit_generator=self.rng_backend.bit_generator,
+            probability=self.prob, target=self.target,
+            pull_method=self.pull_method, engine=self.engine.name if self.engine else self.fast_engine,
+            started=self._cycle_started.isoformat(timespec="seconds"),
+            finished=datetime.now().isoformat(timespec="seconds"),
+            success=not self.loop_bagian_dua,
+        )
+
+    # ──────────────────────────────────────────────────────────────────────────
+    #  Checkpoint / Resume
+    # ──────────────────────────────────────────────────────────────────────────
+
+    def _maybe_checkpoint(self):
+        if self.checkpointer is not None:
+            self.checkpointer.maybe_save(self)
+
+    def checkpoint(self):
+        """Simpan checkpoint sekarang (butuh CONFIG checkpoint_dir)."""
+        if self.checkpointer is None:
+            raise ValueError("checkpoint_dir belum di-set di config")
+        self.checkpointer.save(self)
+
+    def resume(self) -> bool:
+        """
+        Muat checkpoint terakhir dari checkpoint_dir (jika ada).
+        run_auto_simulation() berikutnya melanjutkan siklus yang terputus:
+        fase lambat dari streak-nya, fase cepat / MP dari counter terakhir
+        (worker MP mendapat child seed baru).
+        Returns True jika checkpoint ditemukan.
+        """
+        if self.checkpointer is None or not os.path.exists(self.checkpointer.state_path):
+            return False
+        self.checkpointer.restore(self)
+        self._resume_phase = self.phase
+        self._say(
+            f"♻️  Resume dari {self.checkpointer.directory}: fase {self.phase}, "
+            f"{self.total_pulls:,} pull, {len(self.jackpot_list):,} jarak jackpot"
+        )
+        return True
+
+    # ──────────────────────────────────────────────────────────────────────────
+    #  Core Pull — Satu fungsi menggantikan satu_pull, satu_pull_lima, a_satu_pull
+    # ──────────────────────────────────────────────────────────────────────────
+
+    def _do_pull(self, batch_size: int, target_info: int | None = None) -> bool:
+        """
+        Lakukan satu batch pull.
+
+        Args:
+            batch_size:   Berapa banyak random number di-generate per batch.
+            target_info:  Jika diberikan, tampilkan progress menuju target ini.
+                          (digunakan oleh a_satu_pull di versi original)
+
+        Returns:
+            True  = tidak ada jackpot (lanjut)
+            False = jackpot ditemukan (misi gagal / loop berhenti)
+        """
+        if self.metrics is not None:
+            self.metrics.batches += 1
+        pulls = self.rng.random(size=batch_size)
+        hits = np.where(pulls < self.prob)[0]
+
+        if len(hits) > 0:
+            # ── JACKPOT ditemukan ──
+            first_hit = hits[0] + 1
+            self.jarak_jackpot += first_hit
+            self.total_pulls += first_hit
+            self.total_jackpot += 1
+            self.total_jackpot_terakhir = self.jarak_jackpot
+            self._record_jackpot(self.jarak_jackpot)
+            self.jarak_jackpot = 0
+            self.on_pull = 0
+
+            # Tampilkan info
+            self._say(f"\n ====>  jackpot jackpot didapatkan {self.total_pulls}  <====")
+            self._say(f"====>  Informasi New Pull         {self.new_pull}  <====")
+            if target_info is not None:
+                remaining = target_info - self.new_pull
+                self._say(f"====>  Informasi Total pull         {self.total_pulls:,}  <====")
+                self._say(f"====> Menuju p99 {target_info} , seharusnya kurang {remaining} percobaan lagi!")
+                self._say(f"\033[31m =================== Jackpot didapatkan. Loop Diulang! ===================== \033[0m")
+            else:
+                self._say(f"\033[31m =================== Jackpot didapatkan. Misi Gagal! ===================== \033[0m")
+
+            # Catat kegagalan ke file
+            self._log(
+                "failure",
+                f"\n ------> Kegagalan pada simulasi ke: {self.new_pull} , "
+                f"pull baru: {self.new_pull} , Total pull: {self.total_jackpot_terakhir}",
+                phase="slow" if target_info is not None else "manual",
+                total_jackpot_terakhir=self.total_jackpot_terakhir,
+            )
+
+            # Reset pull counter
+            self.new_pull = 0
+            self.loop_terakhir = False
+
+            return False  # jackpot = berhenti
+
+        else:
+            # ── Tidak ada jackpot ──
+            self.jarak_jackpot += batch_size
+            self.total_pulls += batch_size
+            self.new_pull += batch_size
+            self.on_pull += batch_size
+            if self.renderer.verbose:
+                self._say(f"kamu tidak beruntung, total pull: {self.total_pulls:,}")
+            else:
+                self.renderer.tick()
+
+            return True  # lanjut
+
+    # ──────────────────────────────────────────────────────────────────────────
+    #  Menu Options
+    # ──────────────────────────────────────────────────────────────────────────
+
+    def pull_satu(self):
+        """Opsi 1: Pull 1 kali (batch_size = 1)."""
+        with self._phase("manual"):
+            self._do_pull(self.batch_single)
+
+    def pull_sepuluh(self):
+        """Opsi 2: Pull 10 kali berturut-turut (satu draw vektor)."""
+        with self._phase("manual"):
+            self._bulk_pull(10)
+
+    def pull_manual(self, jumlah: int):
+        """Opsi 4: Pull sebanyak input manual (draw vektor per blok)."""
+        with self._phase("manual"):
+            self._bulk_pull(jumlah)
+
+    def pull_kontinu(self):
+        """Opsi 5: Pull terus sampai jackpot ditemukan (satu draw geometric)."""
+        with self._phase("manual"):
+            n = int(self.rng.geometric(self.prob))
+            self._apply_bulk(n, np.array([n - 1]))
+        self._say(f"Jackpot setelah {n:,} pull.")
+        self._say("======== Loop berhenti. Silahkan gacha real time!! ==========")
+
+    def _bulk_pull(self, jumlah: int, block: int = 1 << 20):
+        """
+        Pull tunggal sebanyak `jumlah` kali, tapi random di-generate per blok
+        dan hit dicari dengan satu np.flatnonzero. State akhir sama dengan
+        memanggil _do_pull(1) berulang kali; output diringkas.
+        """
+        done = 0
+        jackpots = []
+        while done < jumlah:
+            n = min(block, jumlah - done)
+            hits = np.flatnonzero(self.rng.random(n) < self.prob)
+            if self.metrics is not None:
+                self.metrics.batches += 1
+            jackpots.extend(self._apply_bulk(n, hits).tolist())
+            done += n
+
+        self._say(f"\n ====>  {jumlah:,} pull selesai, {len(jackpots):,} jackpot  <====")
+        self._say(f"====>  Informasi Total pull         {self.total_pulls:,}  <====")
+        if jackpots:
+            more = " ..." if len(jackpots) > 10 else ""
+            self._say(f"====>  Jarak jackpot: {jackpots[:10]}{more}")
+            self._say(f"\033[31m =================== Jackpot didapatkan. Misi Gagal! ===================== \033[0m")
+        else:
+            self._say(f"kamu tidak beruntung, Jarak Jackpot : {self.jarak_jackpot:,}")
+
+    def _apply_bulk(self, n: int, hits: np.ndarray) -> np.ndarray:
+        """
+        Terapkan n pull tunggal dengan jackpot di posisi `hits` (0-based, urut)
+        ke state: jarak_jackpot, new_pull, on_pull, total_pulls, jackpot_list.
+        Returns array jarak jackpot yang terjadi.
+        """
+        self.total_pulls += n
+        if hits.size == 0:
+            self.jarak_jackpot += n
+            self.new_pull += n
+            self.on_pull += n
+            self.renderer.tick()
+            return hits
+
+        # Pull gagal sebelum tiap jackpot; jackpot pertama melanjutkan streak lama
+        gaps = np.diff(hits, prepend=-1) - 1
+        distances = gaps + 1
+        distances[0] += self.jarak_jackpot
+        new_pulls = gaps.copy()
+        new_pulls[0] += self.new_pull
+
+        self.total_jackpot += hits.size
+        self._record_jackpots(distances)
+        for distance, new_pull in zip(distances.tolist(), new_pulls.tolist()):
+            self._log(
+                "failure",
+                f"\n ------> Kegagalan pada simulasi ke: {new_pull} , "
+                f"pull baru: {new_pull} , Total pull: {distance}",
+                phase="manual", total_jackpot_terakhir=distance,
+            )
+
+        tail = n - 1 - int(hits[-1])
+        self.total_jackpot_terakhir = int(distances[-1])
+        self.jarak_jackpot = tail
+        self.new_pull = tail
+        self.on_pull = tail
+        self.loop_terakhir = False
+        return distances
+
+    # ──────────────────────────────────────────────────────────────────────────
+    #  Fase Cepat — Automatic Pull (Normal)
+    # ──────────────────────────────────────────────────────────────────────────
+
+    def _get_engine(self) -> PullEngine:
+        """Engine fase cepat dari CONFIG["fast_engine"] (dibuat sekali per simulator)."""
+        with self._engine_lock:
+            if self.engine is None:
+                self.engine = make_engine(self._config, say=self._say)
+            return self.engine
+
+    def start_warmup(self):
+        """
+        Buat engine fase cepat dan compile kernel JIT-nya di thread background
+        (CONFIG jit_warmup), selagi user masih di menu interaktif. Fase cepat
+        yang mulai lebih dulu cukup menunggu (lock engine / lock compile numba).
+        """
+        if not self.jit_warmup or self.pull_method != "NO" or self._warmup_thread is not None:
+            return
+
+        def warm():
+            start = time.perf_counter()
+            try:
+                self._get_engine().warm_up()
+            except Exception:
+                return      # error yang sama muncul lagi saat fase cepat memakai engine
+            self.warmup_seconds = time.perf_counter() - start
+            mark("jit_warm")
+
+        self._warmup_thread = threading.Thread(target=warm, name="gacha-jit-warmup", daemon=True)
+        self._warmup_thread.start()
+
+    def fast_phase_done(self) -> bool:
+        """Kondisi stop fase cepat: jarak jackpot terakhir >= nilai_N - 10."""
+        return self.total_jackpot_terakhir >= self.fast_threshold
+
+    def _apply_fast_chunk(self, chunk: dict):
+        """Terapkan satu chunk hasil engine ke state (counter, jackpot_list, MLE)."""
+        if self.metrics is not None:
+            self.metrics.batches += 1
+        distances = chunk["distances"]
+        self.total_pulls += chunk["pulls"]
+        if chunk["summary"] is not None:
+            n_failed, failed_pulls, failed_max, failed_m2 = chunk["summary"]
+            self.mle.add_summary(n_failed, failed_pulls)
+            self.stats.add_summary(n_failed, failed_pulls, failed_max, failed_m2)
+            self.total_jackpot += n_failed
+        if len(distances) > 0:
+            self.total_jackpot += len(distances)
+            self._record_jackpots(distances)
+            self.total_jackpot_terakhir = int(distances[-1])
+        self.jarak_jackpot = chunk["streak"]
+
+    def _automatic_pull_fast_phase(self):
+        """
+        FASE 1 (Cepat): Pull dalam batch besar sampai jarak terpanjang
+        mendekati target (nilai_N - 10). Pull dilakukan oleh engine
+        (gacha.engines), kondisi stop dicek di sini: fast_phase_done().
+        """
+        self.phase = "fast"
+        engine = self._get_engine()
+        last_log = time.time()
+
+        if not self.fast_phase_done():
+            chunks = engine.run(self)
+            for chunk in chunks:
+                self._apply_fast_chunk(chunk)
+                if self.fast_phase_done():
+                    chunks.close()
+                    break
+                if self.metrics is not None:
+                    self.metrics.sample(self.total_pulls)
+
+                # Progress log (verbose) / dashboard (di-sample dengan rate tetap)
+                self.renderer.tick()
+                if self.renderer.verbose and time.time() - last_log >= self.log_interval:
+                    self.renderer.clear()
+                    self._say("=====================>  Fast Pull System  <====================\n")
+                    self._say(f"kamu tidak beruntung, Pull sebelum jackpot: {self.total_jackpot_terakhir:,}")
+                    self._say(f"Target jarak adalah : {self.fast_threshold}")
+                    self._say(f"Jackpot tertinggi : {self.stats.max:,}")
+                    self._say(f"Total pull : {self.total_pulls:,}")
+                    self._say(f"Total jackpot : {self.total_jackpot:,}")
+                    self._say(f"Array List JackPot : {self.stats.top(5)}")
+                    last_log = time.time()
+                self._maybe_checkpoint()
+            else:
+                raise RuntimeError(f"Engine {engine.name!r} berhenti sebelum jackpot >= {self.fast_threshold}")
+
+        self.jarak_jackpot = self.total_jackpot_terakhir
+        self._log(
+            "fast_phase_done",
+            f"\n Informasi sebelum berpindah ke loop lambat. "
+            f"nilai_N : {self.target}  dan total_jackpot_terakhir : {self.total_jackpot_terakhir}",
+            phase="fast", engine=engine.name,
+        )
+        self._say("FFFFFFFFFFFFFFFFFFFFFFFFF ===================================================== FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF")
+        self._say(f"\n Informasi sebelum berpindah ke loop lambat. nilai_N : {self.target}  dan total_jackpot_terakhir : {self.total_jackpot_terakhir}")
+
+    def _print_phase_stats(self):
+        """Tampilkan statistik distribusi jackpot setelah fase cepat."""
+        self._say(f"Total pull       : {self.total_pulls:,}")
+        self._say(f"Total jackpot    : {self.total_jackpot:,}")
+        self._say(f"Jackpot tertinggi: {self.stats.max}")
+        self._say(f"jarak jackpot terakhir: {self.total_jackpot_terakhir:,}")
+        self._say(f"Informasi on-going pull: {self.jarak_jackpot}")
+
+        if self._print_distribution():
+            self._say("=========> Catatan jackpot telah ditulis ")
+
+    def _print_distribution(self) -> bool:
+        """
+        Tampilkan describe / frekuensi / modus dari statistik streaming
+        (O(jumlah bin), tidak tergantung jumlah jackpot).
+        Returns True jika modus bisa dihitung.
+        """
+        self._say("\n📊 Distribusi Jackpot:")
+        if self.stats.summarized:
+            # Jackpot gagal hanya diringkas (engine "summary"): histogram / quantile
+            # hanya berisi jarak yang di-materialisasi, jadi cukup count & MLE
+            rows = {"count": self.stats.count, "mean": self.stats.mean, "std": self.stats.std,
+                    "max": self.stats.max, "p_hat": self.mle.p_hat}
+        else:
+            rows = self.stats.describe()
+        for key, value in rows.items():
+            self._say(f"{key:<6} {value:>16,.6f}" if isinstance(value, float) else f"{key:<6} {value:>16,}")
+        if self.stats.summarized:
+            self._say(f"\n{self.stats.summarized:,} jackpot gagal hanya diringkas: frekuensi / modus tidak tersedia.")
+            return False
+
+        self._say("\n📊 Frekuensi Jarak Jackpot:")
+        for distance, freq in self.stats.value_counts(10):
+            self._say(f"{distance:<8} {freq:,}")
+
+        modus = self.stats.mode()
+        if modus is None:
+            self._say("\nModus tidak dapat dihitung (data terlalu unik).")
+            return False
+        self._say(f"\nModus Jackpot: {modus}")
+        return True
+
+    # ──────────────────────────────────────────────────────────────────────────
+    #  Fase Lambat — Pull kecil sampai confidence target tercapai
+    # ──────────────────────────────────────────────────────────────────────────
+
+    def _automatic_pull_slow_phase(self, resume: bool = False):
+        """
+        FASE 2 (Lambat): Pull dalam batch kecil.
+        Berhenti jika:
+          - Mencapai p100_pred tanpa jackpot  → SUKSES (real world pull!)
+          - Jackpot terjadi                   → GAGAL  (ulangi dari awal)
+        resume=True: lanjutkan streak fase lambat dari checkpoint.
+        """
+        self.phase = "slow"
+        if not resume:
+            self.ii_terakhir = 0
+            self.bukti = 0
+
+        while self.loop_terakhir:
+            if self.ii_terakhir >= (self.p100_pred - 10):
+                # ── SUKSES: streak cukup panjang, tidak ada jackpot ──
+                self.enable_auto_menu = False
+                self._say(f"\033[34m ===================== Belum Jackpot ======================= \033[0m")
+                self._say("loop berakhir")
+                self._say(f"\033[34m ===================== Semua loop selesai  ======================= \033[0m")
+                self._say(f"\033[32m ====================> Real World Pull Now! <================= \033[0m")
+                self._say(f"\n ==========================> Game : {self.game_name} <=========================")
+                self.loop_terakhir = False
+                self.loop_bagian_dua = False
+                self.new_pull = 0
+                break
+            else:
+                # ── Lakukan pull kecil (jika jackpot → _do_pull returns False → loop_terakhir=False) ──
+                self._do_pull(self.batch_slow, target_info=self.p100_pred)
+                self.bukti += 1
+                self.ii_terakhir += self.batch_slow
+                if self.metrics is not None and not self.bukti & 63:
+                    self.metrics.sample(self.total_pulls)
+                self._maybe_checkpoint()
+
+    # ──────────────────────────────────────────────────────────────────────────
+    #  Automatic Pull — Gabungan Fase Cepat + Lambat
+    # ──────────────────────────────────────────────────────────────────────────
+
+    def automatic_pull(self):
+        """Opsi 3: Automatic pull = fase cepat → prediksi MLE → fase lambat."""
+        start_time = time.time()
+        resume_slow = self._resume_phase == "slow"
+
+        if not resume_slow:
+            # FASE 1: Pull cepat sampai mendekati target
+            with self._phase("fast"):
+                self._automatic_pull_fast_phase()
+
+            # Tampilkan statistik fase cepat
+            with self._phase("stats"):
+                self._print_phase_stats()
+
+            # Hitung prediksi MLE dari data yang terkumpul
+            with self._phase("predict"):
+                preds = predict_next_jackpot_mle(self.mle, self.confidence, self.jarak_jackpot,
+                                                 show=not self.renderer.silent)
+            if preds:
+                self.p100_pred = preds["p100_pred"]
+
+        # FASE 2: Pull lambat sampai confidence target atau jackpot
+        with self._phase("slow"):
+            self._automatic_pull_slow_phase(resume=resume_slow)
+
+    # ──────────────────────────────────────────────────────────────────────────
+    #  Automatic Pull — Multiprocessing
+    # ──────────────────────────────────────────────────────────────────────────
+
+    def automatic_pull_mp(self, workers: int | None = None):
+        """Versi parallel dari automatic_pull() menggunakan multiprocessing."""
+        start_time = time.time()
+        self.phase = "mp"
+        cores = workers or max(1, mp.cpu_count() - 1)
+        pool = self._get_worker_pool(cores)
+        # Pool bersama: satu job MP pada satu waktu (flag stop/cancel milik pool)
+        with pool.lock, self._phase("mp"):
+            self._run_mp_job(pool, start_time)
+
+    def _run_mp_job(self, pool: PersistentPool, start_time: float):
+        """Satu job MP di pool (satu worker per ring buffer pool)."""
+        cores = pool.processes
+        base_pulls = self.total_pulls       # pull sebelum job ini (mis. dari menu interaktif)
+        pool.reset()
+
+        # Child SeedSequence per worker → stream independen, bisa diulang dari root seed
+        seeds = self.rng_backend.spawn(cores)
+        args = [
+            (self.prob, self.batch_fast, self.rng_backend.bit_generator, s,
+             ring.name, pool.ring_capacity, self.mp_flush_size, self.mp_check_every)
+            for s, ring in zip(seeds, pool.rings)
+        ]
+        pool.submit(_mp_worker, args)
+
+        try:
+            self._collect_mp_results(pool.rings, pool.stop_value, pool.cancel_flag, start_time, pool.failure)
+        except KeyboardInterrupt:
+            self._say("\n⛔ Dibatalkan (Ctrl-C), menghentikan worker...")
+            pool.cancel()
+            pool.wait(self.mp_shutdown_timeout)
+            self.loop_terakhir = False
+            self.loop_bagian_dua = False
+            raise
+        except Exception:
+            # Worker gagal: hentikan sisanya (terminate jika tidak berhenti tepat waktu)
+            pool.cancel()
+            pool.wait(self.mp_shutdown_timeout)
+            raise
+
+        # Worker kembali idle di pool (terminate hanya jika tidak selesai tepat waktu)
+        pool.wait(self.mp_shutdown_timeout)
+
+        elapsed = time.time() - start_time
+        self.mp_pulls_per_sec = (self.total_pulls - base_pulls) / elapsed if elapsed > 0 else 0.0
+        self._say(f"\n✅ Multiprocessing finished in {elapsed:.2f}s ({self.mp_pulls_per_sec:,.0f} pulls/sec)")
+
+        # Statistik akhir
+        self._print_distribution()
+
+        self.loop_terakhir = False
+        self.loop_bagian_dua = False
+
+    def _collect_mp_results(self, rings, stop_value, cancel_flag, start_time, failure=None):
+        """
+        Loop parent: kumpulkan jarak jackpot dari semua ring buffer sampai
+        semua worker selesai. Set cancel jika streak target tercapai atau timeout.
+        failure: callable → exception worker yang gagal / mati (PersistentPool.failure);
+        jika ada, cancel di-set dan RuntimeError di-raise.
+        """
+        last_log = time.time()
+        base_pulls = self.total_pulls
+        active = list(rings)
+
+        while active:
+            exc = failure() if failure is not None else None
+            if exc is not None:
+                cancel_flag.value = 1
+                raise RuntimeError(f"Worker MP gagal: {exc}") from exc
+
+            received = False
+            for ring in list(active):
+                finished = ring.done            # cek dulu, baru baca sisa data
+                new_jacks = ring.read()
+                if finished:
+                    active.remove(ring)
+
+                if len(new_jacks) > 0:
+                    received = True
+                    if self.metrics is not None:
+                        self.metrics.ipc_messages += 1
+                    self.total_jackpot += len(new_jacks)
+                    self._record_jackpots(new_jacks)
+                    self.total_jackpot_terakhir = max(self.total_jackpot_terakhir, int(new_jacks[-1]))
+                    self.jarak_jackpot = 0
+
+            # pulls_done di header bersifat kumulatif per worker
+            self.total_pulls = base_pulls + sum(ring.pulls_done for ring in rings)
+
+            # Streak terpanjang yang sedang berjalan di semua worker
+            self.ii_terakhir = max(ring.streak for ring in rings)
+
+            if not received:
+                wait_start = time.perf_counter()
+                time.sleep(0.05)
+                if self.metrics is not None:
+                    self.metrics.add_section("ipc_wait", time.perf_counter() - wait_start)
+            if self.metrics is not None:
+                self.metrics.sample(self.total_pulls)
+
+            # Set stop target setelah data cukup
+            if self.stats.count >= 5 and stop_value.value == 0:
+                preds = predict_next_jackpot_mle(self.mle, self.confidence, show=not self.renderer.silent)
+                if preds:
+                    stop_value.value = preds["p100_pred"] - 10
+                    self._say(f"🛑 Target set to {stop_value.value} based on p100_pred")
+
+            # Progress log (verbose) / dashboard (di-sample dengan rate tetap)
+            self.renderer.tick()
+            if self.renderer.verbose and time.time() - last_log >= self.log_interval:
+                self.renderer.clear()
+                self._say("=====================>  Fast Pull System (MP)  <====================\n")
+                self._say(f"kamu tidak beruntung, Pull sebelum jackpot: {self.total_jackpot_terakhir:,}")
+                if stop_value.value:
+                    self._say(f"Target jarak adalah : {stop_value.value}")
+                self._say(f"Jackpot tertinggi : {self.stats.max:,}")
+                self._say(f"Total pull : {self.total_pulls:,}")
+                self._say(f"Total jackpot : {self.total_jackpot:,}")
+                self._say(f"Array List JackPot : {self.stats.top(5)}")
+                last_log = time.time()
+
+            # Satu worker sudah mencapai target / timeout → hentikan semua
+            if not cancel_flag.value:
+                if stop_value.value and self.ii_terakhir >= stop_value.value:
+                    cancel_flag.value = 1
+                elif self.mp_timeout and time.time() - start_time >= self.mp_timeout:
+                    self._say(f"⏱️ Timeout {self.mp_timeout}s tercapai, menghentikan worker...")
+                    cancel_flag.value = 1
+
+            self._maybe_checkpoint()
+
+    def _get_worker_pool(self, cores: int) -> PersistentPool:
+        """Ambil worker pool yang sudah hangat, buat baru jika belum ada."""
+        if not self._owns_pool:
+            return self.worker_pool
+        if self.worker_pool is not None and self.worker_pool.processes != cores:
+            # Hanya pool: logger / engine / metrics tetap hidup sampai close()
+            self.worker_pool.close()
+            self.worker_pool = None
+        if self.worker_pool is None:
+            self._say(f"⚡ Starting multiprocessing with {cores} processes")
+            self.worker_pool = PersistentPool(cores, self.mp_ring_capacity, self.mp_start_method)
+        else:
+            self._say(f"⚡ Reusing {cores} warm worker processes")
+        return self.worker_pool
+
+    # ──────────────────────────────────────────────────────────────────────────
+    #  Run Simulation (Langsung)
+    # ──────────────────────────────────────────────────────────────────────────
+
+    def run_auto_simulation(self):
+        """
+        Jalankan simulasi otomatis, ulangi jika jackpot terjadi di fase lambat.
+        Setelah resume(), siklus pertama dilanjutkan dari state checkpoint.
+        """
+        if self._resume_phase is None:
+            self.loop_bagian_dua = True
+            self.retries             = -1   # siklus yang gagal (jackpot di fase lambat)
+            self.pulls_all_cycles    = 0    # total pull semua siklus sampai target tercapai
+            self.jackpots_all_cycles = 0
+        while self.loop_bagian_dua:
+            if self._resume_phase is None:
+                self._reset_for_retry()
+                self.retries += 1
+                self._cycle_started = datetime.now()
+            # Checkpoint fase "done" = siklus sudah dihitung & diarsip
+            if self._resume_phase != "done":
+                if self.pull_method == "NO":
+                    self.automatic_pull()
+                elif self.pull_method == "MP":
+                    self.automatic_pull_mp()
+                self.pulls_all_cycles    += self.total_pulls
+                self.jackpots_all_cycles += self.total_jackpot
+                self.phase = "done"
+                self._archive_cycle()
+                if self.checkpointer is not None:
+                    self.checkpointer.save(self)
+            self._resume_phase = None
+
+        self._say("\033[93m =============================== Semua loop selesai ===================================== \033[0m")
+        self._say("\033[93m =============================== Realword Pull      ===================================== \033[0m")
+        self.export_metrics()
+
+    # ──────────────────────────────────────────────────────────────────────────
+    #  Interactive Menu
+    # ──────────────────────────────────────────────────────────────────────────
+
+    def _report_startup(self):
+        """Tampilkan + log waktu startup (sekali, saat menu pertama tampil)."""
+        mark("menu")
+        report = startup_report()
+        self._say(f"⏱️  Startup: {format_report(report)}")
+        self._log("startup", f"\n Startup: {format_report(report)}", **report)
+
+    def interactive_menu(self):
+        """Menu interaktif setelah simulasi otomatis selesai."""
+        self.start_warmup()
+        self._report_startup()
+        while True:
+            print(f"\n================= Simulasi Gacha V2 =====================")
+            print(f"\n================= Game Name: {self.game_name} =====================")
+            print(f"Nilai Pull baru                : {self.new_pull}")
+            print(f"Banyak percobaan yang dilakukan sekarang untuk menuju jackpot : {self.jarak_jackpot}")
+            print(f"Bentuk on going setelah mengikuti panduan prediksi : {self.on_pull}")
+            print(f"banyak percobaan untukk jackpot sebelumnya  : {self.total_jackpot_terakhir}")
+            print("1. Pull 1 kali")
+            print("2. Pull 10 kali")
+            print("3. Automatic pull fast" if self.enable_auto_menu else ".")
+            print("4. Manual pull input")
+            print("5. pull continu()")
+            if self.metrics is not None:
+                print("6. Export metrics")
+
+            choice = input("Pilih opsi: ")
+
+            if choice == "1":
+                self.pull_satu()
+            elif choice == "2":
+                self.pull_sepuluh()
+            elif choice == "3":
+                if self.enable_auto_menu:
+                    self.run_auto_simulation()
+                else:
+                    print("03 empty")
+            elif choice == "4":
+                jumlah = input("Pilih berapa banyak pull: ")
+                self._log(
+                    "manual_pull",
+                    f"\n Ini nilai percobaan : {jumlah} , "
+                    f"Nilai pull baru: {self.new_pull} , Total pull: {self.jarak_jackpot}",
+                    phase="manual", jumlah=jumlah,
+                )
+                self.pull_manual(int(jumlah))
+            elif choice == "5":
+                self.pull_kontinu()
+            elif choice == "6" and self.metrics is not None:
+                written = self.export_metrics()
+                print(json.dumps(self.metrics_snapshot(), indent=2))
+                for path in written:
+                    print(f"📈 Metrics ditulis ke {path}")
+            else:
+                print("Opsi tidak valid, coba lagi.")
@@ -0,0 +1,45 @@
+# Pengukuran waktu startup Pull-system.
+#
+# Titik waktu (detik sejak package gacha mulai di-import):
+#   import      package gacha selesai di-import
+#   simulator   GachaSimulator pertama selesai dibuat
+#   menu        prompt interaktif pertama tampil
+#   jit_warm    warm-up engine (compile / load cache numba) selesai
+# "process" = umur proses (termasuk start interpreter) saat report dibuat,
+# dari /proc (Linux, resolusi clock tick); None di OS lain.
+
+import os
+import time
+
+
+STARTED = time.perf_counter()
+_marks = {}
+
+
+def mark(name: str):
+    """Catat titik waktu `name` (hanya kejadian pertama)."""
+    _marks.setdefault(name, time.perf_counter() - STARTED)
+
+
+def process_age() -> float | None:
+    """Detik sejak proses ini dimulai (None jika /proc tidak ada)."""
+    try:
+        with open("/proc/self/stat") as f:
+            start_ticks = int(f.read().rsplit(")", 1)[1].split()[19])
+        with open("/proc/uptime") as f:
+            uptime = float(f.read().split()[0])
+    except (OSError, ValueError, IndexError):
+        return None
+    return uptime - start_ticks / os.sysconf("SC_CLK_TCK")
+
+
+def startup_report() -> dict:
+    """Semua titik waktu yang sudah tercatat + umur proses."""
+    report = dict(_marks)
+    report["process"] = process_age()
+    return report
+
+
+def format_report(report: dict) -> str:
+    parts = [f"{name} {seconds:.2f}s" for name, seconds in report.items() if seconds is not None]
+    return " · ".join(parts)
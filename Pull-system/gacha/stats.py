@@ -0,0 +1,198 @@
+# Statistik streaming untuk jarak jackpot: semua update O(1) / O(batch),
+# query O(1) atau O(k), memori tetap (tidak tergantung jumlah jackpot).
+
+import heapq
+
+import numpy as np
+
+
+class JackpotStats:
+    """
+    Akumulator online untuk jarak jackpot.
+
+      - count, mean, variance  → Welford (batch: rumus merge Chan)
+      - min / max              → running
+      - top-k terpanjang       → min-heap ukuran k
+      - histogram              → bin lebar tetap (bin_width) sampai max_value,
+                                 nilai di atasnya masuk bin overflow
+                                 (dipakai untuk quantile, frekuensi dan modus)
+
+    add_summary() menambah jackpot yang hanya diringkas (engine "summary"):
+    count, mean, variance dan max ikut, histogram / min tidak;
+    `summarized` = banyak jackpot seperti itu.
+    """
+
+    def __init__(self, top_k: int = 5, bin_width: int = 1, max_value: int = 1 << 17):
+        self.top_k     = top_k
+        self.bin_width = bin_width
+        self.n_bins    = max_value // bin_width
+        self.reset()
+
+    def reset(self):
+        self.count    = 0
+        self.mean     = 0.0
+        self._m2      = 0.0
+        self.min      = 0
+        self.max      = 0
+        self.total    = 0
+        self.summarized = 0
+        self._heap    = []
+        self.hist     = np.zeros(self.n_bins + 1, dtype=np.int64)   # bin terakhir = overflow
+
+    # ── Update ──
+
+    def add(self, x: int):
+        """Tambah satu jarak jackpot (O(log k))."""
+        x = int(x)
+        self.count += 1
+        self.total += x
+        delta = x - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (x - self.mean)
+
+        if self.count == 1 or x < self.min:
+            self.min = x
+        if x > self.max:
+            self.max = x
+
+        if len(self._heap) < self.top_k:
+            heapq.heappush(self._heap, x)
+        elif x > self._heap[0]:
+            heapq.heapreplace(self._heap, x)
+
+        self.hist[min(x // self.bin_width, self.n_bins)] += 1
+
+    def update(self, values):
+        """Tambah banyak jarak jackpot sekaligus (vektor numpy)."""
+        values = np.asarray(values, dtype=np.int64)
+        n_b = values.size
+        if n_b == 0:
+            return
+        if n_b == 1:
+            self.add(values[0])
+            return
+
+        mean_b = float(values.mean())
+        v_min = int(values.min())
+        self.min = v_min if self.count == 0 else min(self.min, v_min)
+        self._merge(n_b, int(values.sum()), float(((values - mean_b) ** 2).sum()), int(values.max()))
+
+        k = min(self.top_k, n_b)
+        for x in np.partition(values, n_b - k)[n_b - k:].tolist():
+            if len(self._heap) < self.top_k:
+                heapq.heappush(self._heap, x)
+            elif x > self._heap[0]:
+                heapq.heapreplace(self._heap, x)
+
+        bins = np.minimum(values // self.bin_width, self.n_bins)
+        self.hist += np.bincount(bins, minlength=self.n_bins + 1)
+
+    def add_summary(self, count: int, total: int, max_value: int, m2: float):
+        """
+        Tambah `count` jackpot yang hanya diketahui ringkasannya: jumlah jarak,
+        jarak terpanjang dan jumlah kuadrat simpangan dari mean-nya (m2).
+        """
+        if count <= 0:
+            return
+        self.summarized += count
+        self._merge(count, total, m2, max_value)
+        if len(self._heap) < self.top_k:
+            heapq.heappush(self._heap, int(max_value))
+        elif max_value > self._heap[0]:
+            heapq.heapreplace(self._heap, int(max_value))
+
+    def _merge(self, n_b: int, total_b: int, m2_b: float, max_b: int):
+        """Gabung kelompok (n, total, m2, max) ke count / mean / m2 (rumus Chan)."""
+        n_a = self.count
+        n = n_a + n_b
+        delta = total_b / n_b - self.mean
+        self._m2 += m2_b + delta * delta * n_a * n_b / n
+        self.mean += delta * n_b / n
+        self.count = n
+        self.total += int(total_b)
+        self.max = max(self.max, int(max_b))
+
+    # ── Checkpoint ──
+
+    def to_dict(self) -> dict:
+        """State lengkap (JSON-able); histogram disimpan sparse."""
+        nz = np.flatnonzero(self.hist)
+        return {
+            "top_k": self.top_k, "bin_width": self.bin_width, "n_bins": self.n_bins,
+            "count": self.count, "mean": self.mean, "m2": self._m2,
+            "min": self.min, "max": self.max, "total": self.total,
+            "summarized": self.summarized, "heap": list(self._heap),
+            "hist_index": nz.tolist(), "hist_count": self.hist[nz].tolist(),
+        }
+
+    @classmethod
+    def from_dict(cls, state: dict) -> "JackpotStats":
+        stats = cls(state["top_k"], state["bin_width"], state["n_bins"] * state["bin_width"])
+        stats.count = state["count"]
+        stats.mean  = state["mean"]
+        stats._m2   = state["m2"]
+        stats.min   = state["min"]
+        stats.max   = state["max"]
+        stats.total = state["total"]
+        stats.summarized = state.get("summarized", 0)
+        stats._heap = list(state["heap"])
+        heapq.heapify(stats._heap)
+        stats.hist[state["hist_index"]] = state["hist_count"]
+        return stats
+
+    # ── Query ──
+
+    @property
+    def variance(self) -> float:
+        return self._m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def std(self) -> float:
+        return self.variance ** 0.5
+
+    def top(self, k: int | None = None) -> list[int]:
+        """Jarak jackpot terpanjang, urut menurun."""
+        return sorted(self._heap, reverse=True)[:k or self.top_k]
+
+    def quantile(self, q: float) -> int:
+        """Quantile dari histogram (resolusi = bin_width)."""
+        if self.count == 0:
+            return 0
+        if q <= 0:
+            return self.min
+        if q >= 1:
+            return self.max
+        cum = np.cumsum(self.hist)
+        idx = int(np.searchsorted(cum, q * self.count))
+        if idx >= self.n_bins:
+            return self.max
+        return min(max(idx * self.bin_width, self.min), self.max)
+
+    def value_counts(self, n: int = 10) -> list[tuple[int, int]]:
+        """n bin paling sering: [(jarak, frekuensi), ...] (tanpa bin overflow)."""
+        counts = self.hist[:self.n_bins]
+        n = min(n, int(np.count_nonzero(counts)))
+        if n == 0:
+            return []
+        idx = np.argpartition(counts, -n)[-n:]
+        idx = idx[np.argsort(-counts[idx], kind="stable")]
+        return [(int(i) * self.bin_width, int(counts[i])) for i in idx]
+
+    def mode(self) -> int | None:
+        counts = self.hist[:self.n_bins]
+        if self.count == 0 or counts.max() == 0:
+            return None
+        return int(np.argmax(counts)) * self.bin_width
+
+    def describe(self) -> dict:
+        """Ringkasan seperti pandas describe()."""
+        return {
+            "count": self.count,
+            "mean":  self.mean,
+            "std":   self.std,
+            "min":   self.min,
+            "25%":   self.quantile(0.25),
+            "50%":   self.quantile(0.50),
+            "75%":   self.quantile(0.75),
+            "max":   self.max,
+        }
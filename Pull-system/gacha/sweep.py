@@ -0,0 +1,160 @@
+# Parameter sweep: jalankan banyak siklus automatic pull GachaSimulator
+# (headless) untuk setiap titik grid konfigurasi, paralel di process pool.
+#
+# Hasil per run ditulis ke CSV (satu kolom per metrik / parameter) dan
+# di-flush setiap baris, sehingga sweep yang terputus bisa dilanjutkan:
+# pasangan (point_id, run_id) yang sudah ada di file dilewati.
+
+import csv
+import itertools
+import json
+import os
+import time
+import multiprocessing as mp
+
+import numpy as np
+
+
+RESULT_COLUMNS = [
+    "point_id", "run_id", "pulls_to_target", "retries", "slow_success_rate",
+    "total_jackpot", "p100_pred", "wall_time",
+]
+
+# Override config agar setiap run headless dan tidak menulis file apa pun
+# (log, arsip, checkpoint, metrics) walau profile / config dasar mengaktifkannya
+HEADLESS_CONFIG = {
+    "render_mode": "silent",
+    "log_file": None,
+    "archive_dir": None,
+    "checkpoint_dir": None,
+    "metrics": False,
+    "pull_method": "NO",
+}
+
+
+def expand_grid(grid: dict) -> list[dict]:
+    """{"probability": [a, b], "min_percobaan": [x]} → list titik (cartesian)."""
+    keys = list(grid)
+    return [dict(zip(keys, values)) for values in itertools.product(*(grid[k] for k in keys))]
+
+
+def load_sweep_spec(path: str) -> dict:
+    """
+    Baca file spesifikasi sweep (JSON):
+      {"grid": {...}} atau {"points": [...]},
+      opsional "runs_per_point" dan "seed".
+    """
+    with open(path, encoding="utf-8") as f:
+        spec = json.load(f)
+    if "points" not in spec:
+        if "grid" not in spec:
+            raise ValueError(f"{path}: butuh key 'grid' atau 'points'")
+        spec["points"] = expand_grid(spec["grid"])
+    return spec
+
+
+def _run_one(task):
+    """Worker: satu siklus run_auto_simulation penuh untuk satu titik grid."""
+    sim_cls, config, point_id, run_id, seed_seq = task
+    start = time.perf_counter()
+    with sim_cls(dict(config, rng_seed=seed_seq)) as sim:
+        sim.run_auto_simulation()
+        retries = sim.retries
+        row = {
+            "point_id":          point_id,
+            "run_id":            run_id,
+            "pulls_to_target":   sim.pulls_all_cycles,
+            "retries":           retries,
+            "slow_success_rate": 1.0 / (retries + 1),
+            "total_jackpot":     sim.jackpots_all_cycles,
+            "p100_pred":         sim.p100_pred,
+        }
+    row["wall_time"] = time.perf_counter() - start
+    return row
+
+
+def _done_keys(out_path: str) -> set:
+    if not os.path.exists(out_path):
+        return set()
+    with open(out_path, newline="", encoding="utf-8") as f:
+        return {(int(r["point_id"]), int(r["run_id"])) for r in csv.DictReader(f)}
+
+
+def run_sweep(sim_cls, base_config: dict, points: list[dict], runs_per_point: int,
+              out_path: str, workers: int | None = None, seed: int | None = None,
+              progress_interval: float = 10.0) -> str:
+    """
+    Jalankan sweep dan tulis hasil ke out_path (CSV).
+
+    Seed setiap run = SeedSequence(seed, spawn_key=(point_id, run_id)),
+    jadi run yang dilanjutkan memakai stream yang sama seperti run awal.
+    Metadata sweep (titik, seed, runs_per_point) disimpan di out_path + ".meta.json";
+    resume ditolak jika metadata berbeda.
+    """
+    meta_path = out_path + ".meta.json"
+    param_keys = sorted({k for p in points for k in p})
+
+    if os.path.exists(meta_path):
+        with open(meta_path, encoding="utf-8") as f:
+            meta = json.load(f)
+        if meta["points"] != points or meta["runs_per_point"] != runs_per_point:
+            raise ValueError(f"{out_path} berisi sweep lain (metadata berbeda); pakai file output baru.")
+        seed = meta["seed"]
+    else:
+        seed = seed if seed is not None else int(np.random.SeedSequence().entropy % (2**63))
+        with open(meta_path, "w", encoding="utf-8") as f:
+            json.dump({"points": points, "runs_per_point": runs_per_point, "seed": seed}, f, indent=2)
+
+    done = _done_keys(out_path)
+    tasks = [
+        (sim_cls, dict(base_config, **HEADLESS_CONFIG, **point), pid, rid,
+         np.random.SeedSequence(seed, spawn_key=(pid, rid)))
+        for pid, point in enumerate(points)
+        for rid in range(runs_per_point)
+        if (pid, rid) not in done
+    ]
+    total = len(points) * runs_per_point
+    print(f"🧪 Sweep: {len(points)} titik × {runs_per_point} run, "
+          f"{len(done)} sudah selesai, {len(tasks)} tersisa (seed {seed})")
+    if not tasks:
+        return out_path
+
+    new_file = not os.path.exists(out_path)
+    workers = workers or mp.cpu_count()
+    finished = len(done)
+    start = last_log = time.time()
+    # Start method sama dengan worker MP simulator (fork + numba TBB bisa hang)
+    ctx = mp.get_context(base_config.get("mp_start_method"))
+
+    with open(out_path, "a", newline="", encoding="utf-8") as f, ctx.Pool(workers) as pool:
+        writer = csv.DictWriter(f, fieldnames=RESULT_COLUMNS + param_keys)
+        if new_file:
+            writer.writeheader()
+        for row in pool.imap_unordered(_run_one, tasks):
+            row.update(points[row["point_id"]])
+            writer.writerow(row)
+            f.flush()
+            finished += 1
+            if time.time() - last_log >= progress_interval:
+                rate = (finished - len(done)) / (time.time() - start)
+                print(f"   {finished:,}/{total:,} run selesai ({rate:.2f} run/detik)")
+                last_log = time.time()
+
+    print(f"✅ Sweep selesai dalam {time.time() - start:.1f}s → {out_path}")
+    return out_path
+
+
+def load_results(out_path: str) -> dict[str, np.ndarray]:
+    """Baca CSV hasil sweep sebagai kolom numpy {nama_kolom: array}."""
+    with open(out_path, newline="", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    if not rows:
+        return {}
+    columns = {}
+    for key in rows[0]:
+        values = [r[key] for r in rows]
+        try:
+            columns[key] = np.array(values, dtype=float)
+        except ValueError:
+            columns[key] = np.array(values)
+    return columns
@@ -0,0 +1,8 @@
+# Test Pull-system dijalankan dari folder Pull-system:
+#   python -m pytest -q tests
+# Package gacha diimport langsung dari source tree.
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,177 @@
+# Uji statistik: setiap engine fase cepat mensimulasikan proses yang sama
+# dengan loop _do_pull.
+#
+# Setiap engine menjalankan RUNS fase cepat (satu Generator, seed tetap) pada
+# masalah kecil. Yang diuji:
+#   - jarak jackpot gagal  ~ Geometric(p) terpotong di {1 .. T-1}   (chi-square)
+#   - jarak terakhir - (T-1) ~ Geometric(p)                         (chi-square)
+#   - jackpot per fase     ~ Geometric(q), q = P(D >= T)            (chi-square)
+#   - rata-rata pull fase cepat = analytics.fast_phase_moments      (z-test)
+#   - total pull & p_hat per fase vs referensi _do_pull            (KS 2 sampel)
+#   - kondisi stop dan konsistensi counter (deterministik)
+# Setiap uji statistik memakai false-alarm rate ALPHA; seed tetap, jadi
+# hasilnya deterministik dan hanya gagal jika distribusinya memang berbeda
+# (atau kebetulan 1 : 1/ALPHA untuk seed ini).
+
+from statistics import NormalDist
+
+import numpy as np
+import pytest
+from scipy import stats
+
+from gacha import DEFAULT_CONFIG, ENGINES, GachaSimulator
+from gacha.analytics import fast_phase_moments
+
+
+ALPHA     = 1e-3          # false-alarm rate per uji
+RUNS      = 400           # fase cepat per engine
+PROB      = 0.02
+TARGET    = 160           # threshold T = TARGET - 10 = 150, ± 20 jackpot per fase
+THRESHOLD = TARGET - 10
+SEED      = 20_240_601
+
+CONFIG = dict(
+    DEFAULT_CONFIG,
+    probability=PROB, min_percobaan=TARGET, batch_size_fast=10, rng_seed=SEED,
+    render_mode="silent", log_file=None, archive_dir=None, checkpoint_dir=None,
+    engine_cache=None, engine_workers=2, engine_parallel_block=4096,
+    engine_chunk_batches=64, numba_streams=2, numba_round_pulls=20_000,
+)
+
+ENGINE_NAMES = [
+    pytest.param(name, marks=pytest.mark.skipif(not cls.available(), reason=f"engine {name} tidak tersedia"))
+    for name, cls in ENGINES.items()
+]
+
+
+# ── Pengumpulan sampel ──
+
+def _do_pull_fast_phase(sim):
+    """Referensi: fase cepat dengan _do_pull berulang (perilaku loop lama)."""
+    while not sim.fast_phase_done():
+        sim._do_pull(sim.batch_fast)
+
+
+def _collect(engine: str | None) -> dict:
+    """RUNS fase cepat dengan engine (None = referensi _do_pull)."""
+    config = dict(CONFIG, fast_engine=engine or "batch")
+    failed, final, pulls, counts, sums = [], [], [], [], []
+    with GachaSimulator(config) as sim:
+        for _ in range(RUNS):
+            sim._reset_state()
+            if engine is None:
+                _do_pull_fast_phase(sim)
+            else:
+                sim._automatic_pull_fast_phase()
+            distances = np.array(sim.jackpot_list.view(), dtype=np.int64)
+            failed.append(distances[:-1])
+            final.append(int(distances[-1]))
+            pulls.append(int(sim.total_pulls))
+            counts.append(int(sim.total_jackpot))
+            sums.append(int(distances.sum()))
+            assert sim.jarak_jackpot in (0, sim.total_jackpot_terakhir)
+    return {
+        "failed": np.concatenate(failed),
+        "final":  np.array(final),
+        "pulls":  np.array(pulls),
+        "counts": np.array(counts),
+        "sums":   np.array(sums),
+    }
+
+
+_CACHE = {}
+
+
+def samples(engine: str | None) -> dict:
+    if engine not in _CACHE:
+        _CACHE[engine] = _collect(engine)
+    return _CACHE[engine]
+
+
+# ── Uji chi-square untuk distribusi diskrit ──
+
+def chi2_pvalue(values: np.ndarray, cdf, lo: int, n_bins: int = 10) -> float:
+    """
+    Goodness of fit chi-square: bin dari quantile distribusi teoritis
+    (cdf(k) = P(X <= k) untuk integer k >= lo), bin terakhir terbuka.
+    """
+    support = np.arange(lo, max(int(values.max()), lo + 1) + 1)
+    cum = cdf(support)
+    idx = np.unique(np.searchsorted(cum, np.linspace(0, 1, n_bins + 1)[1:-1]))
+    edges = support[idx[idx < support.size - 1]]       # bin i: (edges[i-1], edges[i]]
+    probs = np.diff(np.concatenate(([0.0], cdf(edges), [1.0])))
+    observed = np.bincount(np.searchsorted(edges, values, side="left"), minlength=len(probs))
+    return stats.chisquare(observed, probs * values.size).pvalue
+
+
+def geometric_cdf(p: float):
+    return lambda k: -np.expm1(k * np.log1p(-p))
+
+
+def truncated_geometric_cdf(p: float, m: int):
+    return lambda k: np.minimum(-np.expm1(k * np.log1p(-p)) / -np.expm1(m * np.log1p(-p)), 1.0)
+
+
+Q = float(np.exp((THRESHOLD - 1) * np.log1p(-PROB)))
+
+
+# ── Uji ──
+
+@pytest.mark.parametrize("engine", [None] + ENGINE_NAMES)
+def test_stop_condition(engine):
+    s = samples(engine)
+    assert (s["final"] >= THRESHOLD).all()
+    assert (s["failed"] < THRESHOLD).all()
+    assert (s["failed"] >= 1).all()
+    assert s["failed"].size == (s["counts"] - 1).sum()
+    assert (s["sums"] == s["pulls"]).all()
+
+
+@pytest.mark.parametrize("engine", [None] + ENGINE_NAMES)
+def test_failed_distances_truncated_geometric(engine):
+    failed = samples(engine)["failed"]
+    assert chi2_pvalue(failed, truncated_geometric_cdf(PROB, THRESHOLD - 1), 1) > ALPHA
+
+
+@pytest.mark.parametrize("engine", [None] + ENGINE_NAMES)
+def test_final_distance_memoryless(engine):
+    overshoot = samples(engine)["final"] - (THRESHOLD - 1)
+    assert chi2_pvalue(overshoot, geometric_cdf(PROB), 1) > ALPHA
+
+
+@pytest.mark.parametrize("engine", [None] + ENGINE_NAMES)
+def test_jackpots_per_phase_geometric(engine):
+    assert chi2_pvalue(samples(engine)["counts"], geometric_cdf(Q), 1) > ALPHA
+
+
+@pytest.mark.parametrize("engine", [None] + ENGINE_NAMES)
+def test_mean_pulls_matches_analytics(engine):
+    pulls = samples(engine)["pulls"]
+    moments = fast_phase_moments(PROB, TARGET)
+    z = (pulls.mean() - moments["mean"]) / (moments["std"] / np.sqrt(pulls.size))
+    assert abs(z) < NormalDist().inv_cdf(1 - ALPHA / 2)
+
+
+@pytest.mark.parametrize("engine", ENGINE_NAMES)
+def test_pulls_and_p_hat_match_do_pull(engine):
+    ref, s = samples(None), samples(engine)
+    assert stats.ks_2samp(s["pulls"], ref["pulls"]).pvalue > ALPHA
+    assert stats.ks_2samp(s["counts"] / s["pulls"], ref["counts"] / ref["pulls"]).pvalue > ALPHA
+
+
+@pytest.mark.parametrize("engine", ENGINE_NAMES)
+def test_reproducible_from_seed(engine):
+    config = dict(CONFIG, fast_engine=engine)
+    results = []
+    for _ in range(2):
+        with GachaSimulator(config) as sim:
+            sim._automatic_pull_fast_phase()
+            results.append((sim.total_pulls, sim.jackpot_list.view().tolist()))
+    assert results[0] == results[1]
+
+
+def test_batch_engine_matches_do_pull_exactly():
+    """Engine "batch" memakai stream random yang sama persis dengan _do_pull."""
+    ref, s = samples(None), samples("batch")
+    assert (ref["pulls"] == s["pulls"]).all()
+    assert (ref["failed"] == s["failed"]).all()
@@ -0,0 +1,42 @@
+# Sweep headless dengan engine fase cepat non-default.
+#
+# Setiap run sweep berjalan di worker daemon ctx.Pool; engine yang
+# memakai worker pool sendiri ("processes") tidak boleh membuat child
+# process di sana, begitu juga kalibrasi "auto" yang mengukurnya.
+
+import csv
+
+import pytest
+
+from gacha import DEFAULT_CONFIG, GachaSimulator
+from gacha.sweep import RESULT_COLUMNS, run_sweep
+
+
+# Masalah kecil: fase lambat hampir selalu berhasil di siklus pertama
+CONFIG = dict(
+    DEFAULT_CONFIG,
+    probability=0.05, min_percobaan=60, confidence_target=0.1,
+    engine_cache=None, engine_workers=2, engine_calibration_seconds=0.05,
+)
+POINTS = [{"batch_size_fast": 10}, {"batch_size_fast": 50}]
+RUNS   = 2
+
+
+@pytest.mark.parametrize("engine, candidates", [
+    ("processes", None),
+    ("threads",   None),
+    ("auto",      ["geometric", "processes"]),
+])
+def test_sweep_with_engine(tmp_path, engine, candidates):
+    out = run_sweep(
+        GachaSimulator, dict(CONFIG, fast_engine=engine, engine_candidates=candidates),
+        POINTS, RUNS, str(tmp_path / "sweep.csv"), workers=2, seed=7,
+    )
+    with open(out, newline="", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+
+    assert sorted((int(r["point_id"]), int(r["run_id"])) for r in rows) == [
+        (pid, rid) for pid in range(len(POINTS)) for rid in range(RUNS)
+    ]
+    assert set(RESULT_COLUMNS) <= set(rows[0])
+    assert all(int(r["pulls_to_target"]) > 0 for r in rows)